@@ -35,50 +35,105 @@ Last updated: 2025-11-10 15:15:00 UTC
 
 from __future__ import annotations
 
+import atexit
+import base64
+import copy
+import gzip
 import json
 import logging
+import mmap
+import operator
 import os
+import queue
 import re
+import shutil
+import signal
+import stat
 import subprocess
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime, timezone
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
-from threading import Event, Thread
-from typing import Dict, List, Optional, Tuple
-
-from selenium import webdriver
-from selenium.common.exceptions import (
-    ElementClickInterceptedException,
-    InvalidSessionIdException,
-    NoSuchElementException,
-    NoSuchWindowException,
-    StaleElementReferenceException,
-    TimeoutException,
-    WebDriverException,
-)
-from selenium.webdriver import ActionChains
+from threading import Event, Lock, Thread
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import msvcrt  # Windows console: single-key reads, no Enter needed
+except ImportError:
+    msvcrt = None
+    import selectors
+
+try:
+    import orjson  # optional C JSON codec; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # optional binary cache of the profile config
+except ImportError:
+    msgpack = None
+
+try:
+    import psutil  # optional in-process process listing; falls back to spawning tasklist
+except ImportError:
+    psutil = None
+
+# Only the locator constants are needed at import time; the rest of Selenium is loaded by
+# _import_selenium() when the bot is built, and tkinter inside the GUI functions.
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-
-# GUI imports
-import tkinter as tk
-from tkinter import filedialog, messagebox
-from typing import Set
+from typing import FrozenSet, Set
+
+
+def _import_selenium():
+    """Bind the Selenium driver/wait/exception names used by the bot (first call does the import)."""
+    global webdriver, ActionChains, Keys, WebElement, EC, WebDriverWait, RemoteConnection
+    global ElementClickInterceptedException, ElementNotInteractableException, InvalidSessionIdException
+    global JavascriptException, NoSuchElementException, NoSuchWindowException, StaleElementReferenceException
+    global TimeoutException, WebDriverException, CLICK_FALLBACK_ERRORS
+    from selenium import webdriver
+    from selenium.common.exceptions import (
+        ElementClickInterceptedException,
+        ElementNotInteractableException,
+        InvalidSessionIdException,
+        JavascriptException,
+        NoSuchElementException,
+        NoSuchWindowException,
+        StaleElementReferenceException,
+        TimeoutException,
+        WebDriverException,
+    )
+    from selenium.webdriver import ActionChains
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.remote.remote_connection import RemoteConnection
+    from selenium.webdriver.remote.webelement import WebElement
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # Native-click failures a JS click can recover from; anything else (dead session etc.) propagates
+    CLICK_FALLBACK_ERRORS = (
+        ElementClickInterceptedException, ElementNotInteractableException, StaleElementReferenceException
+    )
 
 # -----------------------
 # Configuration
 # -----------------------
 LISTS_COMPILED_DEFAULT = r"C:\Users\elvin\Documents\HSRenewalBot\ListsCompiled.txt"
 LOG_FILE = "bot_debug_no_ssn.log"
+LOG_MAX_BYTES = 10 * 1024 * 1024  # debug log rolls over (gzipped) past this size
+LOG_BACKUP_COUNT = 5
 AUDIT_LOG_FILE = "renewal_log_no_ssn.json"
+AUDIT_FLUSH_EVERY = 10  # clients buffered between flushes of the .jsonl audit trail
 ERROR_SCREENSHOT_DIR = Path("error_screenshots")
+SCREENSHOT_JPEG_QUALITY = 60
 PROFILE_CONFIG_FILE = Path("bot_profiles.json")
-ALL_CARRIERS = {"oscar", "molina", "aetna", "cigna", "healthfirst", "avmed", "blue"}
+ALL_CARRIERS = frozenset(("oscar", "molina", "aetna", "cigna", "healthfirst", "avmed", "blue"))
 CHROME_DEBUGGER_ADDRESS = "localhost:9222"
 CLIENT_LIST_URL = (
     "https://www.healthsherpa.com/agents/carlos-dominguez-k3xwew/clients"
@@ -97,42 +152,424 @@ CLIENT_LIST_URL = (
     "&desc[]=created_at"
     
 )
+# Third-party/media requests the automation never needs (blocked via CDP to speed page loads)
+BLOCKED_URL_PATTERNS = [
+    "*.doubleclick.net/*",
+    "*google-analytics*",
+    "*/fonts/*",
+    "*.mp4",
+    "*.webm",
+    "*.woff2",
+]
 DEFAULT_WAIT = 8
 NEW_TAB_WAIT = 8
 SHORT_WAIT = 0.4
+FAST_TIMEOUT = 2  # optional elements that are often absent (Skip, Copy)
+NORMAL_TIMEOUT = 10  # required elements (eligibility results, Review plan)
+FAST_POLL = 0.2  # poll interval for FAST_TIMEOUT lookups
 
-APPROVED_CARRIERS = {"oscar", "molina", "aetna", "cigna", "healthfirst", "avmed", "blue"}
+APPROVED_CARRIERS = ALL_CARRIERS  # default when no profile selection is passed in
 
 # NEW FEATURE: Toggle for tab closing behavior
 # When True: Closes tab after each client (default behavior)
 # When False: Keeps tab open, navigates back, processes next client in same tab
 CLOSE_TABS_AFTER_CLIENT = True  # Set to False to keep tabs open
 
+# Continue button shared by every page of the renewal wizard
+NEXT_BUTTON_LOCATOR = (By.ID, "page-nav-on-next-btn")
+NEXT_BUTTON_CSS = "#page-nav-on-next-btn"
+# Name cell of the first client-table row
+FIRST_ROW_NAME_LOCATOR = (By.XPATH, "//tbody/tr[1]/td[2]")
+
+# Dollar amount in premium text ("$1,234.56" -> "1,234.56"); page amounts are ASCII digits
+PREMIUM_RE = re.compile(r'\$?([\d,]+\.?\d*)', re.ASCII)
+
+
+def compile_carrier_matcher(carriers: Iterable[str]) -> re.Pattern:
+    """Build one alternation matching any of the given (lower-case) carrier names."""
+    return re.compile("|".join(map(re.escape, sorted(carriers, key=len, reverse=True))) or r"(?!)")
+
+# -----------------------
+# Console banners (built once)
+# -----------------------
+BANNER_RULE = "=" * 60
+STARTUP_BANNER = f"\n{BANNER_RULE}\n🚀 HEALTH INSURANCE RENEWAL BOT v4.0 PROFILE EDITION\n{BANNER_RULE}\n"
+CONTROLS_HELP = "\n".join([
+    "",
+    BANNER_RULE,
+    "Ã°Å¸Å½Â® CONTROLS",
+    BANNER_RULE,
+    "  [P] Pause",
+    "  [R] Resume",
+    "  [S] Emergency Stop",
+    "  [N] Skip to Next Client",
+    BANNER_RULE + "\n",
+])
+# Filled in with the profile name and client list path once the bot is constructed
+RUNNING_BANNER = (
+    f"\n{BANNER_RULE}\n🎯 RUNNING AS: {{profile}}\n{BANNER_RULE}\n"
+    f"📋 Client list: {{lists_path}}\n📝 Log: {LOG_FILE}\n🔌 Chrome: {CHROME_DEBUGGER_ADDRESS}\n{BANNER_RULE}\n"
+)
+# Filled in with wherever the audit JSON ended up (the .json.gz archive once it has been rotated)
+SHUTDOWN_BANNER = (
+    f"\n{BANNER_RULE}\n✅ BOT SHUTDOWN COMPLETE\n{BANNER_RULE}\n"
+    f"Logs: {LOG_FILE}\nAudit: {{audit_path}}\nConfig: {PROFILE_CONFIG_FILE}\n{BANNER_RULE}\n"
+)
+
+# -----------------------
+# JS snippets
+# -----------------------
+# Returns 'hidden' (no layout box), 'visible' (fully inside viewport) or 'offscreen'
+VIEWPORT_STATE_JS = """
+const r = arguments[0].getBoundingClientRect();
+if (!r.width && !r.height) return 'hidden';
+return (r.top >= 0 && r.left >= 0 && r.bottom <= window.innerHeight && r.right <= window.innerWidth)
+    ? 'visible' : 'offscreen';
+"""
+
+# Fill a (React-controlled) text input: arguments[0]=input, arguments[1]=text; returns final value
+SIGNATURE_JS = """
+const input = arguments[0];
+input.scrollIntoView({block: 'center'});
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+setter.call(input, arguments[1]);
+input.dispatchEvent(new Event('input', {bubbles: true}));
+input.dispatchEvent(new Event('change', {bubbles: true}));
+return input.value;
+"""
+
+# Async: centre arguments[0], then call back once scrolling has settled - on 'scrollend',
+# two animation frames (instant scroll / nothing to scroll), or a 150 ms cap, whichever is first
+SCROLL_SETTLE_JS = """
+const el = arguments[0], done = arguments[arguments.length - 1];
+let fired = false;
+const finish = () => { if (!fired) { fired = true; done(); } };
+window.addEventListener('scrollend', finish, {once: true, capture: true});
+el.scrollIntoView({behavior: 'instant', block: 'center'});
+requestAnimationFrame(() => requestAnimationFrame(finish));
+setTimeout(finish, 150);
+"""
+
+# First candidate locator that matches: arguments[0] = [[by, selector], ...] using Selenium's
+# By strings, arguments[1] = also require visible + enabled, arguments[2] = only accept <input>
+# elements (skips wrappers sharing the id). Returns [index, element] or null.
+FIND_FIRST_JS = """
+const [candidates, clickable, inputOnly] = arguments;
+for (let i = 0; i < candidates.length; i++) {
+    const [by, sel] = candidates[i];
+    let el = null;
+    if (by === 'xpath') {
+        el = document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else if (by === 'id') {
+        el = document.getElementById(sel);
+    } else if (by === 'name') {
+        el = document.getElementsByName(sel)[0] || null;
+    } else {
+        el = document.querySelector(sel);
+    }
+    if (el && inputOnly && el.tagName !== 'INPUT') el = null;
+    if (el && (!clickable || (el.getClientRects().length && !el.disabled))) return [i, el];
+}
+return null;
+"""
+
+# Centre a checkbox/radio <input> and tick it if needed; returns its checked state (null if not an input)
+ENSURE_CHECKED_JS = """
+const el = arguments[0];
+el.scrollIntoView({block: 'center'});
+if (el.tagName !== 'INPUT') return null;
+if (!el.checked) el.click();
+return el.checked;
+"""
+
+# Async: call back once the DOM has gone arguments[0] ms without mutations after changing at
+# least once, or after arguments[1] ms regardless. A full navigation aborts the script instead.
+DOM_SETTLE_JS = """
+const [quietMs, capMs] = arguments, done = arguments[arguments.length - 1];
+let quietTimer = null, fired = false;
+const finish = () => {
+    if (fired) return;
+    fired = true;
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    done();
+};
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(finish, quietMs);
+});
+observer.observe(document.body || document.documentElement, {childList: true, subtree: true});
+setTimeout(finish, capMs);
+"""
+
+# Already-consented page: tick consentSep and pick 'Store consent outside' (radio input, or the
+# button variant - clicked once per page) in one pass; returns {cb2, radio} success flags
+CONSENT_APPLY_JS = """
+const first = xp => document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const cb = document.querySelector("input[name='consentSep']")
+    || first("//label[contains(., 'I understand that I')]//input[@type='checkbox']");
+if (cb && !cb.checked) cb.click();
+let radioOk = false;
+const radio = first("//label[contains(., 'Store consent outside of HealthSherpa')]//input[@type='radio']")
+    || document.querySelector("input[type='radio'][value*='outside']");
+if (radio) {
+    if (!radio.checked) radio.click();
+    radioOk = radio.checked;
+} else {
+    const btn = document.querySelector("button[aria-label='Store consent outside of HealthSherpa']");
+    if (btn) {
+        if (!btn.dataset.botClicked) { btn.dataset.botClicked = '1'; btn.click(); }
+        radioOk = true;
+    }
+}
+return {cb2: !!(cb && cb.checked), radio: radioOk};
+"""
+
+# Page-transition predicates for _wait_cdp (evaluated in-page via CDP Runtime.evaluate)
+CONSENT_STORED_DONE_EXPR = "!!document.querySelector('[name=ssn]') || /review|primary|tell-us/i.test(location.href)"
+CONSENT_DONE_EXPR = (
+    "!!document.querySelector('#page-nav-on-next-btn, [name=ssn], input[placeholder*=SSN]')"
+    " || /review|signature/i.test(location.href)"
+)
+SIGNATURE_DONE_EXPR = (
+    "!/signature/i.test(location.href) || !!document.evaluate("
+    "\"//*[contains(text(), 'eligibility') or contains(text(), 'Eligibility')]\", document, null,"
+    " XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+)
+
+# Select an ARIA radio button (XPath in arguments[0]) in one call; null if absent,
+# otherwise {was, now}: its aria-checked state before and after the click
+ARIA_RADIO_SELECT_JS = """
+const btn = document.evaluate(arguments[0], document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!btn) return null;
+const was = btn.getAttribute('aria-checked') === 'true';
+if (!was) btn.click();
+return {was: was, now: btn.getAttribute('aria-checked') === 'true'};
+"""
+
+# True while arguments[0] is still attached, rendered and enabled (raises stale if it was replaced)
+ELEMENT_READY_JS = "const e = arguments[0]; return e.isConnected && e.getClientRects().length > 0 && !e.disabled;"
+
+# Signature page probe: {section: heading/label/copy button present, input: the signature <input> or null}
+SIGNATURE_FIELDS_JS = """
+const x = (p) => document.evaluate(p, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+return {
+    section: !!x("//h2[contains(text(), 'Signature')] | //label[contains(text(), 'signature')] | //button[contains(@aria-label, 'copy')]"),
+    input: x("//input[@type='text' and contains(@id, 'signature')]"),
+};
+"""
+
+# Plan page snapshot for extract_plan_info(): raw carrier texts, candidate premium texts per
+# strategy (struck-through prices flagged or dropped), a free/$0 hint and plan-name texts.
+# Only rendered nodes are read, as Selenium's .text is "" for hidden ones; logo alt text is
+# read regardless, like get_attribute("alt")
+PLAN_INFO_JS = """
+const nodes = (xpath, root) => {
+    const r = document.evaluate(xpath, root || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: r.snapshotLength}, (_, i) => r.snapshotItem(i));
+};
+const shown = (el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+const all = (xpath, root) => nodes(xpath, root).filter(shown);
+const text = (el) => (el.innerText || '').trim();
+const struck = (el) => !!el && /strike/i.test(el.getAttribute('class') || '');
+const parentDiv = (el) => el.parentElement && el.parentElement.closest('div');
+const direct = all("//div[contains(@class, '_mt6_wndsr')]//var[@data-var='dollars']")[0];
+const summary = all("//div[contains(., 'Plan summary')]")[0];
+const body = (document.body ? document.body.innerText : '').toLowerCase();
+return {
+    carriers: nodes("//h2[contains(@class, 'carrier')] | //div[contains(@class, 'carrier-name')] | "
+        + "//img[contains(@alt, 'logo')] | //img[@class='issuer-logo']")
+        .filter(e => e.tagName === 'IMG' || shown(e))
+        .map(e => e.tagName === 'IMG' ? (e.getAttribute('alt') || '') : text(e)),
+    direct: direct ? text(direct) : null,
+    labelled: all("//div[contains(text(), 'Premium')]/following-sibling::*//var[@data-var='dollars'] | "
+        + "//span[contains(text(), 'Premium')]/ancestor::div[1]//var[@data-var='dollars']")
+        .map(e => ({text: text(e), strike: struck(parentDiv(e))})),
+    perMonth: all("//*[contains(text(), '/ mo') or contains(text(), '/mo')]")
+        .map(e => { const p = parentDiv(e); return p ? {text: p.innerText, strike: struck(e) || struck(p)} : null; })
+        .filter(Boolean),
+    summary: summary ? all(".//var[@data-var='dollars']", summary)
+        .filter(v => !v.closest("div[class*='strike']")).map(text) : [],
+    free: body.includes('free') || body.includes('$0'),
+    planNames: all("//h3 | //h4 | //div[contains(@class, 'plan-name')]").map(text),
+};
+"""
+
+# Click the first known plan dialog button showing (replace confirmation, cart dialog Continue,
+# Silver upsell 'No thanks'); returns [kind, button] or null when none is open
+DISMISS_DIALOGS_JS = """
+const first = (xpath) => document.evaluate(xpath, document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const candidates = [
+    ['replace', "//button[normalize-space()='Yes, replace with this plan']"],
+    ['cart', "//div[contains(@class, 'MuiDialog')][contains(., 'Cart') or contains(., 'cart')]//button[contains(., 'Continue')]"],
+    ['silver', "//button[normalize-space()='No thanks, continue with this plan'] | //button[contains(text(), 'No thanks')]"],
+];
+for (const [kind, xpath] of candidates) {
+    const btn = first(xpath);
+    if (btn && btn.getClientRects().length && !btn.disabled) {
+        btn.scrollIntoView({block: 'center'});
+        btn.click();
+        return [kind, btn];
+    }
+}
+return null;
+"""
+
+# Hide client-table row arguments[0] (1-based, as in //tbody/tr[n]); returns False if there is no such row
+HIDE_ROW_JS = """
+const row = document.querySelectorAll('tbody > tr')[arguments[0] - 1];
+if (!row) return false;
+row.style.display = 'none';
+return true;
+"""
+
+# null while loading; otherwise 'crashed' if body text has any of arguments[0], else 'ok'
+PAGE_HEALTH_JS = """
+if (document.readyState !== 'complete') return null;
+const text = (document.body ? document.body.innerText : '').toLowerCase();
+return arguments[0].some(m => text.includes(m)) ? 'crashed' : 'ok';
+"""
+
+# Congratulations detector: a MutationObserver marks the page dirty, and the body text is
+# only re-scanned on polls after a mutation. arguments[0]=true resets the flag for a new client.
+CONGRATS_WATCH_JS = """
+const w = window;
+if (!w.__congratsWatch) {
+    w.__congratsWatch = {dirty: true, seen: false};
+    new MutationObserver(() => { w.__congratsWatch.dirty = true; })
+        .observe(document.body, {childList: true, subtree: true, characterData: true});
+}
+const s = w.__congratsWatch;
+if (arguments[0]) { s.seen = false; s.dirty = true; }
+if (!s.seen && s.dirty) {
+    s.dirty = false;
+    s.seen = /Congratulations|Success|enrolled/.test(document.body.innerText);
+}
+return s.seen;
+"""
+
+# True once the document is complete and the navigation's load event has finished
+PAGE_LOADED_JS = """
+if (document.readyState !== 'complete') return false;
+const nav = performance.getEntriesByType('navigation')[0];
+return !nav || nav.loadEventEnd > 0;
+"""
+
+# "<url>|<innerText length>" - changes once a wizard step has rendered the next page
+PAGE_SIGNATURE_JS = "return location.href + '|' + (document.body ? document.body.innerText.length : 0);"
+
+# Scroll an element to the viewport centre and click it in the same round-trip
+SCROLL_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# 'ADD' / 'VIEW' for the first "Add to cart" / "View in cart" button on the page, else null
+CART_MODE_JS = """
+for (const b of document.querySelectorAll('button')) {
+    if (b.textContent.includes('Add to cart')) return 'ADD';
+    if (b.textContent.includes('View in cart')) return 'VIEW';
+}
+return null;
+"""
+
+# Click the element matching CSS selector arguments[0] if it is rendered and enabled; returns it, else null
+CLICK_IF_READY_JS = """
+const el = document.querySelector(arguments[0]);
+if (!el || el.disabled || !el.getClientRects().length) return null;
+el.scrollIntoView({block: 'center'});
+el.click();
+return el;
+"""
+
+# [total issuer checkboxes, label text of the first 10] in one round-trip
+AVAILABLE_CARRIERS_JS = """
+const boxes = Array.from(document.querySelectorAll("input[type=checkbox][name*='issuer']"));
+return [boxes.length, boxes.slice(0, 10).map(cb => (cb.closest('label')?.innerText || '').trim())];
+"""
+
+# Sex field state on the SSN page: 'no_label' / 'no_btn', else whether Female is aria-checked
+GENDER_STATE_JS = """
+const first = xp => document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!first("//label[contains(., 'Sex') and contains(@id, 'gender')]")) return 'no_label';
+const btn = first("//button[@role='radio' and contains(text(), 'Female')]");
+if (!btn) return 'no_btn';
+return btn.getAttribute('aria-checked') === 'true';
+"""
+
+# [row number, name-cell (2nd column) text] of the first 10 rendered client rows; null until the
+# table has rendered. Hidden rows (HIDE_ROW_JS) are skipped but keep their row numbers, matching
+# //tbody/tr[n]; if every row is hidden a single blank entry marks the end of the list
+CLIENT_ROWS_JS = """
+const all = Array.from(document.querySelectorAll('tbody > tr'));
+if (!all.length || !all[0].children[1]) return null;
+const rows = all.map((r, i) => [i + 1, r]).filter(([, r]) => r.getClientRects().length).slice(0, 10);
+if (!rows.length) return [[0, '']];
+return rows.map(([i, r]) => [i, r.children[1] ? r.children[1].innerText.trim() : '']);
+"""
+
 ERROR_SCREENSHOT_DIR.mkdir(exist_ok=True)
 
+# Shared workers for fire-and-forget disk/process work off the automation thread
+# (interpreter exit waits for queued jobs, so screenshots still land on disk)
+IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bot-io")
+
+# -----------------------
+# JSON encoding (orjson when installed)
+# -----------------------
+def json_line(obj) -> bytes:
+    """Compact, newline-terminated UTF-8 JSON record for the .jsonl audit trail."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def json_pretty(obj) -> bytes:
+    """Human-readable (2-space indented) UTF-8 JSON document."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
 # -----------------------
 # Data classes
 # -----------------------
 # First, add the missing status to the ClientStatus class (around line 90)
-class ClientStatus:
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    SKIPPED_NO_SSN = "skipped_no_ssn"  # ADD THIS LINE
-    SKIPPED_FAMILY_POLICY = "skipped_family_policy"
-    SKIPPED_FOLLOWUPS = "skipped_followups"
-    SKIPPED_BY_USER = "skipped_by_user"
-    ERROR = "error"
+class ClientStatus(IntEnum):
+    PENDING = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+    SKIPPED_NO_SSN = 3  # ADD THIS LINE
+    SKIPPED_FAMILY_POLICY = 4
+    SKIPPED_FOLLOWUPS = 5
+    SKIPPED_BY_USER = 6
+    ERROR = 7
 
 
-@dataclass
+# Status as written to the audit logs ("completed", "skipped_by_user", ...)
+_STATUS_NAMES = {status: status.name.lower() for status in ClientStatus}
+
+
+class ClientStepFailed(Exception):
+    """Raised by _client_step_guard once a client step has failed and been cleaned up."""
+
+
+# Audit-entry keys and the ClientData attributes they come from (same order)
+_CLIENT_DICT_KEYS = ("full_name", "status", "error", "carrier", "plan", "premium", "start", "end")
+_CLIENT_DICT_VALUES = operator.attrgetter(
+    "full_name", "status", "error_message", "carrier", "plan_name", "premium", "timestamp_start", "timestamp_end"
+)
+
+
+@dataclass(slots=True)
 class ClientData:
     first_name: str
     last_name: str
     full_name: str
     row_index: int
     is_female: Optional[bool] = None
-    status: str = ClientStatus.PENDING
+    status: ClientStatus = ClientStatus.PENDING
     error_message: Optional[str] = None
     carrier: Optional[str] = None
     plan_name: Optional[str] = None
@@ -141,16 +578,15 @@ class ClientData:
     timestamp_end: Optional[str] = None
 
     def to_dict(self) -> Dict:
-        return {
-            "full_name": self.full_name,
-            "status": self.status,
-            "error": self.error_message,
-            "carrier": self.carrier,
-            "plan": self.plan_name,
-            "premium": self.premium,
-            "start": self.timestamp_start,
-            "end": self.timestamp_end,
-        }
+        entry = dict(zip(_CLIENT_DICT_KEYS, _CLIENT_DICT_VALUES(self)))
+        entry["status"] = _STATUS_NAMES[self.status]
+        return entry
+
+
+class ControlAction:
+    CONTINUE = "continue"
+    STOP = "stop"
+    SKIP = "skip"
 
 
 @dataclass
@@ -158,10 +594,12 @@ class AutomationState:
     pause_event: Event = field(default_factory=lambda: Event())
     stop_event: Event = field(default_factory=Event)
     skip_event: Event = field(default_factory=Event)  # NEW
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)  # monotonic: immune to clock adjustments
     clients_processed: int = 0
     total_clients: int = 0
     close_tabs: bool = field(default=True)  # NEW: Tab closing toggle
+    _eta_for: int = field(default=-1, repr=False)  # clients_processed the cached ETA was computed at
+    _eta_cache: str = field(default="", repr=False)
 
     def __post_init__(self):
         self.pause_event.set()
@@ -194,76 +632,167 @@ class AutomationState:
         return False
 
     def wait_if_paused(self):
-        self.pause_event.wait()
+        """Block while paused; returns early (within 250ms) if a stop is requested meanwhile."""
+        while not self.pause_event.wait(0.25):
+            if self.stop_event.is_set():
+                return
+
+    def control_check(self) -> str:
+        """Block while paused, then report STOP / SKIP (consumed) / CONTINUE in one call."""
+        self.wait_if_paused()
+        if self.stop_event.is_set():
+            return ControlAction.STOP
+        if self.skip_event.is_set():
+            self.skip_event.clear()  # Reset for next client
+            return ControlAction.SKIP
+        return ControlAction.CONTINUE
 
     def estimated_time_remaining(self) -> str:
+        """ETA string; recomputed only when clients_processed has changed since the last call."""
+        if self.clients_processed == self._eta_for:
+            return self._eta_cache
         if self.clients_processed == 0:
-            return "Calculating..."
-        elapsed = time.time() - self.start_time
-        avg = elapsed / self.clients_processed
-        remaining = (self.total_clients - self.clients_processed) * avg
-        mins, secs = divmod(int(remaining), 60)
-        return f"{mins}m {secs}s"
+            eta = "Calculating..."
+        else:
+            elapsed = time.monotonic() - self.start_time
+            avg = elapsed / self.clients_processed
+            remaining = (self.total_clients - self.clients_processed) * avg
+            mins, secs = divmod(int(remaining), 60)
+            eta = f"{mins}m {secs}s"
+        self._eta_for, self._eta_cache = self.clients_processed, eta
+        return eta
 
 
 # ========================================
 # PROFILE MANAGEMENT SYSTEM
 # ========================================
 
+# Used when bot_profiles.json doesn't exist yet; handed out as a deep copy
+DEFAULT_PROFILE_CONFIG = {
+    "last_profile": "Swole",
+    "profiles": {
+        "Swole": {
+            "carriers": sorted(ALL_CARRIERS),
+            "last_file_path": LISTS_COMPILED_DEFAULT
+        },
+        "El Capii": {
+            "carriers": sorted(ALL_CARRIERS),
+            "last_file_path": LISTS_COMPILED_DEFAULT
+        }
+    }
+}
+
+# Parsed profile configs by path -> (mtime, config); later ProfileManager()s skip the disk read
+_CONFIG_CACHE: Dict[Path, Tuple[float, Dict]] = {}
+
+
 class ProfileManager:
     """Manages profile-based carrier preferences with file path persistence."""
     
     def __init__(self, config_file: Path = PROFILE_CONFIG_FILE):
         self.config_file = config_file
+        self.cache_file = config_file.with_suffix(".mpk")  # msgpack copy, used only if msgpack is installed
         self.config = self._load_config()
+        self._dirty = False  # setters only mark; flush() writes once per GUI step
+        self._carrier_cache: Dict[str, FrozenSet[str]] = {}  # profile -> carriers, dropped by set_carriers
+        atexit.register(self.flush)
     
     def _load_config(self) -> Dict:
         """Load profile config from JSON file."""
-        if self.config_file.exists():
+        try:
+            mtime = self.config_file.stat().st_mtime  # the one stat of the JSON file; doubles as exists()
+        except OSError:
+            mtime = None
+        if mtime is not None:
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                hit = _CONFIG_CACHE.get(self.config_file)
+                if hit is not None and hit[0] == mtime:
+                    return copy.deepcopy(hit[1])
+                config = self._load_cache(mtime)
+                if config is None:
+                    config = json_loads(self.config_file.read_bytes())
+                    self._write_cache(config)
+                _CONFIG_CACHE[self.config_file] = (mtime, copy.deepcopy(config))
+                return config
             except Exception as e:
-                logging.warning(f"Could not load profiles: {e}")
+                logging.warning("Could not load profiles: %s", e)
         
         # Default config if file doesn't exist
-        return {
-            "last_profile": "Swole",
-            "profiles": {
-                "Swole": {
-                    "carriers": list(ALL_CARRIERS),
-                    "last_file_path": LISTS_COMPILED_DEFAULT
-                },
-                "El Capii": {
-                    "carriers": list(ALL_CARRIERS),
-                    "last_file_path": LISTS_COMPILED_DEFAULT
-                }
-            }
-        }
+        return copy.deepcopy(DEFAULT_PROFILE_CONFIG)
     
     def save_config(self):
         """Save profile config to JSON file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-            logging.info(f"💾 Saved profile config to {self.config_file}")
+            # Compact JSON to a sibling temp file, then rename over the real one: a crash
+            # mid-write can never leave a truncated config behind.
+            tmp = self.config_file.with_name(self.config_file.name + ".tmp")
+            # Serialised up front and written unbuffered: a single write() syscall, nothing to flush
+            with open(tmp, 'wb', buffering=0) as f:
+                f.write(json_line(self.config))
+                mtime = os.fstat(f.fileno()).st_mtime
+            os.replace(tmp, self.config_file)
+            _CONFIG_CACHE[self.config_file] = (mtime, copy.deepcopy(self.config))
+            self._write_cache(self.config)
+            logging.info("💾 Saved profile config to %s", self.config_file)
         except Exception as e:
-            logging.error(f"Failed to save profile config: {e}")
+            logging.error("Failed to save profile config: %s", e)
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def flush(self):
+        """Save the config if any setter changed it since the last write."""
+        if self._dirty:
+            self._dirty = False
+            self.save_config()
+
+    def _load_cache(self, config_mtime: float) -> Optional[Dict]:
+        """Config from the msgpack cache if it is at least as new as the JSON file, else None."""
+        if msgpack is None:
+            return None
+        try:
+            if self.cache_file.stat().st_mtime < config_mtime:
+                return None
+            with open(self.cache_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return msgpack.unpackb(mm)
+        except Exception as e:
+            logging.debug("Profile cache unusable, reading JSON: %s", e)
+            return None
+
+    def _write_cache(self, config: Dict):
+        """Refresh the msgpack cache next to the JSON file (write-then-rename)."""
+        if msgpack is None:
+            return
+        try:
+            tmp = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            tmp.write_bytes(msgpack.packb(config))
+            os.replace(tmp, self.cache_file)
+        except Exception as e:
+            logging.debug("Could not write profile cache: %s", e)
     
     def get_last_profile(self) -> str:
         return self.config.get("last_profile", "Swole")
     
     def set_last_profile(self, profile_name: str):
-        self.config["last_profile"] = profile_name
+        if self.config.get("last_profile") != profile_name:
+            self.config["last_profile"] = profile_name
+            self.mark_dirty()
     
-    def get_carriers(self, profile_name: str) -> Set[str]:
-        carriers = self.config["profiles"].get(profile_name, {}).get("carriers", list(ALL_CARRIERS))
-        return set(carriers)
+    def get_carriers(self, profile_name: str) -> FrozenSet[str]:
+        cached = self._carrier_cache.get(profile_name)
+        if cached is None:
+            carriers = self.config["profiles"].get(profile_name, {}).get("carriers", ALL_CARRIERS)
+            cached = self._carrier_cache[profile_name] = frozenset(carriers)
+        return cached
     
     def set_carriers(self, profile_name: str, carriers: Set[str]):
         if profile_name not in self.config["profiles"]:
             self.config["profiles"][profile_name] = {}
-        self.config["profiles"][profile_name]["carriers"] = list(carriers)
+        carriers = sorted(carriers)
+        if self.config["profiles"][profile_name].get("carriers") != carriers:
+            self.config["profiles"][profile_name]["carriers"] = carriers
+            self._carrier_cache.pop(profile_name, None)
+            self.mark_dirty()
     
     def get_last_file_path(self, profile_name: str) -> Optional[str]:
         return self.config["profiles"].get(profile_name, {}).get("last_file_path")
@@ -271,7 +800,9 @@ class ProfileManager:
     def set_file_path(self, profile_name: str, file_path: str):
         if profile_name not in self.config["profiles"]:
             self.config["profiles"][profile_name] = {}
-        self.config["profiles"][profile_name]["last_file_path"] = file_path
+        if self.config["profiles"][profile_name].get("last_file_path") != file_path:
+            self.config["profiles"][profile_name]["last_file_path"] = file_path
+            self.mark_dirty()
 
 
 def find_file_in_folder(folder_path: str, filename: str = "ListsCompiled.txt") -> Optional[str]:
@@ -286,44 +817,58 @@ def find_file_in_folder(folder_path: str, filename: str = "ListsCompiled.txt") -
         if target_file.exists():
             return str(target_file.absolute())
         
-        # Try case-insensitive
-        for file in folder.iterdir():
-            if file.is_file() and file.name.lower() == filename.lower():
-                return str(file.absolute())
+        # Try case-insensitive; DirEntry.is_file() reuses the dirent type, so no stat per entry
+        target_lower = filename.lower()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.lower() == target_lower and entry.is_file():
+                    return str(Path(entry.path).absolute())
         
         return None
     except Exception:
         return None
 
 
+@lru_cache(maxsize=64)
+def _validate_list_file(path_str: str, mtime_ns: int, size: int) -> Tuple[bool, str, str]:
+    """Validation for an existing regular file; memoised per (path, mtime, size) so unchanged files skip the probe."""
+    if Path(path_str).suffix.lower() != ".txt":
+        return False, "⚠️ Not a .txt file", "#f59e0b"
+    
+    if size == 0:
+        return False, "❌ File is empty (0 bytes)", "#ef4444"
+    
+    if size < 100:
+        return True, f"⚠️ File found ({size} bytes - small)", "#f59e0b"
+    
+    # Raw one-byte read proves readability without building a text/buffered reader.
+    # Errors propagate (and so are never cached).
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        os.read(fd, 1)
+    finally:
+        os.close(fd)
+    
+    return True, f"✅ File found ({size:,} bytes)", "#10b981"
+
+
 def validate_file_path(file_path: str) -> Tuple[bool, str, str]:
     """Validate a file path. Returns: (is_valid, status_message, status_color)"""
     if not file_path or file_path.strip() == "":
         return False, "⚠️ No file selected", "#f59e0b"
     
-    path = Path(file_path.strip())
+    path_str = file_path.strip()
     
-    if not path.exists():
+    try:
+        st = os.stat(path_str)
+    except (OSError, ValueError):
         return False, "❌ File not found", "#ef4444"
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, "❌ Path is not a file", "#ef4444"
     
-    if path.suffix.lower() != ".txt":
-        return False, "⚠️ Not a .txt file", "#f59e0b"
-    
     try:
-        size = path.stat().st_size
-        if size == 0:
-            return False, "❌ File is empty (0 bytes)", "#ef4444"
-        
-        if size < 100:
-            return True, f"⚠️ File found ({size} bytes - small)", "#f59e0b"
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            f.read(1)
-        
-        return True, f"✅ File found ({size:,} bytes)", "#10b981"
+        return _validate_list_file(path_str, st.st_mtime_ns, st.st_size)
     except PermissionError:
         return False, "❌ Access denied", "#ef4444"
     except Exception as e:
@@ -332,6 +877,8 @@ def validate_file_path(file_path: str) -> Tuple[bool, str, str]:
 
 def show_profile_selection_gui(profile_manager: ProfileManager) -> Tuple[str, Set[str]]:
     """Show GUI for profile + carrier selection."""
+    import tkinter as tk
+    from tkinter import messagebox
     
     selected_profile = [None]
     selected_carriers = [None]
@@ -404,10 +951,7 @@ def show_profile_selection_gui(profile_manager: ProfileManager) -> Tuple[str, Se
     carriers_saved = [False]
     
     def on_carriers_confirmed():
-        selected = set()
-        for carrier, var in carrier_vars.items():
-            if var.get():
-                selected.add(carrier)
+        selected = set(selected_set)
         
         if not selected:
             messagebox.showwarning("Warning", "Select at least one carrier!")
@@ -456,18 +1000,19 @@ def show_profile_selection_gui(profile_manager: ProfileManager) -> Tuple[str, Se
         "blue": "Blue Cross Blue Shield"
     }
     
-    carrier_vars = {}
-    for carrier in ["oscar", "molina", "aetna", "cigna", "healthfirst", "avmed", "blue"]:
-        var = tk.BooleanVar(value=(carrier in saved_carriers))
-        carrier_vars[carrier] = var
-        
-        tk.Checkbutton(
+    # Ticks are mirrored into a plain set as they happen, so submit never reads Tk variables back
+    selected_set = {carrier for carrier in carrier_display if carrier in saved_carriers}
+    for carrier, label in carrier_display.items():
+        cb = tk.Checkbutton(
             carrier_frame,
-            text=carrier_display[carrier],
-            variable=var,
+            text=label,
+            command=lambda c=carrier: selected_set.symmetric_difference_update((c,)),
             font=("Arial", 11),
             anchor=tk.W
-        ).pack(fill=tk.X, pady=5)
+        )
+        if carrier in selected_set:
+            cb.select()
+        cb.pack(fill=tk.X, pady=5)
     
     tk.Button(
         carrier_root,
@@ -488,16 +1033,18 @@ def show_profile_selection_gui(profile_manager: ProfileManager) -> Tuple[str, Se
     
     profile_manager.set_last_profile(profile_name)
     profile_manager.set_carriers(profile_name, selected_carriers[0])
-    profile_manager.save_config()
+    profile_manager.flush()
     
-    logging.info(f"👤 Profile: {profile_name}")
-    logging.info(f"🏥 Carriers: {', '.join(sorted(selected_carriers[0]))}")
+    logging.info("👤 Profile: %s", profile_name)
+    logging.info("🏥 Carriers: %s", ', '.join(sorted(selected_carriers[0])))
     
     return profile_name, selected_carriers[0]
 
 
 def show_file_selection_gui(profile_manager: ProfileManager, profile_name: str) -> str:
     """Show GUI for file selection and ensure free variable scope issue is resolved."""
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
 
     selected_path = [None]
     last_path = profile_manager.get_last_file_path(profile_name) or LISTS_COMPILED_DEFAULT
@@ -546,10 +1093,11 @@ def show_file_selection_gui(profile_manager: ProfileManager, profile_name: str)
 
     def browse_file():
         """Browse file and update file path."""
+        current = file_path_var.get()
         filename = filedialog.askopenfilename(
             title="Select ListsCompiled.txt",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            initialdir=str(Path(file_path_var.get()).parent) if file_path_var.get() else None
+            initialdir=os.path.dirname(current.strip()) or None
         )
         if filename:
             file_path_var.set(filename)
@@ -591,10 +1139,21 @@ def show_file_selection_gui(profile_manager: ProfileManager, profile_name: str)
         command=lambda: on_continue()  # Call explicitly.
     )
 
+    pending_validation = [None]  # after() id of the queued validation, if any
+    last_validation = [None, (False, "", "")]  # (path, result) of the most recent validate_now()
+
     def update_status(*args):
+        """Debounce keystrokes/pastes: validate once typing pauses for 150 ms."""
+        if pending_validation[0] is not None:
+            root.after_cancel(pending_validation[0])
+        pending_validation[0] = root.after(150, validate_now)
+
+    def validate_now():
         """Validate file path and update button state."""
+        pending_validation[0] = None
         current_path = file_path_var.get()
         is_valid, message, color = validate_file_path(current_path)
+        last_validation[:] = [current_path, (is_valid, message, color)]
         # Update the status label with validation results.
         status_label.config(text=f"Status: {message}", fg=color)
         if is_valid:
@@ -607,14 +1166,19 @@ def show_file_selection_gui(profile_manager: ProfileManager, profile_name: str)
     def on_continue():
         """Handle the continue action."""
         current_path = file_path_var.get()
-        is_valid, message, _ = validate_file_path(current_path)
+        if last_validation[0] == current_path:
+            # The button state already reflects this exact path
+            is_valid, message, _ = last_validation[1]
+        else:
+            # Clicked inside the debounce window: validate what is in the box now
+            is_valid, message, _ = validate_file_path(current_path)
 
         if not is_valid:
             messagebox.showerror("Invalid File", f"{message}\n\n{current_path}")
             return
 
         profile_manager.set_file_path(profile_name, current_path)
-        profile_manager.save_config()
+        profile_manager.flush()
 
         selected_path[0] = current_path
         root.destroy()
@@ -627,7 +1191,7 @@ def show_file_selection_gui(profile_manager: ProfileManager, profile_name: str)
 
     # Bind update status to file path changes.
     file_path_var.trace('w', update_status)
-    update_status()
+    validate_now()
 
     # Cancel button.
     tk.Button(
@@ -658,31 +1222,145 @@ def show_file_selection_gui(profile_manager: ProfileManager, profile_name: str)
 # Bot class
 # -----------------------
 class HealthInsuranceRenewalBot:
+
+    # XPath unions: one wait (one polling loop) covers every variant of a button
+    DOWNLOAD_LETTER_XPATH = (
+        "//button[normalize-space()='Download Eligibility Letter']"
+        " | //button[contains(., 'Download Eligibility Letter')]"
+        " | //a[contains(text(), 'Download Eligibility Letter')]"
+    )
+    REVIEW_PLAN_XPATH = (
+        "//button[normalize-space()='Review plan']"
+        " | //button[contains(text(), 'Review plan')]"
+    )
+    SKIP_TO_END_XPATH = "//button[normalize-space()='Skip to the end'] | //button[contains(text(), 'Skip')]"
+    ENROLL_PLAN_XPATH = (
+        "//button[normalize-space()='Enroll in this plan']"
+        " | //button[contains(text(), 'Enroll in this plan')]"
+        " | //button[@type='submit' and @data-layer='enroll_in_application']"
+        " | //button[@type='submit' and contains(text(), 'Enroll')]"
+    )
+
+    # Consent-page locator candidates, (By, selector, log label), tried in order by _find_first
+    CONSENT_CB1_STORED_SELECTORS = (
+        (By.CSS_SELECTOR, "input[name='consentData']", "input[name='consentData']"),
+        (By.CSS_SELECTOR, "#consentData", "#consentData"),
+        (By.XPATH, "//label[contains(., 'I agree to have my information used')]//input[@type='checkbox']", "label text â†’ checkbox"),
+    )
+    CONSENT_CONTINUE_SELECTORS = (
+        (By.ID, "page-nav-on-next-btn", "id page-nav-on-next-btn"),
+        (By.XPATH, "//button[@id='page-nav-on-next-btn']", "xpath id"),
+        (By.XPATH, "//button[@type='submit' and contains(text(), 'Continue')]", "xpath submit + text"),
+        (By.XPATH, "//button[contains(text(), 'Continue')]", "xpath text only"),
+    )
+    CONSENT_CB1_SELECTORS = (
+        (By.CSS_SELECTOR, "input[name='consentData']", "input[name='consentData']"),
+        (By.CSS_SELECTOR, "#consentData", "#consentData"),
+        (By.XPATH, "//*[@id='consentData']/ancestor::label//input", "xpath ancestor input"),
+        (By.XPATH, "//label[contains(., 'I agree to have my information used')]//input[@type='checkbox']", "label text â†’ checkbox"),
+    )
+    CONSENT_CB2_SELECTORS = (
+        (By.CSS_SELECTOR, "input[name='consentSep']", "input[name='consentSep']"),
+        (By.XPATH, "//*[@id='consentSep']/ancestor::label//input", "xpath #consentSep â†’ input"),
+        (By.XPATH, "//label[contains(., 'I understand that I')]//input[@type='checkbox']", "label text â†’ checkbox"),
+        (By.CSS_SELECTOR, "#consentSep", "#consentSep span"),
+    )
+    STORE_CONSENT_BUTTON_SELECTORS = (
+        (By.CSS_SELECTOR, "button[aria-label='Store consent outside of HealthSherpa']", "aria-label button"),
+        (By.XPATH, "//button[@aria-label='Store consent outside of HealthSherpa']", "xpath aria-label"),
+        (By.XPATH, "//button[contains(., 'Store consent outside')]", "button text contains"),
+    )
+
+    # click_continue() candidates in priority order; normalize-space(.) also matches text in child <span>s
+    CONTINUE_BUTTON_SELECTORS = (
+        (By.XPATH, "//button[normalize-space(.)='Continue with plan']", "'Continue with plan'"),
+        (By.XPATH, "//button[normalize-space(.)='Enroll in this plan']", "'Enroll in this plan'"),
+        (By.XPATH, "//button[starts-with(normalize-space(.), 'Enroll')]", "generic 'Enroll'"),
+        (By.ID, "page-nav-on-next-btn", "fallback next-button (ID)"),
+        (By.XPATH, "//button[contains(normalize-space(.), 'Continue')]", "Continue via text (FAILSAFE)"),
+    )
+
+    # Eligibility/cart page candidates, (By, selector, log label), probed in one script by _find_first
+    FOLLOWUPS_CELL_SELECTORS = (
+        (By.XPATH, "//th[contains(text(), 'Followups')]/ancestor::table//tbody/tr[1]/td[3]", "followups column"),
+        (By.XPATH, "//table//td[3]", "third column"),
+        (By.CSS_SELECTOR, "table tbody tr td:nth-child(3)", "css third column"),
+        (By.XPATH, "//td[preceding-sibling::*[contains(text(), 'Followups')]]", "after followups label"),
+    )
+    REVIEW_PLAN_SELECTORS = (
+        (By.ID, "page-nav-on-next-btn", "id page-nav-on-next-btn"),
+        (By.XPATH, "//button[@id='page-nav-on-next-btn']", "xpath id"),
+        (By.XPATH, "//button[normalize-space()='Review plan']", "xpath text"),
+        (By.XPATH, "//button[contains(text(), 'Review plan')]", "xpath contains"),
+    )
+    # *_FALLBACKS match generic buttons: _find_first_staged only probes them once the specific
+    # selectors above them have had their whole timeout
+    REPLACE_PLAN_SELECTORS = (
+        (By.XPATH, "//button[normalize-space()='Yes, replace with this plan']", "xpath text"),
+    )
+    REPLACE_PLAN_FALLBACKS = (
+        (By.CSS_SELECTOR, "button._mediumRoyal_lkqwb_81", "css class"),
+        (By.XPATH, "//button[contains(text(), 'replace')]", "xpath contains"),
+    )
+    SILVER_NO_THANKS_SELECTORS = (
+        (By.XPATH, "//button[normalize-space()='No thanks, continue with this plan']", "xpath text"),
+        (By.XPATH, "//button[contains(text(), 'No thanks')]", "xpath contains"),
+    )
+    SILVER_NO_THANKS_FALLBACKS = (
+        (By.CSS_SELECTOR, "button.MuiButton-outlined", "css MUI outlined"),
+        (By.ID, "mui-376", "id mui-376"),  # Dynamic ID but worth trying
+    )
+    CART_CONTINUE_SELECTORS = (
+        (By.XPATH, "//button[normalize-space()='Continue']", "xpath text"),
+        (By.XPATH, "//div[contains(@class, 'MuiDialog')]//button[contains(text(), 'Continue')]", "xpath dialog"),
+    )
+    CART_CONTINUE_FALLBACKS = (
+        (By.CSS_SELECTOR, "button.MuiButton-containedPrimary", "css MUI"),
+    )
     
     def __init__(
         self, 
         lists_compiled_path: str = LISTS_COMPILED_DEFAULT, 
         log_file: str = AUDIT_LOG_FILE,
-        approved_carriers: Optional[Set[str]] = None
+        approved_carriers: Optional[Set[str]] = None,
+        audit_fp: Optional[BinaryIO] = None,
     ):
+        _import_selenium()
         self.lists_compiled_path = Path(lists_compiled_path)
         self.log_file = Path(log_file)
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+        self._waits: Dict[Tuple[float, float], WebDriverWait] = {}  # (timeout, poll) -> reusable waiter
         self.main_tab_handle: Optional[str] = None
         self.state = AutomationState()
         self.clients: List[ClientData] = []
         self.audit_log: List[Dict] = []
+        self._results_lock = Lock()  # guards clients/audit_log against the control thread
+        self._status_counts: Counter = Counter()  # status -> clients, kept in step with self.clients
+        self._next_btn: Optional[WebElement] = None  # last wizard Continue button found; dropped on navigation
         
-        # Store approved carriers (use provided set or default)
-        self.approved_carriers = approved_carriers if approved_carriers else APPROVED_CARRIERS
+        # Store approved carriers (use provided set or default), lower-cased once for the per-client checks
+        self.approved_carriers = frozenset(c.lower() for c in (approved_carriers or APPROVED_CARRIERS))
+        self._approved_carrier_re = compile_carrier_matcher(self.approved_carriers)  # fixed for the run
         
         self.logger = logging
         
         self._setup_logging()
-        if not self.lists_compiled_path.exists():
-            raise FileNotFoundError(f"ListsCompiled.txt not found at: {self.lists_compiled_path}")
-        logging.info(f"Ã¢Å“â€¦ Initialized with file: {self.lists_compiled_path} ({self.lists_compiled_path.stat().st_size:,} bytes)")
+        try:
+            lists_stat = self.lists_compiled_path.stat()  # one stat for both the existence check and the size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"ListsCompiled.txt not found at: {self.lists_compiled_path}") from None
+        logging.info(
+            "Ã¢Å“â€¦ Initialized with file: %s (%s bytes)",
+            self.lists_compiled_path, format(lists_stat.st_size, ","),
+        )
+
+        # Append-only per-client audit trail next to the JSON snapshot (survives crashes).
+        # A handle passed in by the caller stays open (the caller closes it); otherwise we own one.
+        self._audit_jsonl_path = self.log_file.with_suffix(".jsonl")
+        self._owns_audit_fp = audit_fp is None
+        self._audit_fp = audit_fp or open(self._audit_jsonl_path, "ab", buffering=8192)
+        self._audit_pending = 0
 
     def _setup_logging(self):
         if sys.platform == "win32":
@@ -691,7 +1369,9 @@ class HealthInsuranceRenewalBot:
                 sys.stderr.reconfigure(encoding="utf-8")
             except Exception:
                 pass
-        fh = logging.FileHandler(LOG_FILE, encoding="utf-8")
+        fh = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+        fh.namer = lambda name: name + ".gz"
+        fh.rotator = _gzip_file
         fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
         fh.setFormatter(fmt)
         sh = logging.StreamHandler()
@@ -700,31 +1380,52 @@ class HealthInsuranceRenewalBot:
         root.setLevel(logging.INFO)
         if root.handlers:
             root.handlers = []
-        root.addHandler(fh)
-        root.addHandler(sh)
+        # Callers only enqueue records; file/console writes happen on the listener's thread
+        log_queue = queue.SimpleQueue()
+        root.addHandler(QueueHandler(log_queue))
+        self.log_listener = QueueListener(log_queue, fh, sh)
+        self.log_listener.start()
 
     def initialize_driver(self):
         opts = webdriver.ChromeOptions()
         opts.add_experimental_option("debuggerAddress", CHROME_DEBUGGER_ADDRESS)
+        # Ask chromedriver for compressed responses (urllib3 inflates them transparently)
+        RemoteConnection.extra_headers = {"Accept-Encoding": "gzip, deflate"}
         try:
             self.driver = webdriver.Chrome(options=opts)
-            self.wait = WebDriverWait(self.driver, DEFAULT_WAIT)
+            # Attached sessions can inherit an implicit wait; keep it at 0 so empty
+            # find_elements() probes return immediately. All waits are explicit.
+            self.driver.implicitly_wait(0)
+            self._waits.clear()  # cached waiters hold the old driver
+            self.wait = self._wait(DEFAULT_WAIT)
+            try:
+                # setBlockedURLs only applies while the Network domain is enabled; nothing else reads it
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except WebDriverException as e:
+                logging.debug("Network request blocking unavailable: %s", e)
             logging.info("Ã¢Å“â€¦ Attached to existing Chrome session (port 9222)")
-            logging.info(f"Ã°Å¸Å’Â Navigating to client list URL")
+            logging.info("Ã°Å¸Å’Â Navigating to client list URL")
             self.driver.get(CLIENT_LIST_URL)
             time.sleep(0.75)  # +0.2s buffer
             logging.info("Ã¢Å“â€¦ Client list page loaded")
         except Exception as e:
-            logging.critical(f"Ã¢ÂÅ’ Failed to attach to Chrome on port 9222: {e}", exc_info=True)
+            logging.critical("Ã¢ÂÅ’ Failed to attach to Chrome on port 9222: %s", e, exc_info=True)
             raise
 
     def open_notepadpp_if_needed(self):
         try:
-            result = subprocess.run(["tasklist", "/FI", "IMAGENAME eq notepad++.exe"], capture_output=True, text=True)
-            if "notepad++.exe" not in result.stdout:
+            if psutil is not None:
+                running = any(
+                    (p.info["name"] or "").lower() == "notepad++.exe" for p in psutil.process_iter(["name"])
+                )
+            else:
+                result = subprocess.run(["tasklist", "/FI", "IMAGENAME eq notepad++.exe"], capture_output=True, text=True)
+                running = "notepad++.exe" in result.stdout
+            if not running:
                 subprocess.Popen(["notepad++.exe", str(self.lists_compiled_path)])
                 time.sleep(0.75)  # +0.2s buffer
-                logging.info(f"Ã°Å¸â€œÂ Opened {self.lists_compiled_path} in Notepad++")
+                logging.info("Ã°Å¸â€œÂ Opened %s in Notepad++", self.lists_compiled_path)
             else:
                 logging.info("Ã°Å¸â€œÂ Notepad++ already running")
         except FileNotFoundError:
@@ -738,28 +1439,24 @@ class HealthInsuranceRenewalBot:
         If anything is weird, we just log and let the main flow decide.
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-            # Try to grab body text and look for obvious crash patterns
-            try:
-                body_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-            except Exception:
-                body_text = ""
-
             crash_markers = [
                 "this page isnâ€™t working",
                 "this page isn't working",
                 "application error",
                 "status code 5",  # 500/502/503 messages
             ]
-            if any(m in body_text for m in crash_markers):
+
+            # One script per poll: null until loaded, then 'crashed' / 'ok'
+            state = self._wait(timeout).until(
+                lambda d: d.execute_script(PAGE_HEALTH_JS, crash_markers)
+            )
+            if state == "crashed":
                 logging.error("âŒ Page appears crashed based on body text")
                 return False
 
             return True
         except Exception as e:
-            logging.warning(f"verify_page_alive failed ({e}); assuming page is alive")
+            logging.warning("verify_page_alive failed (%s); assuming page is alive", e)
             return True
 
     def detect_gender_from_page(self) -> Optional[bool]:
@@ -768,76 +1465,163 @@ class HealthInsuranceRenewalBot:
         Returns: True (female), False (male), None (error)
         """
         try:
-            # Find the "Sex" label first to confirm we're on the right page
-            try:
-                sex_label = self.driver.find_element(
-                    By.XPATH, 
-                    "//label[contains(., 'Sex') and contains(@id, 'gender')]"
-                )
-                self.logger.info("Ã¢Å“â€¦ Found 'Sex' field on page")
-            except NoSuchElementException:
+            # Label check, Female button lookup and aria-checked read in one round-trip
+            state = self.driver.execute_script(GENDER_STATE_JS)
+            if state == "no_label":
                 self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â 'Sex' label not found - may not be on SSN page yet")
                 return None
+            self.logger.info("Ã¢Å“â€¦ Found 'Sex' field on page")
             
-            # Check if Female button is checked (aria-checked="true")
-            try:
-                female_button = self.driver.find_element(
-                    By.XPATH,
-                    "//button[@role='radio' and contains(text(), 'Female')]"
-                )
-                is_female_checked = female_button.get_attribute('aria-checked') == 'true'
-                
-                if is_female_checked:
-                    self.logger.info("Ã°Å¸â€˜Â© Detected FEMALE from page (Female button checked)")
-                    return True
-                else:
-                    self.logger.info("Ã°Å¸â€˜Â¨ Detected MALE from page (Female button NOT checked)")
-                    return False
-                    
-            except NoSuchElementException:
+            if state == "no_btn":
                 self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Could not find Female button - defaulting to male")
                 return False
+            
+            if state:
+                self.logger.info("Ã°Å¸â€˜Â© Detected FEMALE from page (Female button checked)")
+                return True
+            self.logger.info("Ã°Å¸â€˜Â¨ Detected MALE from page (Female button NOT checked)")
+            return False
                 
         except Exception as e:
-            self.logger.error(f"Ã¢ÂÅ’ Error detecting gender from page: {str(e)[:80]}")
+            self.logger.error("Ã¢ÂÅ’ Error detecting gender from page: %s", str(e)[:80])
             return False  # Default to male on error
 
     def read_client_table(self) -> List[ClientData]:
         """Read client table - returns current state of table."""
         clients: List[ClientData] = []
-        for i in range(1, 11):
-            xpath = f"//tbody/tr[{i}]/td[2]"
-            try:
-                el = self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
-                name = el.text.strip()
-                if not name:
-                    logging.debug(f"Empty name at row {i}")
-                    break
-                parts = name.split(maxsplit=1)
-                if len(parts) == 2:
-                    first, last = parts
-                else:
-                    first, last = parts[0], ""
-                client = ClientData(first_name=first, last_name=last, full_name=name, row_index=i)
-                clients.append(client)
-                logging.info(f"Ã°Å¸â€œâ€¹ Row {i}: {name}")
-            except TimeoutException:
-                logging.warning(f"Ã¢Å¡Â Ã¯Â¸Â Could not read row {i} (timeout)")
-                break
-            except Exception as e:
-                logging.error(f"Ã¢ÂÅ’ Unexpected error reading row {i}: {e}", exc_info=True)
+        try:
+            # One script round-trip for all rows (polled until the first row has rendered)
+            rows = self.wait.until(lambda d: d.execute_script(CLIENT_ROWS_JS))
+        except TimeoutException:
+            logging.warning("Ã¢Å¡Â Ã¯Â¸Â Could not read client table (timeout)")
+            return clients
+        except Exception as e:
+            logging.error("Ã¢ÂÅ’ Unexpected error reading client table: %s", e, exc_info=True)
+            return clients
+        for i, name in rows:
+            if not name:
+                logging.debug("Empty name at row %s", i)
                 break
+            parts = name.split(maxsplit=1)
+            if len(parts) == 2:
+                first, last = parts
+            else:
+                first, last = parts[0], ""
+            client = ClientData(first_name=first, last_name=last, full_name=name, row_index=i)
+            clients.append(client)
+            logging.info("Ã°Å¸â€œâ€¹ Row %s: %s", i, name)
         return clients
 
     def find_element_safe(self, by: By, value: str, timeout: int = 3) -> Optional[WebElement]:
         """Safely find element without throwing exception."""
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return self._wait(timeout).until(
                 EC.presence_of_element_located((by, value))
             )
         except TimeoutException:
             return None
 
+    def _wait(self, timeout: float, poll: float = 0.5) -> WebDriverWait:
+        """Return a cached WebDriverWait for this timeout/poll pair (one per distinct value)."""
+        key = (timeout, poll)
+        waiter = self._waits.get(key)
+        if waiter is None:
+            waiter = self._waits[key] = WebDriverWait(self.driver, timeout, poll_frequency=poll)
+        return waiter
+
+    def _wait_until(self, condition, timeout: float = 5, poll: float = 0.5):
+        """Wait for an expected condition; returns its result, or None on timeout."""
+        try:
+            return self._wait(timeout, poll).until(condition)
+        except TimeoutException:
+            return None
+
+    def _click_when_ready(self, css: str, timeout: float = NORMAL_TIMEOUT) -> WebElement:
+        """Find, check and click `css` in-page with one round-trip per poll; returns the clicked element."""
+        element = self._wait_until(lambda d: d.execute_script(CLICK_IF_READY_JS, css), timeout=timeout, poll=FAST_POLL)
+        if element is None:
+            raise TimeoutException(f"{css} not clickable after {timeout}s")
+        return element
+
+    def _find_first(self, candidates, timeout: float = 3, clickable: bool = False, input_only: bool = False):
+        """First match among (By, selector, label) candidates, all probed in one script per poll.
+
+        `input_only` skips matches that aren't <input> elements (e.g. a styled checkbox wrapper).
+        Returns (locator, label, element), or Nones if nothing matched within `timeout`.
+        """
+        specs = [[by, selector] for by, selector, _ in candidates]
+        hit = self._wait_until(
+            lambda d: d.execute_script(FIND_FIRST_JS, specs, clickable, input_only), timeout=timeout, poll=0.1
+        )
+        if not hit:
+            return None, None, None
+        index, element = hit
+        by, selector, label = candidates[index]
+        return (by, selector), label, element
+
+    def _find_first_staged(self, *stages, timeout: float = 3, clickable: bool = False):
+        """_find_first over each candidate group in turn, each with the full `timeout` (specific before generic)."""
+        for candidates in stages:
+            locator, label, element = self._find_first(candidates, timeout=timeout, clickable=clickable)
+            if element is not None:
+                return locator, label, element
+        return None, None, None
+
+    def _consent_page_apply(self, timeout: float = 3) -> Dict[str, bool]:
+        """Run CONSENT_APPLY_JS until checkbox #2 and the storage radio both stick (or `timeout`)."""
+        state = {"cb2": False, "radio": False}
+
+        def applied(driver):
+            state.update(driver.execute_script(CONSENT_APPLY_JS))
+            return state["cb2"] and state["radio"]
+
+        self._wait_until(applied, timeout=timeout, poll=0.1)
+        return state
+
+    def _stale_safe_click(self, locator, timeout: float = 3, attempts: int = 3,
+                          element: Optional[WebElement] = None) -> WebElement:
+        """Click `element` (or the first clickable match of `locator`), re-locating it if the DOM replaced it."""
+        for attempt in range(attempts):
+            if element is None:
+                element = self._wait(timeout, FAST_POLL).until(EC.element_to_be_clickable(locator))
+            try:
+                element.click()
+                return element
+            except StaleElementReferenceException:
+                if attempt == attempts - 1:
+                    raise
+                element = None
+                time.sleep(0.05)  # yield to the re-render, then look it up again
+
+    def _ensure_checked(self, element: WebElement) -> Optional[bool]:
+        """Scroll, tick if unticked and read back `checked` in one round-trip (None for non-inputs)."""
+        return self.driver.execute_script(ENSURE_CHECKED_JS, element)
+
+    def _wait_cdp(self, expression: str, timeout: float, poll: float = 0.2) -> bool:
+        """Poll a JS predicate over CDP Runtime.evaluate (one call per poll); False on timeout."""
+        def truthy(driver):
+            try:
+                reply = driver.execute_cdp_cmd("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+            except WebDriverException:
+                return False  # context torn down mid-navigation: try again next poll
+            return bool(reply.get("result", {}).get("value"))
+
+        return bool(self._wait_until(truthy, timeout=timeout, poll=poll))
+
+    def _wait_dom_settle(self, min_ms: int = 100, cap_ms: int = 3500):
+        """Block until a click's DOM update has settled (quiet for `min_ms`), the page navigated, or `cap_ms`."""
+        try:
+            self.driver.execute_async_script(DOM_SETTLE_JS, min_ms, cap_ms)
+        except (JavascriptException, TimeoutException):
+            pass  # document unloaded mid-wait (navigation) or script timeout: either way, move on
+
+    def _scroll_into_view_await(self, element: WebElement):
+        """Scroll `element` to the viewport centre and return as soon as the scroll has settled."""
+        try:
+            self.driver.execute_async_script(SCROLL_SETTLE_JS, element)
+        except TimeoutException:
+            pass  # script timeout: the scroll itself was still issued
+
     def _js_click(self, element: WebElement):
         try:
             self.driver.execute_script("arguments[0].click();", element)
@@ -845,6 +1629,34 @@ class HealthInsuranceRenewalBot:
         except Exception:
             return False
 
+    def _click_smart(self, element: WebElement, timeout: float = 2):
+        """Click element, scrolling first only if it's outside the viewport (JS click fallback)."""
+        state = self.driver.execute_script(VIEWPORT_STATE_JS, element)
+        if state == "hidden":
+            # Styled inputs with no layout box can't take a native click
+            self.driver.execute_script("arguments[0].click();", element)
+            return
+        if state == "offscreen":
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
+                element
+            )
+        try:
+            self._wait(timeout).until(EC.element_to_be_clickable(element))
+            element.click()
+        except (TimeoutException, *CLICK_FALLBACK_ERRORS):
+            self.driver.execute_script("arguments[0].click();", element)
+
+    def _click_and_wait(self, element: WebElement, next_locator: Optional[Tuple[str, str]] = None,
+                        timeout: float = 2) -> bool:
+        """Scroll-click `element`, then wait for `next_locator` to appear (without one: for `element` to detach)."""
+        self.driver.execute_script(SCROLL_CLICK_JS, element)
+        if next_locator is not None:
+            condition = EC.presence_of_element_located(next_locator)
+        else:
+            condition = EC.staleness_of(element)
+        return bool(self._wait_until(condition, timeout=timeout, poll=0.1))
+
     def click_advanced_actions(self, row_index: int):
         """Click 'Advanced Actions' dropdown button for specified table row."""
         if not self.driver or not self.wait:
@@ -861,18 +1673,13 @@ class HealthInsuranceRenewalBot:
             for attempt in range(3):
                 try:
                     btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-                    time.sleep(0.5)  # +0.2s buffer
-                    try:
-                        btn.click()
-                    except (ElementClickInterceptedException, WebDriverException):
-                        self.driver.execute_script("arguments[0].click();", btn)
-                    logging.info(f"Ã°Å¸â€“Â±Ã¯Â¸Â Clicked advanced actions for row {row_index}")
-                    time.sleep(0.5)  # +0.2s buffer
+                    self.driver.execute_script(SCROLL_CLICK_JS, btn)
+                    logging.info("Ã°Å¸â€“Â±Ã¯Â¸Â Clicked advanced actions for row %s", row_index)
+                    time.sleep(0.15)  # let the menu open; open_renew_in_new_tab waits for its item anyway
                     return
                 except (TimeoutException, StaleElementReferenceException, NoSuchElementException) as e:
                     last_err = e
-                    time.sleep(0.6)  # +0.2s buffer
+                    time.sleep(0.05 * (2 ** attempt))  # 50/100/200 ms backoff
                 except NoSuchWindowException:
                     raise
         raise TimeoutException(f"Failed clicking advanced actions row {row_index}: {last_err}")
@@ -895,15 +1702,15 @@ class HealthInsuranceRenewalBot:
         before_url = self.driver.current_url
 
         if href:
-            logging.info(f"Ã°Å¸Å’Â Opening renew flow via href in new tab: {href}")
+            logging.info("Ã°Å¸Å’Â Opening renew flow via href in new tab: %s", href)
             try:
                 self.driver.execute_script("window.open(arguments[0], '_blank');", href)
             except Exception as e:
-                logging.warning(f"JS window.open failed: {e}; falling back to Ctrl+Click")
+                logging.warning("JS window.open failed: %s; falling back to Ctrl+Click", e)
                 try:
                     ActionChains(self.driver).key_down(Keys.CONTROL).click(elem).key_up(Keys.CONTROL).perform()
                 except Exception as e2:
-                    logging.warning(f"Ctrl-Click fallback failed: {e2}; trying direct click")
+                    logging.warning("Ctrl-Click fallback failed: %s; trying direct click", e2)
                     try:
                         elem.click()
                     except Exception:
@@ -913,40 +1720,41 @@ class HealthInsuranceRenewalBot:
             try:
                 ActionChains(self.driver).key_down(Keys.CONTROL).click(elem).key_up(Keys.CONTROL).perform()
             except Exception as e:
-                logging.warning(f"Ctrl+Click failed: {e} - will try direct click")
+                logging.warning("Ctrl+Click failed: %s - will try direct click", e)
                 try:
                     elem.click()
                 except Exception as e2:
-                    logging.error(f"Direct click failed: {e2}")
+                    logging.error("Direct click failed: %s", e2)
 
-        start = time.time()
-        new_handle = None
-        while time.time() - start < NEW_TAB_WAIT:
-            handles = set(self.driver.window_handles)
-            diff = handles - before_handles
+        def renew_opened(driver):
+            # window_handles is the only way to see other tabs (page JS can't), and a same-tab
+            # navigation would abort any in-page watcher, so poll both - URL only if no new tab
+            diff = set(driver.window_handles) - before_handles
             if diff:
-                new_handle = next(iter(diff))
-                logging.info(f"Ã¢Å“â€¦ Detected new tab handle: {new_handle}")
-                return new_handle, True
-                
+                return "tab", next(iter(diff))
             try:
-                cur_url = self.driver.current_url
+                cur_url = driver.current_url
             except InvalidSessionIdException:
                 cur_url = ""
-                
             if cur_url and cur_url != before_url:
-                logging.info("Ã°Å¸â€œÂ Detected same-tab navigation for renewal flow (no new tab opened)")
-                return None, True
-                
-            time.sleep(0.6)  # +0.2s buffer
-            
-        logging.warning("Ã¢ÂÅ’ No new tab and URL unchanged after opening renew control")
-        return None, False
+                return "same", None
+            return None
+
+        opened = self._wait_until(renew_opened, timeout=NEW_TAB_WAIT, poll=0.5)
+        if opened is None:
+            logging.warning("Ã¢ÂÅ’ No new tab and URL unchanged after opening renew control")
+            return None, False
+        kind, new_handle = opened
+        if kind == "tab":
+            logging.info("Ã¢Å“â€¦ Detected new tab handle: %s", new_handle)
+            return new_handle, True
+        logging.info("Ã°Å¸â€œÂ Detected same-tab navigation for renewal flow (no new tab opened)")
+        return None, True
 
     def handle_consent_page(self):
         """Handle consent page with checkboxes and storage option."""
         self.logger.info("ðŸ“‹ Handling consent page")
-        consent_start_time = time.time()
+        consent_start_time = time.monotonic()
         
         try:
             time.sleep(1.0)  # +0.2s buffer
@@ -956,7 +1764,7 @@ class HealthInsuranceRenewalBot:
             # ========================================
             already_consented = False
             try:
-                banner = WebDriverWait(self.driver, 2).until(
+                banner = self._wait(2, FAST_POLL).until(
                     EC.presence_of_element_located((
                         By.XPATH,
                         "//*[contains(text(), 'already provided consent') or " +
@@ -979,387 +1787,170 @@ class HealthInsuranceRenewalBot:
                     # STEP 1: Check BOTH checkboxes (even though already consented)
                     # Checkbox #1
                     checkbox1_clicked = False
-                    checkbox1_selectors = [
-                        (By.CSS_SELECTOR, "input[name='consentData']", "input[name='consentData']"),
-                        (By.CSS_SELECTOR, "#consentData", "#consentData"),
-                        (By.XPATH, "//label[contains(., 'I agree to have my information used')]//input[@type='checkbox']", "label text â†’ checkbox"),
-                    ]
-                    
-                    for by, selector, label in checkbox1_selectors:
-                        try:
-                            checkbox = WebDriverWait(self.driver, 3).until(
-                                EC.presence_of_element_located((by, selector))
-                            )
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                                checkbox
-                            )
-                            time.sleep(0.5)
-                            
-                            if not checkbox.is_selected():
-                                try:
-                                    checkbox.click()
-                                except Exception:
-                                    self.driver.execute_script("arguments[0].click();", checkbox)
-                                time.sleep(0.4)
-                            
-                            if checkbox.is_selected():
-                                self.logger.info(f"âœ… Checkbox #1 checked via: {label}")
-                                checkbox1_clicked = True
-                                break
-                        except (TimeoutException, NoSuchElementException):
-                            continue
-                    
-                    # Checkbox #2
-                    checkbox2_clicked = False
-                    checkbox2_selectors = [
-                        (By.CSS_SELECTOR, "input[name='consentSep']", "input[name='consentSep']"),
-                        (By.XPATH, "//label[contains(., 'I understand that I')]//input[@type='checkbox']", "label text â†’ checkbox"),
-                    ]
+                    locator, label, checkbox = self._find_first(self.CONSENT_CB1_STORED_SELECTORS, timeout=3, input_only=True)
+                    if checkbox is not None:
+                        if self._ensure_checked(checkbox):
+                            self.logger.info("âœ… Checkbox #1 checked via: %s", label)
+                            checkbox1_clicked = True
                     
-                    for by, selector, label in checkbox2_selectors:
-                        try:
-                            element = WebDriverWait(self.driver, 3).until(
-                                EC.presence_of_element_located((by, selector))
-                            )
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                                element
-                            )
-                            time.sleep(0.5)
-                            
-                            if element.tag_name == 'input':
-                                if not element.is_selected():
-                                    try:
-                                        element.click()
-                                    except Exception:
-                                        self.driver.execute_script("arguments[0].click();", element)
-                                    time.sleep(0.4)
-                                
-                                if element.is_selected():
-                                    self.logger.info(f"âœ… Checkbox #2 checked via: {label}")
-                                    checkbox2_clicked = True
-                                    break
-                        except (TimeoutException, NoSuchElementException):
-                            continue
+                    # Checkbox #2 + STEP 2 'Store consent outside' radio: one script, both targets
+                    applied = self._consent_page_apply()
+                    checkbox2_clicked = applied["cb2"]
+                    if checkbox2_clicked:
+                        self.logger.info("âœ… Checkbox #2 checked via: consent script")
                     
                     if not checkbox1_clicked or not checkbox2_clicked:
                         self.logger.error("âŒ Failed to check required consent checkboxes")
                         raise Exception("Consent checkboxes not checked")
                     
-                    # STEP 2: Select 'Store consent outside' radio button
-                    store_radio_selectors = [
-                        (By.XPATH, "//label[contains(., 'Store consent outside of HealthSherpa')]//input[@type='radio']", "xpath label â†’ input"),
-                        (By.CSS_SELECTOR, "input[type='radio'][value*='outside']", "css value contains outside"),
-                        (By.XPATH, "//button[@aria-label='Store consent outside of HealthSherpa']", "button aria-label"),
-                    ]
-                    
-                    radio_clicked = False
-                    for by, selector, label in store_radio_selectors:
-                        try:
-                            radio_element = WebDriverWait(self.driver, 3).until(
-                                EC.presence_of_element_located((by, selector))
-                            )
-                            
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                                radio_element
-                            )
-                            time.sleep(0.5)
-                            
-                            if radio_element.tag_name == 'input':
-                                if not radio_element.is_selected():
-                                    try:
-                                        radio_element.click()
-                                    except Exception:
-                                        self.driver.execute_script("arguments[0].click();", radio_element)
-                                    time.sleep(0.4)
-                                
-                                if radio_element.is_selected():
-                                    self.logger.info(f"âœ… Selected 'Store consent outside' radio ({label})")
-                                    radio_clicked = True
-                                    break
-                            else:
-                                # It's a button
-                                try:
-                                    radio_element.click()
-                                except Exception:
-                                    self.driver.execute_script("arguments[0].click();", radio_element)
-                                time.sleep(0.5)
-                                self.logger.info(f"âœ… Clicked 'Store consent outside' button ({label})")
-                                radio_clicked = True
-                                break
-                                
-                        except (TimeoutException, NoSuchElementException):
-                            continue
-                    
-                    if not radio_clicked:
+                    radio_clicked = applied["radio"]
+                    if radio_clicked:
+                        self.logger.info("âœ… Selected 'Store consent outside' radio (consent script)")
+                    else:
                         self.logger.error("âŒ Failed to select consent storage method")
                         raise Exception("Consent storage radio not selected")
                     
                     # STEP 3: Click Continue
-                    continue_selectors = [
-                        (By.ID, "page-nav-on-next-btn", "id page-nav-on-next-btn"),
-                        (By.XPATH, "//button[@id='page-nav-on-next-btn']", "xpath id"),
-                        (By.XPATH, "//button[@type='submit' and contains(text(), 'Continue')]", "xpath submit + text"),
-                        (By.XPATH, "//button[contains(text(), 'Continue')]", "xpath text only"),
-                    ]
-                    
                     continue_clicked = False
-                    for by, selector, label in continue_selectors:
-                        try:
-                            continue_button = WebDriverWait(self.driver, 3).until(
-                                EC.element_to_be_clickable((by, selector))
-                            )
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                                continue_button
-                            )
-                            time.sleep(0.5)
-                            try:
-                                continue_button.click()
-                            except Exception:
-                                self.driver.execute_script("arguments[0].click();", continue_button)
-                            
-                            self.logger.info(f"âœ… Clicked Continue (consent already stored) - {label}")
-                            continue_clicked = True
-                            break
-                        except TimeoutException:
-                            continue
+                    locator, label, continue_button = self._find_first(self.CONSENT_CONTINUE_SELECTORS, timeout=3, clickable=True)
+                    if continue_button is not None:
+                        self.driver.execute_script(SCROLL_CLICK_JS, continue_button)
+                        
+                        self.logger.info("âœ… Clicked Continue (consent already stored) - %s", label)
+                        continue_clicked = True
                     
                     if not continue_clicked:
                         self.logger.error("âŒ Continue button not found")
                         raise Exception("Continue button not found")
                     
-                    time.sleep(0.75)
+                    self._wait_dom_settle(cap_ms=750)
                     
                     # Wait for navigation
-                    try:
-                        WebDriverWait(self.driver, 8).until(
-                            lambda d: (
-                                len(d.find_elements(By.NAME, "ssn")) > 0 or
-                                'review' in d.current_url.lower() or
-                                'primary' in d.current_url.lower() or
-                                'tell-us' in d.current_url.lower()
-                            )
-                        )
-                    except TimeoutException:
+                    if not self._wait_cdp(CONSENT_STORED_DONE_EXPR, timeout=8):
                         self.logger.warning("âš ï¸ Page didn't clearly advance - continuing anyway")
                     
-                    duration = time.time() - consent_start_time
-                    self.logger.info(f"âœ… Consent page completed (already stored) ({duration:.1f}s)")
+                    duration = time.monotonic() - consent_start_time
+                    self.logger.info("âœ… Consent page completed (already stored) (%.1fs)", duration)
                     return
                     
                 except Exception as e:
-                    self.logger.error(f"âŒ Failed to handle already-consented flow: {str(e)[:80]}")
+                    self.logger.error("âŒ Failed to handle already-consented flow: %s", str(e)[:80])
                     raise Exception(f"Already-consented flow failed: {str(e)}")
                     
             # ========================================
             # ORIGINAL FLOW: Check boxes if NOT already consented
             # ========================================
             checkbox1_clicked = False
-            checkbox1_selectors = [
-                (By.CSS_SELECTOR, "input[name='consentData']", "input[name='consentData']"),
-                (By.CSS_SELECTOR, "#consentData", "#consentData"),
-                (By.XPATH, "//*[@id='consentData']/ancestor::label//input", "xpath ancestor input"),
-                (By.XPATH, "//label[contains(., 'I agree to have my information used')]//input[@type='checkbox']", "label text â†’ checkbox"),
-            ]
-            
-            for by, selector, label in checkbox1_selectors:
-                try:
-                    checkbox = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        checkbox
-                    )
-                    time.sleep(0.5)
-                    
-                    if not checkbox.is_selected():
-                        try:
-                            checkbox.click()
-                        except Exception:
-                            self.driver.execute_script("arguments[0].click();", checkbox)
-                        time.sleep(0.4)
-                    
-                    if checkbox.is_selected():
-                        self.logger.info(f"âœ… Checkbox #1 checked via: {label}")
-                        checkbox1_clicked = True
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            locator, label, checkbox = self._find_first(self.CONSENT_CB1_SELECTORS, timeout=3, input_only=True)
+            if checkbox is not None:
+                if self._ensure_checked(checkbox):
+                    self.logger.info("âœ… Checkbox #1 checked via: %s", label)
+                    checkbox1_clicked = True
             
             if not checkbox1_clicked:
                 self.logger.warning("âš ï¸ All checkbox #1 selectors failed - trying text-based click")
                 try:
-                    text_element = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((
-                            By.XPATH, 
-                            "//label[contains(., 'I agree to have my information used and retrieved from data sources')]"
-                        ))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        text_element
-                    )
-                    time.sleep(0.4)
-                    text_element.click()
+                    text_locator = (By.XPATH, "//label[contains(., 'I agree to have my information used and retrieved from data sources')]")
+                    text_element = self._wait(3, FAST_POLL).until(EC.element_to_be_clickable(text_locator))
+                    self._scroll_into_view_await(text_element)
+                    self._stale_safe_click(text_locator, element=text_element)
                     time.sleep(0.5)
                     checkbox1_clicked = True
                 except Exception as e:
-                    self.logger.error(f"âŒ Checkbox #1 FAILSAFE failed: {str(e)[:80]}")
+                    self.logger.error("âŒ Checkbox #1 FAILSAFE failed: %s", str(e)[:80])
             
             checkbox2_clicked = False
-            checkbox2_selectors = [
-                (By.CSS_SELECTOR, "input[name='consentSep']", "input[name='consentSep']"),
-                (By.XPATH, "//*[@id='consentSep']/ancestor::label//input", "xpath #consentSep â†’ input"),
-                (By.XPATH, "//label[contains(., 'I understand that I')]//input[@type='checkbox']", "label text â†’ checkbox"),
-                (By.CSS_SELECTOR, "#consentSep", "#consentSep span"),
-            ]
-            
-            for by, selector, label in checkbox2_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        element
-                    )
+            locator, label, element = self._find_first(self.CONSENT_CB2_SELECTORS, timeout=3)
+            if element is not None:
+                checked = self._ensure_checked(element)
+                if checked is None:
+                    # Matched the styled wrapper rather than the <input>: just click it
+                    try:
+                        self._stale_safe_click(locator, element=element)
+                    except CLICK_FALLBACK_ERRORS:
+                        self.driver.execute_script("arguments[0].click();", element)
                     time.sleep(0.5)
-                    
-                    if element.tag_name == 'input':
-                        if not element.is_selected():
-                            try:
-                                element.click()
-                            except Exception:
-                                self.driver.execute_script("arguments[0].click();", element)
-                            time.sleep(0.4)
-                        
-                        if element.is_selected():
-                            self.logger.info(f"âœ… Checkbox #2 checked via: {label}")
-                            checkbox2_clicked = True
-                            break
-                    else:
-                        try:
-                            element.click()
-                        except Exception:
-                            self.driver.execute_script("arguments[0].click();", element)
-                        time.sleep(0.5)
-                        checkbox2_clicked = True
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+                    checkbox2_clicked = True
+                elif checked:
+                    self.logger.info("âœ… Checkbox #2 checked via: %s", label)
+                    checkbox2_clicked = True
             
             if not checkbox2_clicked:
                 self.logger.warning("âš ï¸ All checkbox #2 selectors failed - trying text-based click")
                 try:
-                    text_element = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((
-                            By.XPATH, 
-                            "//label[contains(., \"I understand that I'm required to provide true answers\")]"
-                        ))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        text_element
-                    )
-                    time.sleep(0.4)
-                    text_element.click()
+                    text_locator = (By.XPATH, "//label[contains(., \"I understand that I'm required to provide true answers\")]")
+                    text_element = self._wait(3, FAST_POLL).until(EC.element_to_be_clickable(text_locator))
+                    self._scroll_into_view_await(text_element)
+                    self._stale_safe_click(text_locator, element=text_element)
                     time.sleep(0.5)
                     checkbox2_clicked = True
                 except Exception as e:
-                    self.logger.error(f"âŒ Checkbox #2 FAILSAFE failed: {str(e)[:80]}")
+                    self.logger.error("âŒ Checkbox #2 FAILSAFE failed: %s", str(e)[:80])
             
             if not checkbox1_clicked and not checkbox2_clicked:
                 self.logger.error("âŒ CRITICAL: No consent checkboxes were successfully checked")
                 raise Exception("Failed to check any consent checkboxes")
             
             button_clicked = False
-            store_button_selectors = [
-                (By.CSS_SELECTOR, "button[aria-label='Store consent outside of HealthSherpa']", "aria-label button"),
-                (By.XPATH, "//button[@aria-label='Store consent outside of HealthSherpa']", "xpath aria-label"),
-                (By.XPATH, "//button[contains(., 'Store consent outside')]", "button text contains"),
-            ]
-            
-            for by, selector, label in store_button_selectors:
-                try:
-                    button = WebDriverWait(self.driver, 4).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        button
-                    )
-                    time.sleep(0.5)
-                    try:
-                        button.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", button)
-                    time.sleep(0.5)
-                    self.logger.info(f"âœ… Clicked 'Store consent' button via: {label}")
-                    button_clicked = True
-                    break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            locator, label, button = self._find_first(self.STORE_CONSENT_BUTTON_SELECTORS, timeout=4, clickable=True)
+            if button is not None:
+                self.driver.execute_script(SCROLL_CLICK_JS, button)
+                self._wait_dom_settle(cap_ms=500)
+                self.logger.info("âœ… Clicked 'Store consent' button via: %s", label)
+                button_clicked = True
             
             if not button_clicked:
                 self.logger.warning("âš ï¸ All button selectors failed - trying text-based click")
                 try:
-                    text_element = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((
-                            By.XPATH, 
-                            "//*[contains(text(), 'Store consent outside')]"
-                        ))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        text_element
-                    )
-                    time.sleep(0.4)
+                    text_locator = (By.XPATH, "//*[contains(text(), 'Store consent outside')]")
+                    text_element = self._wait(3, FAST_POLL).until(EC.element_to_be_clickable(text_locator))
+                    self._scroll_into_view_await(text_element)
                     if text_element.tag_name.lower() != 'button':
                         try:
                             parent_button = text_element.find_element(By.XPATH, "./ancestor::button[1]")
                             parent_button.click()
-                        except Exception:
+                        except (*CLICK_FALLBACK_ERRORS, NoSuchElementException):
                             self.driver.execute_script("arguments[0].click();", text_element)
                     else:
-                        text_element.click()
+                        self._stale_safe_click(text_locator, element=text_element)
                     time.sleep(0.5)
                     self.logger.info("âœ… Clicked 'Store consent' via text-based click (FAILSAFE)")
                     button_clicked = True
                 except Exception as e:
-                    self.logger.error(f"âŒ Button FAILSAFE failed: {str(e)[:80]}")
+                    self.logger.error("âŒ Button FAILSAFE failed: %s", str(e)[:80])
             
             if not button_clicked:
                 self.logger.error("âŒ Could not click 'Store consent outside' button")
                 raise Exception("Failed to click consent confirmation button")
             
             self.logger.info("â³ Waiting for page to progress past consent...")
-            try:
-                WebDriverWait(self.driver, 8).until(
-                    lambda d: (
-                        len(d.find_elements(By.ID, "page-nav-on-next-btn")) > 0 or
-                        len(d.find_elements(By.NAME, "ssn")) > 0 or
-                        len(d.find_elements(By.XPATH, "//input[contains(@placeholder, 'SSN')]")) > 0 or
-                        'review' in d.current_url.lower() or
-                        'signature' in d.current_url.lower()
-                    )
-                )
-                duration = time.time() - consent_start_time
-                self.logger.info(f"âœ… Consent page completed successfully ({duration:.1f}s)")
-            except TimeoutException:
-                duration = time.time() - consent_start_time
-                self.logger.error(f"âŒ Consent page did NOT progress after {duration:.1f}s")
+            if self._wait_cdp(CONSENT_DONE_EXPR, timeout=8):
+                duration = time.monotonic() - consent_start_time
+                self.logger.info("âœ… Consent page completed successfully (%.1fs)", duration)
+            else:
+                duration = time.monotonic() - consent_start_time
+                self.logger.error("âŒ Consent page did NOT progress after %.1fs", duration)
                 raise Exception(f"Consent page did not progress to next step after {duration:.1f}s")
                 
         except Exception as e:
-            duration = time.time() - consent_start_time
+            duration = time.monotonic() - consent_start_time
             error_msg = f"Failed to complete consent page after {duration:.1f}s: {str(e)}"
-            self.logger.error(f"âŒ {error_msg}")
+            self.logger.error("âŒ %s", error_msg)
             raise Exception(error_msg)
 
+    def click_skip_to_end(self) -> bool:
+        """Click 'Skip to the end' if the current page offers it (single lookup, no timeout spin)."""
+        # Continue renders together with Skip, so once it's clickable a miss is a real miss
+        self._wait_page_ready_and_clickable(NEXT_BUTTON_LOCATOR, timeout=FAST_TIMEOUT)
+        buttons = [b for b in self.driver.find_elements(By.XPATH, self.SKIP_TO_END_XPATH) if b.is_enabled()]
+        if not buttons:
+            return False
+        skip_btn = buttons[0]
+        self._click_smart(skip_btn)
+        logging.info("â© Clicked 'Skip to the end'")
+        self._wait_until(EC.staleness_of(skip_btn), timeout=3)
+        return True
+
     def click_continue_with_plan(self):
         locators = [
             (By.XPATH, "//button[normalize-space()='Continue with plan']"),
@@ -1368,107 +1959,31 @@ class HealthInsuranceRenewalBot:
         ]
         for loc in locators:
             try:
-                btn = self.wait.until(EC.element_to_be_clickable(loc))
+                btn = self._wait(DEFAULT_WAIT, FAST_POLL).until(EC.element_to_be_clickable(loc))
                 try:
                     btn.click()
-                except Exception:
+                except CLICK_FALLBACK_ERRORS:
                     self._js_click(btn)
                 logging.info("Ã¢Å“â€¦ Clicked 'Continue with plan'")
-                time.sleep(0.75)  # +0.2s buffer
+                self._wait_dom_settle(cap_ms=750)
                 return
             except TimeoutException:
                 continue
         raise TimeoutException("Continue with plan button not found")
 
     def click_continue(self):
-        """Click the Continue/Enroll button with proper fallbacks."""
-        wait = WebDriverWait(self.driver, 5)
-
-        # 1) Try "Continue with plan" (zero-premium case)
-        try:
-            btn = wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Continue with plan')]"))
-            )
-            self._safe_click(btn)
-            logger.info("✅ Clicked 'Continue with plan'")
-            time.sleep(0.6)
-            return
-        except TimeoutException:
-            pass
-
-        # 2) Try "Enroll in this plan" (paid-premium case)
-        try:
-            btn = wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Enroll in this plan')]"))
-            )
-            self._safe_click(btn)
-            logger.info("✅ Clicked 'Enroll in this plan'")
-            time.sleep(0.6)
-            return
-        except TimeoutException:
-            pass
-
-        # 3) Try generic "Enroll"
-        try:
-            btn = wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Enroll')]"))
-            )
-            self._safe_click(btn)
-            logger.info("✅ Clicked generic 'Enroll'")
-            time.sleep(0.6)
-            return
-        except TimeoutException:
-            pass
-
-        # 4) FINAL HARD FALLBACK — page-nav-on-next-btn
-        try:
-            btn = wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@id='page-nav-on-next-btn']"))
-            )
-            self._safe_click(btn)
-            logger.info("⚙️ Clicked fallback next-button (ID)")
-            time.sleep(0.6)
-            return
-        except TimeoutException:
-            pass
+        """Click the Continue/Enroll button; every variant is probed in priority order within one wait."""
+        locator, label, btn = self._find_first(self.CONTINUE_BUTTON_SELECTORS, timeout=5, clickable=True)
+        if btn is None:
+            logging.warning("⚠️ Continue button not found with any selector")
+            raise TimeoutException("Continue/Enroll button not found")
 
-        # Extended fallbacks and JS clicks
+        self._scroll_into_view_await(btn)
         try:
-            btn.click()
-        except Exception:
+            self._stale_safe_click(locator, element=btn)
+        except CLICK_FALLBACK_ERRORS:
             self._js_click(btn)
-            logging.debug("✅ Clicked Continue (ID)")
-            time.sleep(3.5)  # ← CHANGE from 2.5 to 4.0 seconds
-            return
-        except TimeoutException:
-            try:
-                btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@id='page-nav-on-next-btn']")))
-                btn.click()
-            except Exception:
-                self._js_click(btn)
-                logging.debug("✅ Clicked Continue (XPath)")
-                time.sleep(0.6)  # +0.2s buffer
-                return
-            except TimeoutException:
-                try:
-                    btn = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Continue')]"))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        btn
-                    )
-                    time.sleep(0.4)  # +0.2s buffer
-                    try:
-                        btn.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", btn)
-                        logging.info("✅ Clicked Continue via text (FAILSAFE)")
-                        time.sleep(0.6)  # +0.2s buffer
-                        return
-                except TimeoutException:
-                    logging.warning("⚠️ Continue button not found with any selector")
-                    raise
+        logging.info("✅ Clicked %s", label)
 
     def click_continue_button(self) -> bool:
         """Wrapper that returns True/False instead of raising exception."""
@@ -1481,136 +1996,82 @@ class HealthInsuranceRenewalBot:
     def handle_signature_page(self, client: ClientData) -> bool:
         """
         FIXED: Handle signature page with crash detection and recovery.
+        Not called anywhere: process_client's signature step goes through _do_signature.
         """
-        self.logger.info(f"Ã¢Å“ÂÃ¯Â¸Â Handling signature for {client.full_name}")
+        self.logger.info("Ã¢Å“ÂÃ¯Â¸Â Handling signature for %s", client.full_name)
         
         max_attempts = 3
         for attempt in range(1, max_attempts + 1):
             try:
-                self.logger.info(f"   Attempt {attempt}/{max_attempts}")
+                self.logger.info("   Attempt %s/%s", attempt, max_attempts)
                 
                 # Verify we're on a valid page
                 try:
                     self.driver.current_url  # This will throw if page crashed
                 except Exception as e:
-                    self.logger.error(f"Ã¢ÂÅ’ Page crashed - refreshing: {str(e)[:60]}")
+                    self.logger.error("Ã¢ÂÅ’ Page crashed - refreshing: %s", str(e)[:60])
                     time.sleep(0.75)
                     continue
                 
-                # Wait for signature section to appear
-                try:
-                    signature_section = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((
-                            By.XPATH,
-                            "//h2[contains(text(), 'Signature')] | //label[contains(text(), 'signature')] | //button[contains(@aria-label, 'copy')]"
-                        ))
-                    )
-                    self.logger.info("Ã¢Å“â€¦ Found signature section")
-                except TimeoutException:
-                    self.logger.warning(f"Ã¢Å¡Â Ã¯Â¸Â Signature section not found (attempt {attempt})")
-                    if attempt < max_attempts:
-                        time.sleep(0.75)
-                        continue
+                # Section and input in one probe per poll, instead of two back-to-back waits
+                found = {"section": False, "input": None}
+
+                def probe(driver):
+                    found.update(driver.execute_script(SIGNATURE_FIELDS_JS))
+                    return found["input"]
+
+                signature_input = self._wait_until(probe, timeout=10, poll=FAST_POLL)
+                if signature_input is None:
+                    if found["section"]:
+                        self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Signature input not found (attempt %s)", attempt)
                     else:
-                        self.logger.error("Ã¢ÂÅ’ Signature section never appeared - skipping signature")
-                        return True  # Continue anyway
-                
-                # Click Copy button
-                try:
-                    copy_button = WebDriverWait(self.driver, 8).until(
-                        EC.element_to_be_clickable((
-                            By.XPATH,
-                            "//button[contains(@aria-label, 'copy') or contains(text(), 'Copy')]"
-                        ))
-                    )
-                    copy_button.click()
-                    self.logger.info("Ã°Å¸â€œâ€¹ Clicked Copy button")
-                    time.sleep(0.5)
-                except TimeoutException:
-                    self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Copy button not found - may already be in clipboard")
-                
-                # Find signature input
-                signature_input = WebDriverWait(self.driver, 8).until(
-                    EC.presence_of_element_located((
-                        By.XPATH,
-                        "//input[@type='text' and contains(@id, 'signature')]"
-                    ))
-                )
-                
-                # Paste signature
-                signature_input.click()
-                time.sleep(0.3)
-                signature_input.send_keys(Keys.CONTROL, 'v')
-                self.logger.info("Ã°Å¸ÂªÅ¾ Pasted signature")
-                time.sleep(0.75)
-                
-                # Verify signature was pasted
-                sig_value = signature_input.get_attribute('value')
-                if not sig_value or len(sig_value) < 3:
-                    self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Signature appears empty - retrying")
+                        self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Signature section not found (attempt %s)", attempt)
                     if attempt < max_attempts:
                         time.sleep(0.75)
                         continue
-                # After signature completes
-                time.sleep(0.75)  # â† INCREASE from 2.0 to 3.0
+                    self.logger.error("Ã¢ÂÅ’ Signature section never appeared - skipping signature")
+                    return True  # Continue anyway
+                self.logger.info("Ã¢Å“â€¦ Found signature section")
                 
-                # Verify we're on eligibility page
-                try:
-                    WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((
-                            By.XPATH,
-                            "//*[contains(text(), 'eligibility') or contains(text(), 'Eligibility')]"
-                        ))
+                # Set the value via the native setter + input/change events (no clipboard, no typing)
+                sig_value = self.driver.execute_script(SIGNATURE_JS, signature_input, client.full_name)
+                self.logger.info("Ã°Å¸ÂªÅ¾ Entered signature")
+                if not sig_value or len(sig_value) < 3:
+                    # A controlled input can lag a render behind the setter: give it 1.5 s to show the value
+                    filled = self._wait_until(
+                        lambda d: len(signature_input.get_attribute('value') or '') >= 3, timeout=1.5, poll=0.05
                     )
-                    logging.info("âœ… Confirmed on eligibility page")
-                except:
-                    logging.warning("âš ï¸ May not be on eligibility page yet")
-                    time.sleep(0.75)  # Wait more
-                
-                return True
+                    if not filled:
+                        self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Signature appears empty - retrying")
+                        if attempt < max_attempts:
+                            continue
                 
                 # Click Continue
                 try:
-                    continue_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                    )
-                    continue_button.click()
+                    self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
                     self.logger.info("Ã¢Å“â€¦ Clicked Continue after signature")
                 except TimeoutException:
                     self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Continue button not found after signature")
                 
                 # Wait for page to process
-                self.logger.info("Ã¢ÂÂ³ Waiting for signature page to process (11s)...")
-                time.sleep(11.0)
-                
-                # Verify we moved forward successfully
-                try:
-                    current_url = self.driver.current_url
-                    if "signature" not in current_url.lower():
-                        self.logger.info("Ã¢Å“â€¦ Signature step completed successfully")
-                        return True
-                    else:
-                        self.logger.warning(f"Ã¢Å¡Â Ã¯Â¸Â Still on signature page (attempt {attempt})")
-                        if attempt < max_attempts:
-                            continue
-                except Exception as url_err:
-                    self.logger.error(f"Ã¢ÂÅ’ Error checking URL: {str(url_err)[:60]}")
-                    if attempt < max_attempts:
-                        time.sleep(0.75)
-                        continue
-                
-                return True  # Success
+                self.logger.info("Ã¢ÂÂ³ Waiting for signature page to process (up to 11s)...")
+                # Return as soon as the page leaves the signature step or shows eligibility
+                if self._wait_cdp(SIGNATURE_DONE_EXPR, timeout=11):
+                    self.logger.info("Ã¢Å“â€¦ Signature step completed successfully")
+                    return True
+                self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Still on signature page (attempt %s)", attempt)
+                if attempt < max_attempts:
+                    continue
+                return True
                 
             except Exception as e:
-                self.logger.error(f"Ã¢ÂÅ’ Signature error (attempt {attempt}): {str(e)[:80]}")
+                self.logger.error("Ã¢ÂÅ’ Signature error (attempt %s): %s", attempt, str(e)[:80])
                 if attempt < max_attempts:
                     time.sleep(0.75)
                     continue
                 else:
                     self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Signature failed after all attempts - continuing anyway")
                     return True  # Don't fail entire enrollment
-    
-                    return True  # Continue anyway after all attempts
 
     def check_followups_cell(self) -> bool:
         """Check if Followups cell is empty (no DMI/verification) on eligibility page."""
@@ -1627,79 +2088,51 @@ class HealthInsuranceRenewalBot:
                 # Still try to find the followups cell
             
             # Try to find followups information in the eligibility table
-            # Based on the screenshot, it's in a table with Name/Eligibility/Followups columns
-            followups_selectors = [
-                # Try to find the Followups column cell (3rd column in the table)
-                (By.XPATH, "//th[contains(text(), 'Followups')]/ancestor::table//tbody/tr[1]/td[3]", "followups column"),
-                (By.XPATH, "//table//td[3]", "third column"),
-                (By.CSS_SELECTOR, "table tbody tr td:nth-child(3)", "css third column"),
-                # Try finding cell next to "Followups" header
-                (By.XPATH, "//td[preceding-sibling::*[contains(text(), 'Followups')]]", "after followups label"),
-            ]
-            
-            for by, selector, label in followups_selectors:
-                try:
-                    followups_cell = self.driver.find_element(by, selector)
-                    cell_text = followups_cell.text.strip().lower()
-                    
-                    # Check if empty or contains only "Enroll" button
-                    if not cell_text or cell_text == "" or "enroll" in cell_text:
-                        logging.info(f"✅ Followups cell empty or contains 'enroll': '{cell_text}'")
-                        return True
-                    
-                    # Check for verification keywords
-                    verification_keywords = ["dmi", "verif", "document", "request", "required", "pending", "needed"]
-                    has_verification = any(keyword in cell_text for keyword in verification_keywords)
-                    
-                    if has_verification:
-                        logging.warning(f"⚠️ Followups contains verification: {cell_text}")
-                        return False
-                    else:
-                        logging.info(f"✅ Followups cell safe: '{cell_text}'")
-                        return True
-                except:
-                    continue
-            
+            # Based on the screenshot, it's in a table with Name/Eligibility/Followups columns.
+            # All candidates are probed in priority order by one script, once (no waiting)
+            _, label, followups_cell = self._find_first(self.FOLLOWUPS_CELL_SELECTORS, timeout=0)
+            if followups_cell is not None:
+                logging.debug("Followups cell matched via %s", label)
+                cell_text = followups_cell.text.strip().lower()
+                
+                # Check if empty or contains only "Enroll" button
+                if not cell_text or cell_text == "" or "enroll" in cell_text:
+                    logging.info("✅ Followups cell empty or contains 'enroll': '%s'", cell_text)
+                    return True
+                
+                # Check for verification keywords
+                verification_keywords = ["dmi", "verif", "document", "request", "required", "pending", "needed"]
+                has_verification = any(keyword in cell_text for keyword in verification_keywords)
+                
+                if has_verification:
+                    logging.warning("⚠️ Followups contains verification: %s", cell_text)
+                    return False
+                else:
+                    logging.info("✅ Followups cell safe: '%s'", cell_text)
+                    return True
+
             logging.info("ℹ️ Could not find Followups cell - assuming safe to continue")
             return True
             
         except Exception as e:
-            logging.warning(f"⚠️ Error checking Followups (non-fatal): {str(e)[:100]}")
+            logging.warning("⚠️ Error checking Followups (non-fatal): %s", str(e)[:100])
             return True  # FIXED: Return True to continue on errors
 
     def download_eligibility_letter(self) -> bool:
         """Download eligibility letter if button present."""
         try:
-            download_selectors = [
-                (By.XPATH, "//button[normalize-space()='Download Eligibility Letter']", "xpath text"),
-                (By.XPATH, "//button[contains(., 'Download Eligibility Letter')]", "xpath contains"),
-            ]
-            
-            for by, selector, label in download_selectors:
-                try:
-                    download_btn = WebDriverWait(self.driver, 4).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        download_btn
-                    )
-                    time.sleep(0.5)  # +0.2s buffer
-                    try:
-                        download_btn.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", download_btn)
-                    logging.info(f"Ã°Å¸â€œÂ¥ Downloaded eligibility letter ({label})")
-                    time.sleep(0.75)  # +0.2s buffer
-                    return True
-                except TimeoutException:
-                    continue
-            
+            download_btn = self._wait(5).until(
+                EC.element_to_be_clickable((By.XPATH, self.DOWNLOAD_LETTER_XPATH))
+            )
+        except TimeoutException:
             logging.warning("Ã¢Å¡Â Ã¯Â¸Â Download button not found - may not be required")
             return False
-            
-        except Exception as e:
-            logging.error(f"Ã¢ÂÅ’ Error downloading eligibility letter: {str(e)}")
+        try:
+            self._click_smart(download_btn)
+            logging.info("Ã°Å¸â€œÂ¥ Downloaded eligibility letter")
+            return True
+        except WebDriverException as e:
+            logging.warning("Eligibility letter download failed: %s", str(e)[:80])
             return False
     
     def click_enrollment_button(driver, wait):
@@ -1720,7 +2153,7 @@ class HealthInsuranceRenewalBot:
                     timeout=2
                 )
                 button.click()
-                logger.info(f"✅ Clicked '{description}' button")
+                logger.info("✅ Clicked '%s' button", description)
                 return True
             except TimeoutException:
                 continue
@@ -1733,38 +2166,18 @@ class HealthInsuranceRenewalBot:
     def click_review_plan(self) -> bool:
         """Click 'Review plan' button."""
         try:
-            review_selectors = [
-                (By.ID, "page-nav-on-next-btn", "id page-nav-on-next-btn"),
-                (By.XPATH, "//button[@id='page-nav-on-next-btn']", "xpath id"),
-                (By.XPATH, "//button[normalize-space()='Review plan']", "xpath text"),
-                (By.XPATH, "//button[contains(text(), 'Review plan')]", "xpath contains"),
-            ]
-            
-            for by, selector, label in review_selectors:
-                try:
-                    review_btn = WebDriverWait(self.driver, 4).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        review_btn
-                    )
-                    time.sleep(0.5)  # +0.2s buffer
-                    try:
-                        review_btn.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", review_btn)
-                    logging.info(f"Ã¢Å“â€¦ Clicked 'Review plan' ({label})")
-                    time.sleep(0.75)  # +0.2s buffer
-                    return True
-                except TimeoutException:
-                    continue
+            # One budget for all candidates instead of a 4 s wait per selector
+            _, label, review_btn = self._find_first(self.REVIEW_PLAN_SELECTORS, timeout=4, clickable=True)
+            if review_btn is not None:
+                self._click_and_wait(review_btn)
+                logging.info("Ã¢Å“â€¦ Clicked 'Review plan' (%s)", label)
+                return True
             
             logging.error("Ã¢ÂÅ’ 'Review plan' button not found")
             return False
             
         except Exception as e:
-            logging.error(f"Ã¢ÂÅ’ Error clicking Review plan: {str(e)}")
+            logging.error("Ã¢ÂÅ’ Error clicking Review plan: %s", str(e))
             return False
 
     def handle_enrollment_with_smart_logic(driver, wait, max_premium=0.00):
@@ -1783,15 +2196,14 @@ class HealthInsuranceRenewalBot:
             premium_text = premium_element.text
             
             # Extract dollar amount
-            import re
-            match = re.search(r'\$?([\d,]+\.?\d*)', premium_text)
+            match = PREMIUM_RE.search(premium_text)
             if match:
                 premium = float(match.group(1).replace(',', ''))
-                logger.info(f"💰 Current premium: ${premium:.2f}")
+                logger.info("💰 Current premium: $%.2f", premium)
                 
                 # If premium is too high, look for plan change option
                 if premium > max_premium:
-                    logger.info(f"⚠️ Premium ${premium:.2f} exceeds max ${max_premium:.2f}")
+                    logger.info("⚠️ Premium $%.2f exceeds max $%.2f", premium, max_premium)
                     
                     try:
                         # Try to find "Change plan" or "Shop for plans" button
@@ -1820,26 +2232,25 @@ class HealthInsuranceRenewalBot:
         try:
             time.sleep(0.75)  # +0.2s buffer
             
-            carrier = "unknown"
             plan_name = "unknown"
             premium = 999.99
             
-            # Find carrier name
-            carrier_elements = self.driver.find_elements(
-                By.XPATH,
-                "//h2[contains(@class, 'carrier')] | "
-                "//div[contains(@class, 'carrier-name')] | "
-                "//img[contains(@alt, 'logo')] | "
-                "//img[@class='issuer-logo']"
-            )
+            # One round-trip for everything below; the strategies then run over plain Python data
+            page = self.driver.execute_script(PLAN_INFO_JS)
 
-            for elem in carrier_elements:
-                if elem.tag_name == "img":
-                    carrier = elem.get_attribute("alt").lower()
-                else:
-                    carrier = elem.text.lower()
-                
-                if carrier:
+            def dollars(text: Optional[str]) -> Optional[float]:
+                # Extract number (handles "$0.94" or "0.94")
+                match = PREMIUM_RE.search(text or "")
+                try:
+                    return float(match.group(1).replace(',', '')) if match else None
+                except ValueError:  # matched only commas
+                    return None
+
+            # Find carrier name
+            carrier = "unknown"
+            for carrier_text in page["carriers"]:
+                if carrier_text:
+                    carrier = carrier_text.lower()
                     # Handle "Blue Cross" variations
                     if "blue" in carrier or "bcbs" in carrier:
                         carrier = "blue"
@@ -1851,154 +2262,61 @@ class HealthInsuranceRenewalBot:
             # CRITICAL FIX: Find premium (avoiding strikethrough)
             # ========================================
             
-            # Strategy 1: Find var[data-var="dollars"] NOT in a strikethrough div
-            try:
-                premium_var = self.driver.find_element(
-                    By.XPATH,
-                    "//div[contains(@class, '_mt6_wndsr')]//var[@data-var='dollars']"
-                )
-                premium_text = premium_var.text.strip()
-                
-                # Extract number (handles "$0.94" or "0.94")
-                match = re.search(r'\$?([\d,]+\.?\d*)', premium_text)
-                if match:
-                    premium_str = match.group(1).replace(',', '')
-                    premium = float(premium_str)
-                    self.logger.info(f"Ã¢Å“â€¦ Found premium via var[data-var]: ${premium:.2f}")
-            except Exception as e:
-                self.logger.debug(f"Strategy 1 failed: {str(e)[:60]}")
+            # Strategy 1: var[data-var="dollars"] in the plan price block
+            found = dollars(page["direct"])
+            if found is not None:
+                premium = found
+                self.logger.info("Ã¢Å“â€¦ Found premium via var[data-var]: $%.2f", premium)
             
-            # Strategy 2: If still not found, try looking for "Premium" label + nearby text
+            # Strategy 2: "Premium" label + nearby price, skipping struck-through ones
             if premium == 999.99:
-                try:
-                    premium_elements = self.driver.find_elements(
-                        By.XPATH,
-                        "//div[contains(text(), 'Premium')]/following-sibling::*//var[@data-var='dollars'] | "
-                        "//span[contains(text(), 'Premium')]/ancestor::div[1]//var[@data-var='dollars']"
-                    )
-                    
-                    for elem in premium_elements:
-                        # Skip if inside strikethrough
-                        try:
-                            parent_classes = elem.find_element(By.XPATH, "./ancestor::div[1]").get_attribute("class")
-                            if "strikethrough" in parent_classes.lower() or "strike" in parent_classes.lower():
-                                self.logger.debug(f"Skipping strikethrough price: {elem.text}")
-                                continue
-                        except:
-                            pass
-                        
-                        premium_text = elem.text.strip()
-                        match = re.search(r'\$?([\d,]+\.?\d*)', premium_text)
-                        if match:
-                            premium_str = match.group(1).replace(',', '')
-                            premium = float(premium_str)
-                            self.logger.info(f"Ã¢Å“â€¦ Found premium via Premium label: ${premium:.2f}")
-                            break
-                except Exception as e:
-                    self.logger.debug(f"Strategy 2 failed: {str(e)[:60]}")
+                for entry in page["labelled"]:
+                    if entry["strike"]:
+                        self.logger.debug("Skipping strikethrough price: %s", entry["text"])
+                        continue
+                    found = dollars(entry["text"])
+                    if found is not None:
+                        premium = found
+                        self.logger.info("Ã¢Å“â€¦ Found premium via Premium label: $%.2f", premium)
+                        break
             
-            # Strategy 3: Fallback - look for "/mo" text NOT in strikethrough
+            # Strategy 3: Fallback - "/mo" text NOT in strikethrough (price read from its parent block)
             if premium == 999.99:
-                try:
-                    mo_elements = self.driver.find_elements(
-                        By.XPATH,
-                        "//*[contains(text(), '/ mo') or contains(text(), '/mo')]"
-                    )
-                    
-                    for elem in mo_elements:
-                        # Skip strikethrough
-                        try:
-                            elem_classes = elem.get_attribute("class")
-                            if elem_classes and ("strikethrough" in elem_classes.lower() or "strike" in elem_classes.lower()):
-                                continue
-                        except:
-                            pass
-                        
-                        # Get parent and look for dollar amount
-                        try:
-                            parent = elem.find_element(By.XPATH, "./ancestor::div[1]")
-                            parent_text = parent.text
-                            
-                            # Skip if parent has strikethrough
-                            parent_classes = parent.get_attribute("class")
-                            if parent_classes and ("strikethrough" in parent_classes.lower() or "strike" in parent_classes.lower()):
-                                continue
-                            
-                            match = re.search(r'\$?([\d,]+\.?\d*)', parent_text)
-                            if match:
-                                premium_str = match.group(1).replace(',', '')
-                                premium = float(premium_str)
-                                self.logger.info(f"Ã¢Å“â€¦ Found premium via /mo text: ${premium:.2f}")
-                                break
-                        except:
-                            continue
-                            
-                except Exception as e:
-                    self.logger.debug(f"Strategy 3 failed: {str(e)[:60]}")
+                for entry in page["perMonth"]:
+                    found = None if entry["strike"] else dollars(entry["text"])
+                    if found is not None:
+                        premium = found
+                        self.logger.info("Ã¢Å“â€¦ Found premium via /mo text: $%.2f", premium)
+                        break
             
-            # Strategy 4: Last resort - look in Plan summary box
+            # Strategy 4: Last resort - unstruck prices in the Plan summary box
             if premium == 999.99:
-                try:
-                    plan_summary = self.driver.find_element(
-                        By.XPATH,
-                        "//div[contains(., 'Plan summary')]"
-                    )
-                    
-                    # Find all var elements in summary
-                    var_elements = plan_summary.find_elements(By.XPATH, ".//var[@data-var='dollars']")
-                    
-                    for var_elem in var_elements:
-                        # Skip if in strikethrough parent
-                        try:
-                            ancestor_div = var_elem.find_element(By.XPATH, "./ancestor::div[contains(@class, 'strikethrough') or contains(@class, 'strike')]")
-                            if ancestor_div:
-                                continue
-                        except:
-                            pass  # No strikethrough parent = good!
-                        
-                        premium_text = var_elem.text.strip()
-                        match = re.search(r'\$?([\d,]+\.?\d*)', premium_text)
-                        if match:
-                            premium_str = match.group(1).replace(',', '')
-                            test_premium = float(premium_str)
-                            
-                            # Sanity check: premium should be reasonable (under $2000)
-                            if test_premium < 2000:
-                                premium = test_premium
-                                self.logger.info(f"Ã¢Å“â€¦ Found premium via Plan summary: ${premium:.2f}")
-                                break
-                            
-                except Exception as e:
-                    self.logger.debug(f"Strategy 4 failed: {str(e)[:60]}")
+                for summary_text in page["summary"]:
+                    found = dollars(summary_text)
+                    # Sanity check: premium should be reasonable (under $2000)
+                    if found is not None and found < 2000:
+                        premium = found
+                        self.logger.info("Ã¢Å“â€¦ Found premium via Plan summary: $%.2f", premium)
+                        break
             
             # If still 999.99, something is wrong
             if premium == 999.99:
                 self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Could not find premium with any strategy - using fallback")
                 # Check for "free" text as last resort
-                try:
-                    body_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-                    if "free" in body_text or "$0" in body_text:
-                        premium = 0.00
-                except:
-                    pass
+                if page["free"]:
+                    premium = 0.00
             
             # Find plan name
-            plan_elements = self.driver.find_elements(
-                By.XPATH,
-                "//h3 | //h4 | //div[contains(@class, 'plan-name')]"
-            )
-            
-            for elem in plan_elements:
-                text = elem.text.strip()
+            for text in page["planNames"]:
                 if text and len(text) > 5 and "plan" not in text.lower():
                     plan_name = text[:50]  # Truncate long names
                     break
             
-            self.logger.info(f"Ã°Å¸â€œÅ  Plan detected: {carrier} - {plan_name} @ ${premium:.2f}/mo")
+            self.logger.info("Ã°Å¸â€œÅ  Plan detected: %s - %s @ $%.2f/mo", carrier, plan_name, premium)
             return (carrier, plan_name, premium)
         
         except Exception as e:
-            self.logger.error(f"Error extracting plan info: {e}")
+            self.logger.error("Error extracting plan info: %s", e)
             return ("unknown", "unknown", 999.99)
 
     def get_current_plan_premium_from_summary(self) -> Tuple[float, str]:
@@ -2013,101 +2331,65 @@ class HealthInsuranceRenewalBot:
         """
         # Check premium first
         if premium != 0.00:
-            self.logger.warning(f"Ã¢Å¡Â Ã¯Â¸Â Plan is ${premium:.2f} (not $0.00) - will NOT enroll")
+            self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Plan is $%.2f (not $0.00) - will NOT enroll", premium)
             return False
         
         # Check if carrier is approved
         carrier_lower = carrier.lower().strip()
         
-        # Handle carrier name variations
-        carrier_approved = False
-        for approved in self.approved_carriers:
-            if approved in carrier_lower or carrier_lower in approved:
-                carrier_approved = True
-                break
+        # Exact hit first (extract_plan_info already reduces carriers to a first word or "blue"),
+        # then handle carrier name variations
+        carrier_approved = (
+            carrier_lower in self.approved_carriers
+            or bool(self._approved_carrier_re.search(carrier_lower))
+            or any(carrier_lower in approved for approved in self.approved_carriers)
+        )
         
         if carrier_approved:
-            self.logger.info(f"Ã¢Å“â€¦ Plan is $0.00 AND carrier '{carrier}' is APPROVED - ENROLLING")
+            self.logger.info("Ã¢Å“â€¦ Plan is $0.00 AND carrier '%s' is APPROVED - ENROLLING", carrier)
             return True
         else:
-            self.logger.warning(f"Ã¢Å¡Â Ã¯Â¸Â Plan is $0.00 but carrier '{carrier}' is NOT APPROVED - will search alternatives")
+            self.logger.warning("Ã¢Å¡Â Ã¯Â¸Â Plan is $0.00 but carrier '%s' is NOT APPROVED - will search alternatives", carrier)
             return False
             
     def _handle_replace_plan_confirmation(self):
         """Handle 'You already have a health plan in your cart' dialog."""
         try:
             logging.info("ðŸ”„ Checking for replace plan confirmation...")
-            time.sleep(0.75)
             
-            # Look for "Yes, replace with this plan" button
-            replace_selectors = [
-                (By.XPATH, "//button[normalize-space()='Yes, replace with this plan']"),
-                (By.CSS_SELECTOR, "button._mediumRoyal_lkqwb_81"),
-                (By.XPATH, "//button[contains(text(), 'replace')]"),
-            ]
-            
-            for by, selector in replace_selectors:
-                try:
-                    replace_btn = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                        replace_btn
-                    )
-                    time.sleep(0.5)
-                    try:
-                        replace_btn.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", replace_btn)
-                    
-                    logging.info("âœ… Clicked 'Yes, replace with this plan'")
-                    time.sleep(0.75)
-                    return True
-                except TimeoutException:
-                    continue
+            # Look for "Yes, replace with this plan" button (generic selectors only after the specific one)
+            _, _, replace_btn = self._find_first_staged(
+                self.REPLACE_PLAN_SELECTORS, self.REPLACE_PLAN_FALLBACKS, timeout=3, clickable=True
+            )
+            if replace_btn is not None:
+                self._click_and_wait(replace_btn)
+                
+                logging.info("âœ… Clicked 'Yes, replace with this plan'")
+                return True
             
             logging.debug("No replace confirmation found")
             return False
             
         except Exception as e:
-            logging.debug(f"Replace confirmation: {str(e)[:50]}")
+            logging.debug("Replace confirmation: %s", str(e)[:50])
             return False
 
     def _close_silver_popup(self):
         """Close 'Save more with Silver!' popup if it appears."""
         try:
-            # Look for "No thanks, continue with this plan" button
-            no_thanks_selectors = [
-                (By.XPATH, "//button[normalize-space()='No thanks, continue with this plan']"),
-                (By.XPATH, "//button[contains(text(), 'No thanks')]"),
-                (By.CSS_SELECTOR, "button.MuiButton-outlined"),
-                (By.ID, "mui-376"),  # Dynamic ID but worth trying
-            ]
-            
-            for by, selector in no_thanks_selectors:
-                try:
-                    no_thanks_btn = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                        no_thanks_btn
-                    )
-                    time.sleep(0.5)
-                    try:
-                        no_thanks_btn.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", no_thanks_btn)
-                    
-                    logging.info("âœ… Closed 'Save more with Silver!' popup")
-                    time.sleep(0.75)
-                    return True
-                except TimeoutException:
-                    continue
+            # Look for "No thanks, continue with this plan" button (generic selectors only after the specific ones)
+            _, _, no_thanks_btn = self._find_first_staged(
+                self.SILVER_NO_THANKS_SELECTORS, self.SILVER_NO_THANKS_FALLBACKS, timeout=2, clickable=True
+            )
+            if no_thanks_btn is not None:
+                self._click_and_wait(no_thanks_btn)
+                
+                logging.info("âœ… Closed 'Save more with Silver!' popup")
+                return True
+            return False
 
         except Exception as e:
-            logging.debug(f"No Silver popup found: {str(e)[:50]}")
+            logging.debug("No Silver popup found: %s", str(e)[:50])
             return False
 
     def _handle_cart_dialog(self):
@@ -2115,50 +2397,26 @@ class HealthInsuranceRenewalBot:
         try:
             logging.info("ðŸ›’ Checking for cart dialog...")
             
-            # Wait for cart dialog to appear
-            time.sleep(0.75)
+            # Give the cart dialog up to 0.75 s to appear (returns as soon as its text renders)
+            cart_text_locator = (By.XPATH, "//*[contains(text(), 'Cart') or contains(text(), 'shopping')]")
+            self._wait_until(EC.presence_of_element_located(cart_text_locator), timeout=0.75, poll=0.1)
             
-            # Look for "Continue" button in cart dialog
-            continue_selectors = [
-                (By.XPATH, "//button[normalize-space()='Continue']"),
-                (By.CSS_SELECTOR, "button.MuiButton-containedPrimary"),
-                (By.XPATH, "//div[contains(@class, 'MuiDialog')]//button[contains(text(), 'Continue')]"),
-            ]
-            
-            for by, selector in continue_selectors:
-                try:
-                    continue_btn = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    
-                    # Check if this is the cart dialog (not other Continue buttons)
-                    try:
-                        # Verify cart-related text is visible
-                        cart_text = self.driver.find_element(By.XPATH, "//*[contains(text(), 'Cart') or contains(text(), 'shopping')]")
-                        if cart_text:
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                                continue_btn
-                            )
-                            time.sleep(0.5)
-                            try:
-                                continue_btn.click()
-                            except:
-                                self.driver.execute_script("arguments[0].click();", continue_btn)
-                            
-                            logging.info("âœ… Clicked Continue in cart dialog")
-                            time.sleep(0.75)
-                            return True
-                    except:
-                        pass
-                except TimeoutException:
-                    continue
+            # Look for "Continue" button in cart dialog (generic MUI button only after the specific ones)
+            _, _, continue_btn = self._find_first_staged(
+                self.CART_CONTINUE_SELECTORS, self.CART_CONTINUE_FALLBACKS, timeout=3, clickable=True
+            )
+            # Check if this is the cart dialog (not other Continue buttons)
+            if continue_btn is not None and self.driver.find_elements(*cart_text_locator):
+                self._click_and_wait(continue_btn)
+                
+                logging.info("âœ… Clicked Continue in cart dialog")
+                return True
             
             logging.debug("No cart dialog found")
             return False
             
         except Exception as e:
-            logging.debug(f"Cart dialog handling: {str(e)[:50]}")
+            logging.debug("Cart dialog handling: %s", str(e)[:50])
             return False
 
     def _close_popups(self):
@@ -2187,16 +2445,29 @@ class HealthInsuranceRenewalBot:
                     pass
         
         except Exception as e:
-            self.logger.debug(f"No popups to close: {e}")
+            self.logger.debug("No popups to close: %s", e)
+
+    def _dismiss_known_dialogs(self) -> Optional[str]:
+        """Dismiss whichever known plan dialog is open, in one probe; returns its kind or None."""
+        try:
+            hit = self.driver.execute_script(DISMISS_DIALOGS_JS)
+        except JavascriptException as e:
+            logging.debug("Dialog sweep failed: %s", str(e)[:60])
+            return None
+        if not hit:
+            return None
+        kind, button = hit
+        logging.info("Dismissed %s dialog", kind)
+        self._wait_until(EC.staleness_of(button), timeout=2, poll=0.1)
+        return kind
 
     def click_enroll_in_this_plan(self) -> bool:
         """Click enrollment button after handling all popups."""
         try:
             logging.info("ðŸ”˜ Attempting to click enrollment button...")
             
-            # NEW: Close any blocking popups first
-            self._close_silver_popup()
-            time.sleep(0.75)
+            # Close any blocking popup first: one probe, no wait when nothing is open
+            self._dismiss_known_dialogs()
             
             # Then look for enrollment button
             button_selectors = [
@@ -2221,11 +2492,11 @@ class HealthInsuranceRenewalBot:
             
             for by, selector in button_selectors:
                 try:
-                    btn = WebDriverWait(self.driver, 3).until(
+                    btn = self._wait(3).until(
                         EC.element_to_be_clickable((by, selector))
                     )
-                    btn.click()
-                    logging.info(f"âœ… Clicked enrollment button: {selector}")
+                    self._click_smart(btn)
+                    logging.info("âœ… Clicked enrollment button: %s", selector)
                     time.sleep(0.75)
                     return True
                 except TimeoutException:
@@ -2234,59 +2505,29 @@ class HealthInsuranceRenewalBot:
             logging.error("âŒ No enrollment button found")
             return False
             
-            # STEP 3: Check if cart modal is open
-            try:
-                cart_modal = self.driver.find_element(By.XPATH, "//div[contains(text(), 'Cart')]")
-                if cart_modal.is_displayed():
-                    self.logger.info("Ã°Å¸â€œâ€¹ Cart modal detected - clicking Continue")
-                    
-                    continue_button = self.driver.find_element(
-                        By.XPATH,
-                        "//button[contains(text(), 'Continue')] | "
-                        "//button[contains(text(), 'Keep shopping')]"
-                    )
-                    continue_button.click()
-                    time.sleep(0.75)  # +0.2s buffer
-                    
-                    # Now try enrolling again
-                    enroll_button = self.driver.find_element(
-                        By.XPATH,
-                        "//button[contains(text(), 'Enroll in this plan')]"
-                    )
-                    enroll_button.click()
-                    self.logger.info("Ã¢Å“â€¦ Clicked 'Enroll in this plan' after closing cart")
-                    return True
-            except:
-                pass
-            
-            logging.error("âŒ 'Enroll in this plan' button not found")
-            return False
-            
         except Exception as e:
-            logging.error(f"âŒ Error clicking Enroll: {str(e)}")
+            logging.error("âŒ Error clicking Enroll: %s", str(e))
             return False
 
     def wait_for_signature_processing_adaptive(self, max_wait=11):
         """
         OPTIMIZATION: Wait for signature to process with early exit.
         Instead of always waiting 11s, poll for completion.
+        Not called anywhere; the live signature step (_do_signature) has its own wait.
         """
-        logging.info(f"â³ Waiting for signature page to process (max {max_wait}s)...")
-        start_time = time.time()
+        logging.info("â³ Waiting for signature page to process (max %ss)...", max_wait)
+        start_time = time.monotonic()
         
-        while time.time() - start_time < max_wait:
-            try:
-                # Check if we're on the next page (followups check)
-                self.driver.find_element(By.ID, "followups_review")
-                elapsed = time.time() - start_time
-                logging.info(f"âœ… Signature processed in {elapsed:.1f}s (early exit)")
-                return True
-            except NoSuchElementException:
-                # Not there yet, keep waiting
-                time.sleep(0.5)
+        # Next page (followups check) reached? Polled at 100 ms so we exit right after it renders
+        if self._wait_until(
+            EC.presence_of_element_located((By.ID, "followups_review")), timeout=max_wait, poll=0.1
+        ):
+            elapsed = time.monotonic() - start_time
+            logging.info("âœ… Signature processed in %.1fs (early exit)", elapsed)
+            return True
         
         # Timeout reached
-        logging.info(f"âœ… Signature step completed after full {max_wait}s")
+        logging.info("âœ… Signature step completed after full %ss", max_wait)
         return True
     
     def wait_for_congratulations_page(self):
@@ -2298,12 +2539,9 @@ class HealthInsuranceRenewalBot:
             
             # Wait for "Congratulations" text
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((
-                        By.XPATH,
-                        "//*[contains(text(), 'Congratulations') or contains(text(), 'Success') or contains(text(), 'enrolled')]"
-                    ))
-                )
+                # Arm (and reset) the page-side observer, then poll its flag cheaply
+                self.driver.execute_script(CONGRATS_WATCH_JS, True)
+                self._wait(10, 0.2).until(lambda d: d.execute_script(CONGRATS_WATCH_JS, False))
                 self.logger.info("ðŸŽ‰ Congratulations page detected!")
                 time.sleep(0.75)  # Let page fully render (+0.2s buffer)
                 return True
@@ -2312,7 +2550,7 @@ class HealthInsuranceRenewalBot:
                 return False
                 
         except Exception as e:
-            self.logger.error(f"âŒ Error waiting for Congratulations: {str(e)}")
+            self.logger.error("âŒ Error waiting for Congratulations: %s", str(e))
             return False
 
     def check_for_family_policy(self) -> bool:
@@ -2322,21 +2560,39 @@ class HealthInsuranceRenewalBot:
         except Exception:
             return False
 
+    @staticmethod
+    def _write_screenshot(filename: Path, data: bytes):
+        """Write-then-rename so a crash never leaves a truncated image behind (runs on IO_POOL)."""
+        try:
+            tmp = filename.with_name(filename.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, filename)
+            logging.info("Ã°Å¸â€œÂ¸ Saved screenshot: %s", filename)
+        except OSError as e:
+            logging.warning("Failed to save screenshot %s: %s", filename, e)
+
     def _screenshot_error(self, name: str):
+        """Save a JPEG of the current viewport (encoded in the browser via CDP; PNG fallback)."""
         try:
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = ERROR_SCREENSHOT_DIR / f"{ts}_{name}.png"
-            self.driver.save_screenshot(str(filename))
-            logging.info(f"Ã°Å¸â€œÂ¸ Saved screenshot: {filename}")
+            try:
+                shot = self.driver.execute_cdp_cmd(
+                    "Page.captureScreenshot", {"format": "jpeg", "quality": SCREENSHOT_JPEG_QUALITY}
+                )
+                data, suffix = base64.b64decode(shot["data"]), ".jpg"
+            except WebDriverException:
+                data, suffix = self.driver.get_screenshot_as_png(), ".png"
+            filename = ERROR_SCREENSHOT_DIR / f"{ts}_{name}{suffix}"
+            IO_POOL.submit(self._write_screenshot, filename, data)
         except Exception as e:
-            logging.warning(f"Failed to take screenshot: {e}")
+            logging.warning("Failed to take screenshot: %s", e)
 
-    def process_client(self, client: ClientData) -> str:
+    def process_client(self, client: ClientData) -> ClientStatus:
         """Main workflow for processing a single client renewal."""
         client.timestamp_start = datetime.now(timezone.utc).isoformat()
         client.status = ClientStatus.IN_PROGRESS
         logging.info("\n" + "=" * 60)
-        logging.info(f"Ã°Å¸Å¡â‚¬ Processing: {client.full_name} (Row {client.row_index})")
+        logging.info("Ã°Å¸Å¡â‚¬ Processing: %s (Row %s)", client.full_name, client.row_index)
         logging.info("=" * 60)
 
         try:
@@ -2349,7 +2605,7 @@ class HealthInsuranceRenewalBot:
             try:
                 self.driver.switch_to.window(self.main_tab_handle)
             except Exception as e:
-                logging.critical(f"Ã¢ÂÅ’ Could not switch to main tab: {e}")
+                logging.critical("Ã¢ÂÅ’ Could not switch to main tab: %s", e)
                 client.status = ClientStatus.ERROR
                 client.error_message = "Could not switch to main tab"
                 return client.status
@@ -2357,30 +2613,12 @@ class HealthInsuranceRenewalBot:
                 
                 # CRITICAL: Hide the row so bot doesn't see it again
           
-            self.state.wait_if_paused()
-            if self.state.check_stopped():
-                logging.critical("Stopped by user")
-                client.status = ClientStatus.ERROR
-                client.error_message = "Stopped by user"
-                return client.status
-            
             # FIX: Initialize same_tab early to prevent NameError
             same_tab = False  # Will be set properly after tab detection
-                
-            # NEW: Add this block after EVERY stop check
-            if self.state.check_skip():
-                logging.warning(f"Ã¢ÂÂ­Ã¯Â¸Â Skipping {client.full_name} (user requested)")
-                client.status = ClientStatus.ERROR
-                client.error_message = "Skipped by user"
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
-                return client.status
+
+            action = self.state.control_check()
+            if action != ControlAction.CONTINUE:
+                return self._apply_control_action(action, client, same_tab)
 
             self.click_advanced_actions(client.row_index)
             new_handle, opened_in_new_tab = self.open_renew_in_new_tab()
@@ -2388,9 +2626,9 @@ class HealthInsuranceRenewalBot:
             if opened_in_new_tab and new_handle:
                 try:
                     self.driver.switch_to.window(new_handle)
-                    logging.info(f"Ã¢Å“â€¦ Switched to renewal tab {new_handle}")
+                    logging.info("Ã¢Å“â€¦ Switched to renewal tab %s", new_handle)
                 except Exception as e:
-                    logging.error(f"Ã¢ÂÅ’ Could not switch to new tab: {e}")
+                    logging.error("Ã¢ÂÅ’ Could not switch to new tab: %s", e)
                     client.status = ClientStatus.ERROR
                     client.error_message = f"Could not switch to new tab: {e}"
                     self._cleanup_non_main_tabs()
@@ -2403,17 +2641,10 @@ class HealthInsuranceRenewalBot:
             try:
                 self.click_continue_with_plan()
             except TimeoutException as e:
-                logging.error(f"Ã¢ÂÅ’ Continue with plan didn't appear: {e}")
+                logging.error("Ã¢ÂÅ’ Continue with plan didn't appear: %s", e)
                 self._screenshot_error(client.full_name.replace(" ", "_"))
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                        logging.info("Ã°Å¸â€â„¢ Navigated back to client list (same-tab fallback)")
-                    except Exception:
-                        logging.critical("Could not navigate back to client list")
-                else:
-                    self._cleanup_non_main_tabs()
+                if not self._abandon_client_tab(same_tab):
+                    logging.critical("Could not navigate back to client list")
                 client.status = ClientStatus.ERROR
                 client.error_message = "Continue with plan missing"
                 return client.status
@@ -2422,25 +2653,22 @@ class HealthInsuranceRenewalBot:
             try:
                 self.handle_consent_page()
             except Exception as e:
-                logging.warning(f"Consent handling failed: {e}")
+                logging.warning("Consent handling failed: %s", e)
             self._screenshot_error("consent_" + client.full_name.replace(" ", "_"))
             
             # ===== SIMPLIFIED FLOW - NO PATH DETECTION =====
             logging.info("âœ… Consent completed - proceeding to summary pages")
-            time.sleep(5.0)  # Wait for Primary Contact Summary to load
+            self._wait_page_ready_and_clickable(NEXT_BUTTON_LOCATOR)  # Primary Contact Summary
 
                         # PRIMARY CONTACT SUMMARY
             logging.info("ðŸ“‹ Primary Contact Summary - detecting gender and clicking Continue...")
-            try:
+            with self._client_step_guard(client, same_tab, "Primary Contact Summary"):
                 # Wait for page to load
-                btn = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
+                btn = self._get_next_btn(timeout=10)
                 
                 # CRITICAL: Detect gender BEFORE clicking Continue
                 try:
                     logging.info("ðŸ” Detecting gender from Primary Contact Summary table...")
-                    time.sleep(0.75)
                     
                     # Find the Sex cell (3rd column in tbody)
                     sex_cell = self.driver.find_element(
@@ -2456,66 +2684,37 @@ class HealthInsuranceRenewalBot:
                         client.is_female = False
                         logging.info("ðŸ‘¨ Detected MALE from table")
                     else:
-                        logging.warning(f"âš ï¸ Unknown gender: '{sex_text}' - defaulting to male")
+                        logging.warning("âš ï¸ Unknown gender: '%s' - defaulting to male", sex_text)
                         client.is_female = False
                         
                 except Exception as gender_err:
-                    logging.error(f"âŒ Gender detection failed: {str(gender_err)[:80]}")
+                    logging.error("âŒ Gender detection failed: %s", str(gender_err)[:80])
                     client.is_female = False  # Default to male
             
                 # NOW click Continue
+                sig = self._page_signature()
                 btn.click()
                 logging.info("âœ… Clicked Continue on Primary Contact Summary")
-                time.sleep(2.25)
-            except Exception as e:
-                logging.error(f"âŒ Failed on Primary Contact Summary: {e}")
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
-                client.status = ClientStatus.ERROR
-                client.error_message = "Primary Contact Summary failed"
-                return client.status
+                self._wait_page_ready_and_clickable(NEXT_BUTTON_LOCATOR, signature=sig)
 
             # HOUSEHOLD SUMMARY  
             logging.info("ðŸ“‹ Household Summary - clicking Continue...")
-            try:
-                btn = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                btn.click()
+            with self._client_step_guard(client, same_tab, "Household Summary"):
+                sig = self._page_signature()
+                self._click_when_ready(NEXT_BUTTON_CSS, timeout=10)
                 logging.info("âœ… Clicked Continue on Household Summary")
-                time.sleep(2.25)
-            except Exception as e:
-                logging.error(f"âŒ Failed on Household Summary: {e}")
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
-                client.status = ClientStatus.ERROR
-                client.error_message = "Household Summary failed"
-                return client.status
+                self._wait_page_ready_and_clickable(NEXT_BUTTON_LOCATOR, signature=sig)
                         
             # After Household Summary, around line 2490
             logging.info("✅ Clicked Continue on Household Summary")
-            time.sleep(2.25)
 
             # ==================================
             # OTHER RELATIONSHIPS PAGE
             # ==================================
             logging.info("📋 Other Relationships page - clicking Continue...")
             try:
-                time.sleep(0.75)
                 
-                relationships_heading = WebDriverWait(self.driver, 5).until(
+                relationships_heading = self._wait(5).until(
                     EC.presence_of_element_located((
                         By.XPATH,
                         "//*[contains(text(), 'Other relationships') or " +
@@ -2525,12 +2724,9 @@ class HealthInsuranceRenewalBot:
                 logging.info("✅ Found 'Other Relationships' page")
                 
                 # Just click Continue - answer is already selected
-                continue_btn = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                continue_btn.click()
+                continue_btn = self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
                 logging.info("✅ Clicked Continue on Other Relationships page")
-                time.sleep(0.75)
+                self._wait_until(EC.staleness_of(continue_btn), timeout=3)
                 
             except TimeoutException:
                 logging.debug("ℹ️ Other Relationships page not found - may be skipped")
@@ -2539,17 +2735,14 @@ class HealthInsuranceRenewalBot:
             # APPLICANTS PAGE (citizenship questions)
             # ==================================
             logging.info("📋 Applicants page (citizenship questions) - waiting...")
-            time.sleep(2.25)  # Wait for auto-answers
+            self._wait_page_ready_and_clickable(NEXT_BUTTON_LOCATOR)  # Wait for auto-answers
 
             try:
-                btn = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                btn.click()
+                btn = self._click_when_ready(NEXT_BUTTON_CSS, timeout=10)
                 logging.info("✅ Clicked Continue on Applicants")
-                time.sleep(0.75)
+                self._wait_until(EC.staleness_of(btn), timeout=3)
             except Exception as e:
-                logging.warning(f"⚠️ Applicants Continue failed: {str(e)}")
+                logging.warning("⚠️ Applicants Continue failed: %s", str(e))
 
             # ==================================
             # PREGNANCY QUESTION (for females only)
@@ -2557,10 +2750,9 @@ class HealthInsuranceRenewalBot:
             if client.is_female:
                 try:
                     logging.info("🤰 Handling pregnancy question for female client...")
-                    time.sleep(0.75)
                     
                     # Check if pregnancy question exists
-                    pregnancy_heading = WebDriverWait(self.driver, 5).until(
+                    pregnancy_heading = self._wait(5).until(
                         EC.presence_of_element_located((
                             By.XPATH,
                             "//*[contains(text(), 'pregnant') or contains(text(), 'Pregnant')]"
@@ -2569,7 +2761,7 @@ class HealthInsuranceRenewalBot:
                     logging.info("✅ Found pregnancy question")
                     
                     # Click "No" for pregnancy
-                    no_btn = WebDriverWait(self.driver, 3).until(
+                    no_btn = self._wait(3).until(
                         EC.element_to_be_clickable((
                             By.XPATH,
                             "//button[@role='radio' and @aria-label='No']"
@@ -2577,15 +2769,11 @@ class HealthInsuranceRenewalBot:
                     )
                     no_btn.click()
                     logging.info("✅ Clicked 'No' for pregnancy question")
-                    time.sleep(0.75)
                     
                     # Click Continue
-                    continue_btn = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                    )
-                    continue_btn.click()
+                    continue_btn = self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
                     logging.info("✅ Clicked Continue after pregnancy question")
-                    time.sleep(0.75)
+                    self._wait_until(EC.staleness_of(continue_btn), timeout=3)
                     
                 except TimeoutException:
                     logging.debug("ℹ️ Pregnancy question not found")            
@@ -2600,49 +2788,34 @@ class HealthInsuranceRenewalBot:
             # Around line 2610 in process_client method:
             logging.info("💰 Checking if we need to edit income...")
 
-            try:
-                income_heading = self.driver.find_element(
-                    By.XPATH,
-                    "//*[contains(text(), 'Income') or contains(text(), 'income')]"
-                )
-                if income_heading:
-                    logging.info("📊 Income page detected - editing income for $0 premiums")
-                    
-                    # Call the income edit method (use correct method name)
-                    if not self.handle_income_edit_and_verification():
-                        logging.error("❌ Income edit failed")
-                        client.status = ClientStatus.ERROR
-                        client.error_message = "Income edit failed"
-                        if same_tab:
-                            try:
-                                self.driver.back()
-                                time.sleep(0.75)
-                            except Exception:
-                                pass
-                        else:
-                            self._cleanup_non_main_tabs()
-                        return client.status
-                    
-                    logging.info("⚠️ Skip button disabled after income page - using long path")
-                    
-                    # Call the long path handler
-                    if not self.handle_long_path_with_income_edit(client):
-                        logging.error("❌ Long path failed")
-                        client.status = ClientStatus.ERROR
-                        client.error_message = "Long path after income edit failed"
-                        if same_tab:
-                            try:
-                                self.driver.back()
-                                time.sleep(0.75)
-                            except Exception:
-                                pass
-                        else:
-                            self._cleanup_non_main_tabs()
-                        return client.status
-                    
-                    # After long path, continue with signature and rest of flow
-                    
-            except NoSuchElementException:
+            income_headings = self.driver.find_elements(
+                By.XPATH,
+                "//*[contains(text(), 'Income') or contains(text(), 'income')]"
+            )
+            if income_headings:
+                logging.info("📊 Income page detected - editing income for $0 premiums")
+                
+                # Call the income edit method (use correct method name)
+                if not self.handle_income_edit_and_verification():
+                    logging.error("❌ Income edit failed")
+                    client.status = ClientStatus.ERROR
+                    client.error_message = "Income edit failed"
+                    self._abandon_client_tab(same_tab)
+                    return client.status
+                
+                logging.info("⚠️ Skip button disabled after income page - using long path")
+                
+                # Call the long path handler
+                if not self.handle_long_path_with_income_edit(client):
+                    logging.error("❌ Long path failed")
+                    client.status = ClientStatus.ERROR
+                    client.error_message = "Long path after income edit failed"
+                    self._abandon_client_tab(same_tab)
+                    return client.status
+                
+                # After long path, continue with signature and rest of flow
+                
+            else:
                 # Not on income page, check for skip button normally
                 logging.info("📋 Not on income page - checking for skip button...")
                 skip_found = self.click_skip_to_end()
@@ -2653,20 +2826,16 @@ class HealthInsuranceRenewalBot:
             # ===================================
             
             logging.info("ðŸ“‹ Applicants page (citizenship questions) - waiting...")
-            time.sleep(2.25)  # Wait for page to load and questions to be auto-answered
+            self._wait_page_ready_and_clickable(NEXT_BUTTON_LOCATOR)  # Questions are auto-answered
             
             # Click Continue on Applicants page
             logging.info("ðŸ“‹ Clicking Continue on Applicants (citizenship)...")
             try:
-                btn = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                btn.click()
+                btn = self._click_when_ready(NEXT_BUTTON_CSS, timeout=10)
                 logging.info("âœ… Clicked Continue on Applicants")
-                time.sleep(0.75)
+                self._wait_until(EC.staleness_of(btn), timeout=3)
             except Exception as e:
-                logging.warning(f"âš ï¸ Applicants Continue failed: {str(e)}")
-                time.sleep(0.75)
+                logging.warning("âš ï¸ Applicants Continue failed: %s", str(e))
 
             # ========================================
             # PREGNANCY + FOSTER CARE (SAME PAGE for females!)
@@ -2675,11 +2844,13 @@ class HealthInsuranceRenewalBot:
             if client.is_female:
                 try:
                     logging.info("ðŸ¤° Handling pregnancy/foster care questions for female client...")
-                    time.sleep(0.75)  # Wait for followup page to load
+                    
+                    no_radio = (By.XPATH, "//button[@role='radio' and @aria-label='No']")
+                    no_buttons = []
                     
                     # STEP 1: Answer pregnancy question
                     try:
-                        pregnancy_heading = WebDriverWait(self.driver, 5).until(
+                        pregnancy_heading = self._wait(5).until(
                             EC.presence_of_element_located((
                                 By.XPATH,
                                 "//*[contains(text(), 'pregnant') or contains(text(), 'Pregnant')]"
@@ -2689,26 +2860,12 @@ class HealthInsuranceRenewalBot:
                         
                         # Click "No" for pregnancy
                         try:
-                            no_btn = WebDriverWait(self.driver, 3).until(
-                                EC.element_to_be_clickable((
-                                    By.XPATH,
-                                    "//button[@role='radio' and @aria-label='No']"
-                                ))
-                            )
-                            
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView({block: 'center'});",
-                                no_btn
-                            )
-                            time.sleep(0.5)
-                            
-                            try:
-                                no_btn.click()
-                            except:
-                                self.driver.execute_script("arguments[0].click();", no_btn)
-                            
+                            self._wait(3).until(EC.element_to_be_clickable(no_radio))
+                            # One query serves both questions: [0] is pregnancy, [1] is foster care
+                            no_buttons = self.driver.find_elements(*no_radio)
+                            self._click_smart(no_buttons[0])
+
                             logging.info("âœ… Clicked 'No' for pregnancy question")
-                            time.sleep(0.75)
                             
                         except TimeoutException:
                             logging.warning("âš ï¸ 'No' button not found - may already be selected")
@@ -2717,305 +2874,89 @@ class HealthInsuranceRenewalBot:
                         logging.debug("â„¹ï¸ Pregnancy question not found")
                     
                     # STEP 2: Look for foster care question ON SAME PAGE
-                    try:
-                        foster_heading = self.driver.find_element(
-                            By.XPATH,
-                            "//*[contains(text(), 'foster care') or contains(text(), 'Foster')]"
-                        )
+                    foster_headings = self.driver.find_elements(
+                        By.XPATH,
+                        "//*[contains(text(), 'foster care') or contains(text(), 'Foster')]"
+                    )
+                    if foster_headings:
                         logging.info("âœ… Found foster care question (same page)")
-                        
-                        # Find the SECOND "No" button (first is pregnancy, second is foster)
-                        no_buttons = self.driver.find_elements(
-                            By.XPATH,
-                            "//button[@role='radio' and @aria-label='No']"
-                        )
-                        
+                    
+                        # Reuse the radios found for pregnancy; query only if that step didn't run
+                        if not no_buttons:
+                            no_buttons = self.driver.find_elements(*no_radio)
+                    
                         if len(no_buttons) >= 2:
-                            foster_no_btn = no_buttons[1]  # Second "No" button
-                            
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView({block: 'center'});",
-                                foster_no_btn
-                            )
-                            time.sleep(0.5)
-                            
-                            try:
-                                foster_no_btn.click()
-                            except:
-                                self.driver.execute_script("arguments[0].click();", foster_no_btn)
-                            
+                            self._click_smart(no_buttons[1])  # Second "No" button
+                        
                             logging.info("âœ… Clicked 'No' for foster care question")
                             time.sleep(0.75)
                         else:
                             logging.debug("â„¹ï¸ Only one 'No' button found - foster care may be optional")
-                            
-                    except NoSuchElementException:
-                        logging.debug("â„¹ï¸ Foster care question not found on this page")
-                    
-                    # STEP 3: NOW click Continue to move to next page
-                    try:
-                        continue_btn = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                        )
-                        
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({block: 'center'});",
-                            continue_btn
-                        )
-                        time.sleep(0.5)
-                        
-                        try:
-                            continue_btn.click()
-                        except:
-                            self.driver.execute_script("arguments[0].click();", continue_btn)
-                        
-                        logging.info("âœ… Clicked Continue after pregnancy/foster questions")
-                        time.sleep(0.75)
-                        
-                    except TimeoutException:
-                        logging.warning("âš ï¸ Continue button not found after pregnancy page")
-                        
-                except Exception as e:
-                    logging.warning(f"âš ï¸ Pregnancy/foster page handling failed: {str(e)[:60]}")
-
-            # ========================================
-            # NOW CHECK FOR SKIP BUTTON
-            # Should be on Income or Additional Questions page now
-            # ========================================
-            logging.info("ðŸ” Checking for 'Skip to the end' button...")
-            time.sleep(0.75)
-            
-            skip_found = False
-            try:
-                skip_btn = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable((
-                        By.XPATH,
-                        "//button[normalize-space()='Skip to the end'] | //button[contains(text(), 'Skip')]"
-                    ))
-                )
-                skip_btn.click()
-                logging.info("â© Clicked 'Skip to the end'")
-                skip_found = True
-                time.sleep(0.75)
-            except TimeoutException:
-                logging.info("ðŸ“‹ Skip button not found - taking LONG PATH")
-                
-            # SHORT PATH vs LONG PATH
-            if skip_found:
-                logging.info("ðŸš€ SHORT PATH: Skip button worked")
-                finalize_pages = ["Finalize 1", "Finalize 2", "Finalize 3"]
-                for page_name in finalize_pages:
-                    self.state.wait_if_paused()
-                    if self.state.check_stopped():
-                        client.status = ClientStatus.ERROR
-                        client.error_message = "Stopped by user"
-                        return client.status
-                    
-                    if self.state.check_skip():
-                        logging.warning(f"â­ï¸ Skipping {client.full_name} (user requested)")
-                        client.status = ClientStatus.ERROR
-                        client.error_message = "Skipped by user"
-                        if same_tab:
-                            try:
-                                self.driver.back()
-                                time.sleep(0.75)
-                            except Exception:
-                                pass
-                        else:
-                            self._cleanup_non_main_tabs()
-                        return client.status
-                    
-                    try:
-                        logging.info(f"ðŸ“„ {page_name} - clicking Continue...")
-                        time.sleep(0.75)
-                        self.click_continue()
-                    except Exception:
-                        logging.debug(f"{page_name} Continue not found")
-
-            # Continue with existing code (pregnancy questions, signature, etc.)
-            # FIXED: Removed duplicate pregnancy question handling that was causing issues
-            # Pregnancy question is already properly handled after Applicants page
-                
-            # ========================================
-            # PHASE 12: Skip Button OR Long Path
-            # ========================================
-            self.state.wait_if_paused()
-            if self.state.check_stopped():
-                client.status = ClientStatus.ERROR
-                client.error_message = "Stopped by user"
-                return client.status
-            
-            if self.state.check_skip():
-                logging.warning(f"Ã¢ÂÂ­Ã¯Â¸Â Skipping {client.full_name} (user requested)")
-                client.status = ClientStatus.SKIPPED_BY_USER
-                client.error_message = "Skipped by user"
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
-                return client.status
-    
-            # Try Skip button (2s max)
-            skip_worked = self.click_skip_to_end()
-            
-            if skip_worked:
-                # SHORT PATH
-                logging.info("Ã°Å¸Å¡â‚¬ SHORT PATH: Skip button worked")
-                time.sleep(0.75)
-                
-                finalize_pages = ["Finalize 1", "Finalize 2", "Finalize 3"]
-                for page_name in finalize_pages:
-                    self.state.wait_if_paused()
-                    if self.state.check_stopped():
-                        client.status = ClientStatus.ERROR
-                        client.error_message = "Stopped by user"
-                        return client.status
-                    
-                    if self.state.check_skip():
-                        logging.warning(f"Ã¢ÂÂ­Ã¯Â¸Â Skipping {client.full_name} (user requested)")
-                        client.status = ClientStatus.SKIPPED_BY_USER
-                        client.error_message = "Skipped by user"
-                        if same_tab:
-                            try:
-                                self.driver.back()
-                                time.sleep(0.75)
-                            except Exception:
-                                pass
-                        else:
-                            self._cleanup_non_main_tabs()
-                        return client.status
-                    
-                    try:
-                        logging.info(f"Ã°Å¸â€œâ€ž {page_name} - clicking Continue...")
-                        time.sleep(0.75)
-                        self.click_continue()
-                    except Exception:
-                        logging.debug(f"{page_name} Continue not found")
-            
-            
-            # Wait for signature page
-            logging.info("Ã¢ÂÂ³ Waiting for signature page to load...")
-            time.sleep(3.0)
-            
-            # Signature Page
-            self.state.wait_if_paused()
-            if self.state.check_stopped():
-                client.status = ClientStatus.ERROR
-                client.error_message = "Stopped by user"
-                return client.status
-            
-            if self.state.check_skip():
-                logging.warning(f"Ã¢ÂÂ­Ã¯Â¸Â Skipping {client.full_name} (user requested)")
-                client.status = ClientStatus.SKIPPED_BY_USER
-                client.error_message = "Skipped by user"
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
-                return client.status
-            
-            
-            # FIXED: Properly handle signature page - copy name and paste
-            try:
-                logging.info("✍️ Handling signature input...")
-                
-                # Look for signature input field
-                signature_input = None
-                try:
-                    signature_input = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((
-                            By.XPATH,
-                            "//input[@type='text' and (@id='signature' or contains(@name, 'signature') or contains(@placeholder, 'signature'))]"
-                        ))
-                    )
-                    logging.info("✅ Found signature input field")
-                except TimeoutException:
-                    logging.warning("⚠️ Signature input field not found - may not be needed")
-                
-                if signature_input:
-                    # Look for and click Copy button
-                    try:
-                        copy_button = WebDriverWait(self.driver, 3).until(
-                            EC.element_to_be_clickable((
-                                By.XPATH,
-                                "//button[contains(@aria-label, 'copy') or contains(@aria-label, 'Copy') or contains(text(), 'Copy')]"
-                            ))
-                        )
                         
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({block: 'center'});",
-                            copy_button
-                        )
-                        time.sleep(0.5)
-                        
-                        try:
-                            copy_button.click()
-                        except:
-                            self.driver.execute_script("arguments[0].click();", copy_button)
-                        
-                        logging.info("📋 Clicked Copy button")
-                        time.sleep(0.75)
-                        
-                    except TimeoutException:
-                        logging.info("ℹ️ Copy button not found - will type name directly")
-                    
-                    # Clear and focus the signature field
-                    try:
-                        signature_input.clear()
-                        signature_input.click()
-                        time.sleep(0.5)
-                    except:
-                        self.driver.execute_script("arguments[0].focus();", signature_input)
-                    
-                    # Try to paste or type the signature
-                    try:
-                        signature_input.send_keys(Keys.CONTROL, 'v')
-                        logging.info("📝 Pasted signature")
-                    except:
-                        # Fallback: type the name
-                        signature_input.send_keys(client.full_name)
-                        logging.info("📝 Typed signature manually")
-                    
-                    time.sleep(0.75)
-                    
-                    # Verify signature was entered
-                    sig_value = signature_input.get_attribute('value')
-                    if sig_value and len(sig_value) > 2:
-                        logging.info(f"✅ Signature entered: {sig_value[:20]}...")
-                    
-            except Exception as e:
-                logging.warning(f"⚠️ Signature input handling error: {str(e)[:60]}")
-            # Click Continue after signature
-            try:
-                time.sleep(0.75)
-                continue_btn = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                continue_btn.click()
-                logging.info("âœ… Clicked Continue after signature")
-                time.sleep(5.0)  # Wait for eligibility page
-            except Exception as e:
-                logging.warning(f"âš ï¸ Could not click Continue after signature: {str(e)[:60]}")
+                    else:
+                        logging.debug("â„¹ï¸ Foster care question not found on this page")
+                    
+                    # STEP 3: NOW click Continue to move to next page
+                    try:
+                        continue_btn = self._get_next_btn()
+                        
+                        self._click_smart(continue_btn)
+                        
+                        logging.info("âœ… Clicked Continue after pregnancy/foster questions")
+                        self._wait_until(EC.staleness_of(continue_btn), timeout=3)
+                        self._next_btn = None
+                        
+                    except TimeoutException:
+                        logging.warning("âš ï¸ Continue button not found after pregnancy page")
+                        
+                except Exception as e:
+                    logging.warning("âš ï¸ Pregnancy/foster page handling failed: %s", str(e)[:60])
+
+            # ========================================
+            # NOW CHECK FOR SKIP BUTTON
+            # Should be on Income or Additional Questions page now
+            # ========================================
+            logging.info("ðŸ” Checking for 'Skip to the end' button...")
+            
+            skip_found = self._try_skip(client, same_tab)
+            if not skip_found:
+                logging.info("ðŸ“‹ Skip button not found - taking LONG PATH")
+
+            # Continue with existing code (pregnancy questions, signature, etc.)
+            # FIXED: Removed duplicate pregnancy question handling that was causing issues
+            # Pregnancy question is already properly handled after Applicants page
+                
+            # ========================================
+            # PHASE 12: Skip Button OR Long Path
+            # ========================================
+            action = self.state.control_check()
+            if action != ControlAction.CONTINUE:
+                return self._apply_control_action(action, client, same_tab)
+    
+            # Try Skip button (2s max)
+            self._try_skip(client, same_tab)
+            
+            
+            # Wait for signature page
+            logging.info("Ã¢ÂÂ³ Waiting for signature page to load...")
+            time.sleep(3.0)
+            
+            # Signature Page
+            action = self.state.control_check()
+            if action != ControlAction.CONTINUE:
+                return self._apply_control_action(action, client, same_tab)
             
-            logging.info("âœ… Signature step completed successfully")
+            
+            self._do_signature(client)
 
             # NEW: Handle eligibility results page
             try:
                 logging.info("â³ Waiting for eligibility results page...")
-                time.sleep(0.75)
                 
                 # STEP 1: Wait for page to fully load
                 # Look for "Review eligibility results" heading
                 try:
-                    WebDriverWait(self.driver, 10).until(
+                    self._wait(NORMAL_TIMEOUT).until(
                         EC.presence_of_element_located((
                             By.XPATH,
                             "//*[contains(text(), 'Review eligibility results') or contains(text(), 'Eligibility Results')]"
@@ -3025,9 +2966,11 @@ class HealthInsuranceRenewalBot:
                 except TimeoutException:
                     logging.warning("âš ï¸ Could not confirm eligibility page - continuing anyway")
                 
-                time.sleep(1.5)  # Give page time to fully load for followups to appear
-                
-                time.sleep(1.5)  # Give page time to fully load for followups to appear
+                # Followups table renders after the heading
+                self._wait_until(
+                    EC.presence_of_element_located((By.XPATH, "//th[contains(text(), 'Followups')]")),
+                    timeout=FAST_TIMEOUT, poll=FAST_POLL
+                )
                 
                 # FIXED: Check followups FIRST on eligibility page (where they actually appear)
                 logging.info("🔍 Checking Followups cell on eligibility page...")
@@ -3039,90 +2982,34 @@ class HealthInsuranceRenewalBot:
                         # Could decide to skip or continue based on requirements
                         # For now, we'll continue but flag it
                 except Exception as e:
-                    logging.warning(f"⚠️ Followups check failed (non-fatal): {str(e)[:100]}")
+                    logging.warning("⚠️ Followups check failed (non-fatal): %s", str(e)[:100])
                 
                 # STEP 2: Download Eligibility Letter (AFTER checking followups)
                 logging.info("ðŸ“¥ Downloading eligibility letter...")
-                download_selectors = [
-                    (By.XPATH, "//button[normalize-space()='Download Eligibility Letter']"),
-                    (By.XPATH, "//button[contains(text(), 'Download Eligibility Letter')]"),
-                    (By.XPATH, "//a[contains(text(), 'Download Eligibility Letter')]"),
-                ]
-                
-                download_clicked = False
-                for by, selector in download_selectors:
-                    try:
-                        download_btn = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((by, selector))
-                        )
-                        # Scroll into view
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                            download_btn
-                        )
-                        time.sleep(0.5)
-                        
-                        # Click the button
-                        try:
-                            download_btn.click()
-                        except:
-                            self.driver.execute_script("arguments[0].click();", download_btn)
-                        
-                        logging.info("âœ… Clicked 'Download Eligibility Letter'")
-                        download_clicked = True
-                        break
-                    except TimeoutException:
-                        continue
-                
-                if not download_clicked:
-                    logging.warning("âš ï¸ Download button not found - continuing without download")
+                self.download_eligibility_letter()
                
-                # STEP 3: Wait 2 seconds before clicking Review plan...
-                logging.info("⏳ Waiting 2 seconds before clicking Review plan...")
-                time.sleep(1.5)
-
                 # STEP 4: Click "Review plan" button
                 logging.info("ðŸ” Looking for 'Review plan' button...")
-                review_plan_selectors = [
-                    (By.XPATH, "//button[normalize-space()='Review plan']"),
-                    (By.XPATH, "//button[contains(text(), 'Review plan')]"),
-                ]
-                
                 review_clicked = False
-                for by, selector in review_plan_selectors:
-                    try:
-                        review_btn = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((by, selector))
-                        )
-                        # Scroll into view
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                            review_btn
-                        )
-                        time.sleep(0.5)
-                        
-                        # Click the button
-                        try:
-                            review_btn.click()
-                        except:
-                            self.driver.execute_script("arguments[0].click();", review_btn)
-                        
-                        logging.info("âœ… Clicked 'Review plan' button")
-                        review_clicked = True
-                        break
-                    except TimeoutException:
-                        continue
+                try:
+                    review_btn = self._wait(NORMAL_TIMEOUT).until(
+                        EC.element_to_be_clickable((By.XPATH, self.REVIEW_PLAN_XPATH))
+                    )
+                    self._click_smart(review_btn)
+                    
+                    logging.info("âœ… Clicked 'Review plan' button")
+                    review_clicked = True
+                except TimeoutException:
+                    pass
                 
                 if not review_clicked:
                     logging.error("âŒ 'Review plan' button not found!")
                     return False
                 
                 # STEP 5: Wait for "Confirm your plan" page to load
-                time.sleep(0.75)
-                
                 # Verify we're on the enrollment page
                 try:
-                    WebDriverWait(self.driver, 5).until(
+                    self._wait(5).until(
                         EC.presence_of_element_located((
                             By.XPATH,
                             "//*[contains(text(), 'Confirm your plan') or contains(text(), 'Plan summary')]"
@@ -3133,7 +3020,7 @@ class HealthInsuranceRenewalBot:
                     logging.warning("âš ï¸ Could not confirm enrollment page")
                 
             except Exception as e:
-                logging.error(f"âŒ Error handling eligibility page: {str(e)}")
+                logging.error("âŒ Error handling eligibility page: %s", str(e))
                 return False
 
             # We are already on "Confirm your plan" â€“ DO NOT re-run eligibility logic here.
@@ -3143,14 +3030,7 @@ class HealthInsuranceRenewalBot:
                 logging.error("âŒ Page crashed on Confirm your plan")
                 client.status = ClientStatus.ERROR
                 client.error_message = "Page crashed on Confirm your plan"
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
+                self._abandon_client_tab(same_tab)
                 return client.status
 
 
@@ -3158,39 +3038,25 @@ class HealthInsuranceRenewalBot:
             try:
                 self.click_continue_with_plan()
             except TimeoutException as e:
-                logging.error(f"âŒ Continue with plan didn't appear: {e}")
+                logging.error("âŒ Continue with plan didn't appear: %s", e)
                 self._screenshot_error(client.full_name.replace(" ", "_"))
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                        logging.info("ðŸ”™ Navigated back to client list (same-tab fallback)")
-                    except Exception:
-                        logging.critical("Could not navigate back to client list")
-                else:
-                    self._cleanup_non_main_tabs()
+                if not self._abandon_client_tab(same_tab):
+                    logging.critical("Could not navigate back to client list")
                 client.status = ClientStatus.ERROR
                 client.error_message = "Continue with plan missing"
                 return client.status
 
 
-                logging.error(f"Ã¢ÂÅ’ Could not click Review plan: {str(e)}")
+                logging.error("Ã¢ÂÅ’ Could not click Review plan: %s", str(e))
                 client.status = ClientStatus.ERROR
                 client.error_message = "Review plan button missing"
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
+                self._abandon_client_tab(same_tab)
                 return client.status
             def process_client(self, client: ClientData) -> str:
                 """Main workflow for processing client renewal."""
                 client.timestamp_start = datetime.now(timezone.utc).isoformat()
                 client.status = ClientStatus.IN_PROGRESS
-                logging.info(f"🚀 Processing client: {client.full_name} (Row {client.row_index})")
+                logging.info("🚀 Processing client: %s (Row %s)", client.full_name, client.row_index)
 
                 try:
                     # Initialize same_tab variable early
@@ -3206,7 +3072,7 @@ class HealthInsuranceRenewalBot:
 
                     # Skip Check
                     if self.state.check_skip():
-                        logging.warning(f"Skipping {client.full_name} as requested.")
+                        logging.warning("Skipping %s as requested.", client.full_name)
                         client.status = ClientStatus.SKIPPED_BY_USER
                         client.error_message = "Skipped by user"
                         return client.status
@@ -3217,12 +3083,12 @@ class HealthInsuranceRenewalBot:
                     client.premium = f"${premium:.2f}"
 
                     if self.should_enroll_directly(premium, carrier):
-                        logging.info(f"Enrolling directly in {carrier} @ ${premium:.2f}/mo")
+                        logging.info("Enrolling directly in %s @ $%.2f/mo", carrier, premium)
                         if not self.handle_confirm_plan_page(client):
-                            logging.warning(f"Enrollment failed for client: {client.full_name}.")
+                            logging.warning("Enrollment failed for client: %s.", client.full_name)
                             return client.status  # Status set within handle_confirm_plan_page
                     else:
-                        logging.info(f"Exploring alternatives for {client.full_name} with premium: ${premium:.2f}")
+                        logging.info("Exploring alternatives for %s with premium: $%.2f", client.full_name, premium)
                         try:
                             # Handle plan switching logic
                             if not self.click_change_plans():
@@ -3235,77 +3101,32 @@ class HealthInsuranceRenewalBot:
                             self.wait_for_congratulations_page()
                             client.status = ClientStatus.COMPLETED
                             client.timestamp_end = datetime.now(timezone.utc).isoformat()
-                            logging.info(f"🎉 {client.full_name} - COMPLETED (plan switch)")
+                            logging.info("🎉 %s - COMPLETED (plan switch)", client.full_name)
 
                         except Exception as e:
-                            logging.error(f"Plan selection failed: {str(e)}")
+                            logging.error("Plan selection failed: %s", str(e))
                             client.status = ClientStatus.ERROR
                             client.error_message = f"Plan selection failed: {str(e)}"
 
                     return client.status
 
                 except Exception as e:
-                    logging.error(f"Fatal error processing {client.full_name}: {e}")
+                    logging.error("Fatal error processing %s: %s", client.full_name, e)
                     client.status = ClientStatus.ERROR
                     client.error_message = str(e)
                     return client.status
             
             # Plan Decision
-            self.state.wait_if_paused()
-            if self.state.check_stopped():
-                client.status = ClientStatus.ERROR
-                client.error_message = "Stopped by user"
-                return client.status
-            
-            if self.state.check_skip():
-                logging.warning(f"Ã¢ÂÂ­Ã¯Â¸Â Skipping {client.full_name} (user requested)")
-                client.status = ClientStatus.SKIPPED_BY_USER
-                client.error_message = "Skipped by user"
-                if same_tab:
-                    try:
-                        self.driver.back()
-                        time.sleep(0.75)
-                    except Exception:
-                        pass
-                else:
-                    self._cleanup_non_main_tabs()
-                return client.status
+            action = self.state.control_check()
+            if action != ControlAction.CONTINUE:
+                return self._apply_control_action(action, client, same_tab)
             
                 # After clicking 'Review plan', re-extract plan details!
                 premium, carrier = self.get_current_plan_premium_from_summary()
 
                 if self.should_enroll_directly(premium, carrier):
-                    self.logger.info(f"[+] Plan is $0.00 and supported carrier: {carrier}. Clicking Enroll in this plan!")
-                    # Wait for and click the "Enroll in this plan" button directly
-                    try:
-                        enroll_selectors = [
-                            (By.XPATH, "//button[normalize-space()='Enroll in this plan']"),
-                            (By.CSS_SELECTOR, "button[type='submit'][data-layer='enroll_in_application']"),
-                            (By.XPATH, "//button[@type='submit' and contains(text(), 'Enroll')]"),
-                        ]
-                        for by, selector in enroll_selectors:
-                            try:
-                                btn = WebDriverWait(self.driver, 5).until(
-                                    EC.element_to_be_clickable((by, selector))
-                                )
-                                self.driver.execute_script(
-                                    "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", btn
-                                )
-                                time.sleep(0.5)
-                                btn.click()
-                                self.logger.info(f"[+] Successfully clicked: Enroll in this plan")
-                                break
-                            except TimeoutException:
-                                continue
-                        else:
-                            raise Exception("No Enroll in this plan button found after 'Review plan'.")
-                    except Exception as e:
-                        self.logger.error(f"[X] Could not enroll directly: {e}")
-                        # Optionally handle/make a screenshot
-                        return
-                    # After click, just wait for congrats page, done!
-                    self.wait_for_congratulations_page()
-                    self.logger.info(f"[DONE] {client.full_name} - COMPLETED (direct enrollment)")
+                    self.logger.info("[+] Plan is $0.00 and supported carrier: %s. Clicking Enroll in this plan!", carrier)
+                    self._enroll_direct(client)
                     # CLEAN exit for this client, don't proceed with carrier filtering
                     return
                 else:
@@ -3327,7 +3148,7 @@ class HealthInsuranceRenewalBot:
                             logging.error("Ã¢ÂÅ’ No carriers were selected - cannot find plans")
                             raise Exception("No approved carriers available in this ZIP code")
                     except Exception as carrier_check_err:
-                        logging.debug(f"Carrier selection check failed: {str(carrier_check_err)[:60]}")
+                        logging.debug("Carrier selection check failed: %s", str(carrier_check_err)[:60])
 
                     if not self.select_top_zero_premium_plan():
                         raise Exception("No $0.00 plans found after filtering")
@@ -3345,10 +3166,10 @@ class HealthInsuranceRenewalBot:
                     
                     client.status = ClientStatus.COMPLETED
                     client.timestamp_end = datetime.now(timezone.utc).isoformat()
-                    logging.info(f"Ã¢Å“â€¦ {client.full_name} - COMPLETED (plan switch)")
+                    logging.info("Ã¢Å“â€¦ %s - COMPLETED (plan switch)", client.full_name)
                     
                 except Exception as e:
-                    logging.error(f"Ã¢ÂÅ’ Plan selection failed: {str(e)}")
+                    logging.error("Ã¢ÂÅ’ Plan selection failed: %s", str(e))
                     client.status = ClientStatus.ERROR
                     client.error_message = f"Plan selection failed: {str(e)}"
             
@@ -3356,12 +3177,14 @@ class HealthInsuranceRenewalBot:
             try:
                 if same_tab:
                     try:
+                        prev_url = self.driver.current_url
                         self.driver.back()
-                        time.sleep(1.1)
-                        if CLIENT_LIST_URL not in (self.driver.current_url or ""):
+                        # Returns as soon as the history navigation has committed
+                        current_url = self._wait_until(lambda d: d.current_url != prev_url and d.current_url)
+                        if CLIENT_LIST_URL not in (current_url or ""):
                             logging.info("Ã°Å¸â€Â Re-navigating to client list URL")
                             self.driver.get(CLIENT_LIST_URL)
-                            time.sleep(0.75)
+                            self._wait_until(EC.url_contains(CLIENT_LIST_URL))
                     except Exception:
                         logging.warning("Could not navigate back after same-tab flow")
                         if self.main_tab_handle in self.driver.window_handles:
@@ -3373,13 +3196,17 @@ class HealthInsuranceRenewalBot:
                     self._cleanup_non_main_tabs()
                 return client.status
             except Exception as closing_err:
-                logging.error(f"Error during final cleanup: {closing_err}", exc_info=True)
+                logging.error("Error during final cleanup: %s", closing_err, exc_info=True)
                 client.status = ClientStatus.ERROR
                 client.error_message = "Cleanup error"
                 return client.status
 
+        except ClientStepFailed:
+            # Step guard already logged the failure, set the status and left the client's tab
+            return client.status
+
         except Exception as e:
-            logging.error(f"Ã¢ÂÅ’ Fatal error processing {client.full_name}: {e}", exc_info=True)
+            logging.error("Ã¢ÂÅ’ Fatal error processing %s: %s", client.full_name, e, exc_info=True)
             client.status = ClientStatus.ERROR
             client.error_message = str(e)
             client.timestamp_end = datetime.now(timezone.utc).isoformat()
@@ -3394,10 +3221,177 @@ class HealthInsuranceRenewalBot:
                     logging.critical("Main tab lost; stopping automation")
                     self.state.stop()
             except Exception as cleanup_ex:
-                logging.error(f"Cleanup exception: {cleanup_ex}", exc_info=True)
+                logging.error("Cleanup exception: %s", cleanup_ex, exc_info=True)
                 
             return client.status
 
+    def _try_skip(self, client: ClientData, same_tab: bool) -> bool:
+        """Skip to the end and click through the finalize pages; False if there is no Skip button."""
+        if not self.click_skip_to_end():
+            return False
+        logging.info("ðŸš€ SHORT PATH: Skip button worked")
+        for page_name in ("Finalize 1", "Finalize 2", "Finalize 3"):
+            action = self.state.control_check()
+            if action != ControlAction.CONTINUE:
+                self._apply_control_action(action, client, same_tab)
+                raise ClientStepFailed(page_name)
+
+            logging.info("ðŸ“„ %s - clicking Continue...", page_name)
+            sig = self._page_signature()
+            try:
+                self.click_continue()
+            except Exception:
+                logging.debug("%s Continue not found", page_name)
+                continue
+            self._wait_page_changed(sig)
+        return True
+
+    def _do_signature(self, client: ClientData):
+        """Type the client's name into the signature field (if shown) and continue past the page."""
+        logging.info("✍️ Handling signature input...")
+        try:
+            signature_input = self._wait(5).until(
+                EC.presence_of_element_located((
+                    By.XPATH,
+                    "//input[@type='text' and (@id='signature' or contains(@name, 'signature') or contains(@placeholder, 'signature'))]"
+                ))
+            )
+            logging.info("✅ Found signature input field")
+        except TimeoutException:
+            signature_input = None
+            logging.warning("⚠️ Signature input field not found - may not be needed")
+
+        if signature_input:
+            # One round-trip: scroll, set value via the native setter, fire input/change
+            try:
+                sig_value = self.driver.execute_script(SIGNATURE_JS, signature_input, client.full_name)
+                if sig_value and len(sig_value) > 2:
+                    logging.info("✅ Signature entered: %s...", sig_value[:20])
+            except WebDriverException as e:
+                logging.warning("⚠️ Signature input handling error: %s", str(e)[:60])
+
+        try:
+            continue_btn = self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
+        except WebDriverException as e:
+            logging.warning("âš ï¸ Could not click Continue after signature: %s", str(e)[:60])
+        else:
+            logging.info("âœ… Clicked Continue after signature")
+            self._wait_until(EC.staleness_of(continue_btn))  # Leaving signature page
+            self._wait_for_page_load()
+
+        logging.info("âœ… Signature step completed successfully")
+
+    def _enroll_direct(self, client: ClientData) -> bool:
+        """Click 'Enroll in this plan' on the plan summary and wait for the congratulations page."""
+        try:
+            btn = self._wait(5).until(
+                EC.element_to_be_clickable((By.XPATH, self.ENROLL_PLAN_XPATH))
+            )
+        except TimeoutException:
+            self.logger.error("[X] Could not enroll directly: no 'Enroll in this plan' button after 'Review plan'")
+            return False
+        self._click_smart(btn)
+        self.logger.info("[+] Successfully clicked: Enroll in this plan")
+        self.wait_for_congratulations_page()
+        self.logger.info("[DONE] %s - COMPLETED (direct enrollment)", client.full_name)
+        return True
+
+    def _wait_for_page_load(self, timeout: float = NORMAL_TIMEOUT) -> bool:
+        """Wait for document.readyState 'complete' and a fired load event (no fixed sleep)."""
+        return bool(self._wait_until(lambda d: d.execute_script(PAGE_LOADED_JS), timeout=timeout, poll=0.2))
+
+    def _page_signature(self) -> str:
+        """Cheap fingerprint of the current page (URL + visible text length)."""
+        try:
+            return self.driver.execute_script(PAGE_SIGNATURE_JS)
+        except WebDriverException:
+            return ""
+
+    def _wait_page_changed(self, signature: str, timeout: float = 5) -> bool:
+        """Wait until the page fingerprint differs from `signature` (i.e. the click navigated)."""
+        changed = bool(self._wait_until(lambda d: self._page_signature() != signature, timeout=timeout, poll=0.15))
+        if changed:
+            self._next_btn = None
+        return changed
+
+    def _get_next_btn(self, timeout: float = 5) -> WebElement:
+        """The wizard Continue button: the cached element while it is still live, else a fresh clickable lookup."""
+        btn = self._next_btn
+        if btn is not None:
+            try:
+                if self.driver.execute_script(ELEMENT_READY_JS, btn):
+                    return btn
+            except WebDriverException:  # stale, or it belonged to a tab we've left
+                pass
+            self._next_btn = None
+        btn = self._wait(timeout).until(EC.element_to_be_clickable(NEXT_BUTTON_LOCATOR))
+        self._next_btn = btn
+        return btn
+
+    def _detect_cart_mode(self, timeout: float = FAST_TIMEOUT) -> Optional[str]:
+        """'ADD' or 'VIEW' once either cart button has rendered; None if neither shows up in time."""
+        return self._wait_until(lambda d: d.execute_script(CART_MODE_JS), timeout=timeout, poll=FAST_POLL)
+
+    def _apply_control_action(self, action: str, client: ClientData, same_tab: bool) -> ClientStatus:
+        """Record a user stop/skip on the client (leaving its tab on skip) and return its status."""
+        if action == ControlAction.STOP:
+            logging.critical("Stopped by user")
+            client.status = ClientStatus.ERROR
+            client.error_message = "Stopped by user"
+        else:
+            logging.warning("Ã¢ÂÂ­Ã¯Â¸Â Skipping %s (user requested)", client.full_name)
+            client.status = ClientStatus.SKIPPED_BY_USER
+            client.error_message = "Skipped by user"
+            self._abandon_client_tab(same_tab)
+        return client.status
+
+    def _wait_page_ready_and_clickable(
+        self, locator: Tuple[str, str], timeout: float = 10, signature: Optional[str] = None
+    ) -> bool:
+        """Wait for the next wizard page: fingerprint moved off `signature` (if given), document loaded, locator clickable."""
+        try:
+            if signature is not None:
+                # URL/text fingerprint rather than staleness: the SPA may re-render in place and keep the button node
+                self._wait_page_changed(signature, timeout=min(timeout, 3))
+            element = self._wait(timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+                and EC.element_to_be_clickable(locator)(d)
+            )
+            if locator == NEXT_BUTTON_LOCATOR:
+                self._next_btn = element
+            return True
+        except TimeoutException:
+            logging.debug("Page not ready / %s not clickable after %ss", locator[1], timeout)
+            return False
+
+    def _abandon_client_tab(self, same_tab: bool) -> bool:
+        """Leave a failed client's flow: go back in the same tab, or close the renewal tabs."""
+        if not same_tab:
+            self._cleanup_non_main_tabs()
+            return True
+        try:
+            page = self.driver.find_element(By.TAG_NAME, "html")
+            self.driver.back()
+            try:
+                self._wait(2).until(EC.staleness_of(page))
+            except TimeoutException:
+                pass
+            return True
+        except Exception:
+            return False
+
+    @contextmanager
+    def _client_step_guard(self, client: ClientData, same_tab: bool, step: str):
+        """Mark the client as failed at `step` and back out of its tab if the block raises."""
+        try:
+            yield
+        except Exception as e:
+            logging.error("âŒ Failed on %s: %s", step, e)
+            client.status = ClientStatus.ERROR
+            client.error_message = f"{step} failed"
+            self._abandon_client_tab(same_tab)
+            raise ClientStepFailed(step) from e
+
     def _cleanup_non_main_tabs(self):
         # ... (your existing code)
         """Close all tabs except main_tab_handle and switch back to main."""
@@ -3407,14 +3401,14 @@ class HealthInsuranceRenewalBot:
                     try:
                         self.driver.switch_to.window(h)
                         self.driver.close()
-                        logging.info(f"Ã¢Å“â€¦ Closed extra tab: {h}")
+                        logging.info("Ã¢Å“â€¦ Closed extra tab: %s", h)
                     except Exception:
                         pass
             if self.main_tab_handle in self.driver.window_handles:
                 self.driver.switch_to.window(self.main_tab_handle)
                 logging.info("Ã¢Å“â€¦ Returned to main tab")
         except Exception as e:
-            logging.warning(f"Cleanup non-main tabs failed: {e}")
+            logging.warning("Cleanup non-main tabs failed: %s", e)
 
     def run(self):
             """Main bot execution loop with DYNAMIC client list refresh."""
@@ -3422,17 +3416,18 @@ class HealthInsuranceRenewalBot:
             processed_full_names = set()
             consecutive_same_client = 0
             last_client_name = None
+            stuck_full_names = set()  # skipped permanently; their rows come back after each F5
         
             try:
                 self.initialize_driver()
-                self.open_notepadpp_if_needed()
+                IO_POOL.submit(self.open_notepadpp_if_needed)  # tasklist + editor launch, not needed to proceed
                 
                 try:
                     self.main_tab_handle = self.driver.current_window_handle
                 except Exception:
                     logging.critical("Ã¢ÂÅ’ Could not get main tab handle")
                     raise
-                logging.info(f"Main tab handle: {self.main_tab_handle}")
+                logging.info("Main tab handle: %s", self.main_tab_handle)
 
                 initial_clients = self.read_client_table()
                 if not initial_clients:
@@ -3440,7 +3435,7 @@ class HealthInsuranceRenewalBot:
                     return
                 
                 self.state.total_clients = len(initial_clients)
-                logging.info(f"Ã°Å¸â€œÅ  Found {self.state.total_clients} clients initially")
+                logging.info("Ã°Å¸â€œÅ  Found %s clients initially", self.state.total_clients)
                 
                 processed_count = 0
                 max_iterations = self.state.total_clients + 5
@@ -3454,21 +3449,23 @@ class HealthInsuranceRenewalBot:
                     try:
                         self.driver.switch_to.window(self.main_tab_handle)
                     except Exception as e:
-                        logging.critical(f"Ã¢ÂÅ’ Lost main tab: {e}")
+                        logging.critical("Ã¢ÂÅ’ Lost main tab: %s", e)
                         break
                     
-                    current_clients = self.read_client_table()
+                    current_clients = [
+                        c for c in self.read_client_table() if c.full_name not in stuck_full_names
+                    ]
                     
                     if not current_clients:
                         logging.info("Ã¢Å“â€¦ Client list empty - all done")
                         break
                     
                     if processed_count >= self.state.total_clients:
-                        logging.info(f"Ã¢Å“â€¦ Processed {processed_count} clients (target: {self.state.total_clients})")
+                        logging.info("Ã¢Å“â€¦ Processed %s clients (target: %s)", processed_count, self.state.total_clients)
                         break
                     
+                    # row_index stays the table's own row number: rows hidden below come before it
                     client = current_clients[0]
-                    client.row_index = 1
                     
                     # FIX: Check if we're stuck on same client (missing SSN loop)
                     if client.full_name == last_client_name:
@@ -3479,58 +3476,59 @@ class HealthInsuranceRenewalBot:
                     
                     # If stuck on same client 2+ times, skip permanently
                     if consecutive_same_client >= 2:
-                        logging.error(f"âŒ STUCK on {client.full_name} - skipping permanently")
+                        logging.error("âŒ STUCK on %s - skipping permanently", client.full_name)
                         processed_full_names.add(client.full_name)
+                        stuck_full_names.add(client.full_name)
                         client.status = ClientStatus.SKIPPED_NO_SSN
                         client.error_message = "Stuck in loop - likely missing SSN"
-                        self.clients.append(client)
-                        self.audit_log.append(client.to_dict())
-                        # Force remove from view
+                        self._record_client(client)
+                        # Force remove from view (find + hide in one round-trip)
                         try:
-                            self.driver.execute_script(
-                                "arguments[0].style.display = 'none';",
-                                self.driver.find_element(By.XPATH, "//tbody/tr[1]")
-                            )
-                        except:
-                            pass
-                        time.sleep(0.75)
+                            hidden = self.driver.execute_script(HIDE_ROW_JS, client.row_index)
+                        except WebDriverException:
+                            hidden = False
+                        # Check the next read starts past this row (stuck_full_names keeps it skipped either way)
+                        remaining = self.read_client_table() if hidden else []
+                        if not hidden or any(c.row_index == client.row_index for c in remaining):
+                            logging.warning("Row for %s is still shown after hiding it", client.full_name)
                         continue
                     
                     # Skip if already processed
                     if client.full_name in processed_full_names:
-                        logging.warning(f"â­ï¸ Already processed {client.full_name} - skipping")
+                        logging.warning("â­ï¸ Already processed %s - skipping", client.full_name)
                         continue
                     
                     processed_full_names.add(client.full_name)
                     processed_count += 1
                     self.state.clients_processed = processed_count
                     
-                    logging.info(f"\n[{processed_count}/{self.state.total_clients}] {client.full_name}")
-                    logging.info(f"Ã¢ÂÂ±Ã¯Â¸Â ETA: {self.state.estimated_time_remaining()}")
+                    logging.info("\n[%s/%s] %s", processed_count, self.state.total_clients, client.full_name)
+                    logging.info("Ã¢ÂÂ±Ã¯Â¸Â ETA: %s", self.state.estimated_time_remaining())
                     
                     result = self.process_client(client)
                     
-                    self.clients.append(client)
-                    self.audit_log.append(client.to_dict())
+                    self._record_client(client)
                     
                     try:
                         if processed_count < self.state.total_clients:
                             logging.info("Ã°Å¸â€â€ž Soft refresh (F5) before next client...")
+                            # Table is server-rendered: a reload is the only way to drop finished clients,
+                            # but wait for the first row instead of sleeping a fixed interval.
                             self.driver.refresh()
-                            time.sleep(1.5)  # +0.2s buffer
+                            self._wait_until(EC.presence_of_element_located(FIRST_ROW_NAME_LOCATOR), timeout=NORMAL_TIMEOUT)
                             logging.info("Ã¢Å“â€¦ Table soft-refreshed (filters preserved).")
                     except Exception as refresh_err:
-                        logging.warning(f"Ã¢Å¡Â Ã¯Â¸Â Soft refresh failed: {refresh_err}")
+                        logging.warning("Ã¢Å¡Â Ã¯Â¸Â Soft refresh failed: %s", refresh_err)
 
                     try:
                         self.driver.switch_to.window(self.main_tab_handle)
                         time.sleep(0.5)  # +0.2s buffer
                     except Exception as e:
-                        logging.error(f"Ã¢ÂÅ’ Could not return to main tab: {e}")
+                        logging.error("Ã¢ÂÅ’ Could not return to main tab: %s", e)
                         break
                 
                 if iteration >= max_iterations - 1:
-                    logging.warning(f"Ã¢Å¡Â Ã¯Â¸Â Hit safety limit ({max_iterations} iterations)")
+                    logging.warning("Ã¢Å¡Â Ã¯Â¸Â Hit safety limit (%s iterations)", max_iterations)
                 
                 self._generate_report()
                 
@@ -3545,7 +3543,7 @@ class HealthInsuranceRenewalBot:
             time.sleep(0.6)  # +0.2s buffer
             
             try:
-                WebDriverWait(self.driver, 1).until(
+                self._wait(1).until(
                     EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'address')]"))
                 )
             except TimeoutException:
@@ -3554,29 +3552,15 @@ class HealthInsuranceRenewalBot:
             
             logging.info("Ã°Å¸â€œâ€¹ Address validation modal detected")
             
-            yes_already_selected = False
-            try:
-                yes_radio = self.driver.find_element(By.XPATH, "//button[@aria-label='Yes' and @role='radio']")
-                aria_checked = yes_radio.get_attribute('aria-checked')
-                if aria_checked == 'true':
-                    logging.info("Ã¢Å“â€¦ 'Yes' already selected - skipping to Continue")
-                    yes_already_selected = True
-            except NoSuchElementException:
-                pass
-            
-            if not yes_already_selected:
-                try:
-                    yes_btn = WebDriverWait(self.driver, 1).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[@aria-label='Yes' and @role='radio']"))
-                    )
-                    try:
-                        yes_btn.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", yes_btn)
-                    logging.info("Ã¢Å“â€¦ Clicked 'Yes' radio button")
-                    time.sleep(0.5)  # +0.2s buffer
-                except TimeoutException:
-                    logging.warning("Ã¢Å¡Â Ã¯Â¸Â 'Yes' button not found")
+            yes_xpath = "//button[@aria-label='Yes' and @role='radio']"
+            # Read aria-checked and click if needed in one round-trip
+            yes_state = self.driver.execute_script(ARIA_RADIO_SELECT_JS, yes_xpath)
+            if yes_state is None:
+                logging.warning("Ã¢Å¡Â Ã¯Â¸Â 'Yes' button not found")
+            elif yes_state["was"]:
+                logging.info("Ã¢Å“â€¦ 'Yes' already selected - skipping to Continue")
+            else:
+                logging.info("Ã¢Å“â€¦ Clicked 'Yes' radio button")
             
             continue_selectors = [
                 (By.XPATH, "//button[normalize-space()='Continue']", "xpath text"),
@@ -3585,14 +3569,14 @@ class HealthInsuranceRenewalBot:
             
             for by, selector, label in continue_selectors:
                 try:
-                    continue_btn = WebDriverWait(self.driver, 1.5).until(
+                    continue_btn = self._wait(1.5).until(
                         EC.element_to_be_clickable((by, selector))
                     )
                     try:
                         continue_btn.click()
-                    except Exception:
+                    except CLICK_FALLBACK_ERRORS:
                         self.driver.execute_script("arguments[0].click();", continue_btn)
-                    logging.info(f"Ã¢Å“â€¦ Clicked Continue ({label})")
+                    logging.info("Ã¢Å“â€¦ Clicked Continue (%s)", label)
                     time.sleep(0.6)  # +0.2s buffer
                     return
                 except TimeoutException:
@@ -3601,17 +3585,17 @@ class HealthInsuranceRenewalBot:
             logging.warning("Ã¢Å¡Â Ã¯Â¸Â Continue button not found after 1.5s")
             
         except Exception as e:
-            logging.warning(f"Ã¢Å¡Â Ã¯Â¸Â Address validation error: {str(e)[:60]}")
+            logging.warning("Ã¢Å¡Â Ã¯Â¸Â Address validation error: %s", str(e)[:60])
 
     def handle_foster_care_question(self):
         """Handle foster care question - always click No."""
         try:
-            no_btn = WebDriverWait(self.driver, 3).until(
+            no_btn = self._wait(3).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@aria-label='No' and contains(., 'foster')]"))
             )
             try:
                 no_btn.click()
-            except Exception:
+            except CLICK_FALLBACK_ERRORS:
                 self._js_click(no_btn)
             logging.info("Ã¢Å“â€¦ Answered No to foster care question")
             time.sleep(0.5)  # +0.2s buffer
@@ -3633,7 +3617,7 @@ class HealthInsuranceRenewalBot:
             min_income = 23380
             max_income = 23450
             random_income = random.randint(min_income, max_income)
-            self.logger.info(f"📊 Setting income to: ${random_income:,}")
+            self.logger.info("📊 Setting income to: $%s", format(random_income, ","))
             
             # Wait for income page to load
             time.sleep(1.5)
@@ -3648,7 +3632,7 @@ class HealthInsuranceRenewalBot:
             
             for by, selector in edit_selectors:
                 try:
-                    edit_btn = WebDriverWait(self.driver, 3).until(
+                    edit_btn = self._wait(3).until(
                         EC.element_to_be_clickable((by, selector))
                     )
                     self.driver.execute_script(
@@ -3680,33 +3664,23 @@ class HealthInsuranceRenewalBot:
             income_entered = False
             for by, selector in income_input_selectors:
                 try:
-                    income_input = WebDriverWait(self.driver, 5).until(
+                    income_input = self._wait(5).until(
                         EC.presence_of_element_located((by, selector))
                     )
                     
                     if income_input.is_displayed() and income_input.is_enabled():
-                        income_input.clear()
-                        time.sleep(0.3)
-                        
-                        try:
-                            income_input.click()
-                        except:
-                            self.driver.execute_script("arguments[0].focus();", income_input)
-                        
-                        time.sleep(0.3)
-                        income_input.send_keys(str(random_income))
-                        
-                        entered_value = income_input.get_attribute('value')
+                        # Replace the value via the native setter + input/change events in one
+                        # round-trip, instead of clear/click/type with settling sleeps in between
+                        entered_value = self.driver.execute_script(SIGNATURE_JS, income_input, str(random_income))
                         if entered_value:
-                            self.logger.info(f"✅ Entered income: ${random_income}")
+                            self.logger.info("✅ Entered income: $%s", random_income)
                             income_entered = True
-                            time.sleep(0.5)
                             break
                             
                 except TimeoutException:
                     continue
                 except Exception as e:
-                    self.logger.debug(f"Error with selector {selector}: {str(e)[:60]}")
+                    self.logger.debug("Error with selector %s: %s", selector, str(e)[:60])
                     continue
             
             if not income_entered:
@@ -3725,7 +3699,7 @@ class HealthInsuranceRenewalBot:
             
             for by, selector in save_selectors:
                 try:
-                    save_btn = WebDriverWait(self.driver, 3).until(
+                    save_btn = self._wait(3).until(
                         EC.element_to_be_clickable((by, selector))
                     )
                     
@@ -3762,7 +3736,7 @@ class HealthInsuranceRenewalBot:
             self.logger.info("🔍 Checking for Income Difference popup...")
             
             try:
-                income_diff_popup = WebDriverWait(self.driver, 3).until(
+                income_diff_popup = self._wait(3).until(
                     EC.presence_of_element_located((
                         By.XPATH, 
                         "//*[contains(text(), 'Income difference') or " +
@@ -3782,7 +3756,7 @@ class HealthInsuranceRenewalBot:
                 
                 for by, selector in self_employment_selectors:
                     try:
-                        radio_element = WebDriverWait(self.driver, 2).until(
+                        radio_element = self._wait(2).until(
                             EC.element_to_be_clickable((by, selector))
                         )
                         radio_element.click()
@@ -3793,7 +3767,7 @@ class HealthInsuranceRenewalBot:
                         continue
                 
                 # Click Continue on the popup
-                continue_btn = WebDriverWait(self.driver, 3).until(
+                continue_btn = self._wait(3).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Continue')]"))
                 )
                 continue_btn.click()
@@ -3809,7 +3783,7 @@ class HealthInsuranceRenewalBot:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Income edit failed: {str(e)}")
+            self.logger.error("❌ Income edit failed: %s", str(e))
             return False
 
 
@@ -3826,10 +3800,7 @@ class HealthInsuranceRenewalBot:
                 self.logger.info("📋 Additional Questions Page 1 - Extra help...")
                 time.sleep(1.5)
                 
-                continue_btn = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                continue_btn.click()
+                self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
                 self.logger.info("✅ Clicked Continue on Additional Questions 1")
                 time.sleep(1.5)
             except TimeoutException:
@@ -3853,10 +3824,7 @@ class HealthInsuranceRenewalBot:
                 except:
                     pass
                 
-                continue_btn = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                continue_btn.click()
+                self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
                 self.logger.info("✅ Clicked Continue on Additional Questions 2")
                 time.sleep(1.5)
             except TimeoutException:
@@ -3866,10 +3834,7 @@ class HealthInsuranceRenewalBot:
             try:
                 self.logger.info("📋 Additional Questions Page 3 - Employer coverage...")
                 
-                continue_btn = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                continue_btn.click()
+                self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
                 self.logger.info("✅ Clicked Continue on Additional Questions 3")
                 time.sleep(1.5)
             except TimeoutException:
@@ -3879,10 +3844,7 @@ class HealthInsuranceRenewalBot:
             try:
                 self.logger.info("📋 Additional Questions Page 4 - Upcoming changes...")
                 
-                continue_btn = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                )
-                continue_btn.click()
+                self._click_when_ready(NEXT_BUTTON_CSS, timeout=5)
                 self.logger.info("✅ Clicked Continue on Additional Questions 4")
                 time.sleep(1.5)
             except TimeoutException:
@@ -3892,21 +3854,20 @@ class HealthInsuranceRenewalBot:
             self.logger.info("📋 Handling Finalize pages...")
             for i in range(1, 4):
                 try:
-                    self.logger.info(f"📄 Finalize {i} - clicking Continue...")
-                    continue_btn = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.ID, "page-nav-on-next-btn"))
-                    )
+                    self.logger.info("📄 Finalize %s - clicking Continue...", i)
+                    continue_btn = self._get_next_btn()
+                    sig = self._page_signature()
                     continue_btn.click()
-                    time.sleep(1.0)
+                    self._wait_page_changed(sig)
                 except TimeoutException:
-                    self.logger.debug(f"Finalize {i} not found")
+                    self.logger.debug("Finalize %d not found", i)
                     break
             
             self.logger.info("✅ Long path completed")
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Long path handling failed: {str(e)}")
+            self.logger.error("❌ Long path handling failed: %s", str(e))
             return False
             
     def handle_signature_section(self, client):
@@ -3916,29 +3877,28 @@ class HealthInsuranceRenewalBot:
         try:
             # Print or log the client name for visibility
             print(f"[*] Signing for: {client.full_name}")
-            self.logger.info(f"[*] Handling signature for: {client.full_name}")
+            self.logger.info("[*] Handling signature for: %s", client.full_name)
 
             # 1. Find the signature input box
-            signature_input = WebDriverWait(self.driver, 8).until(
+            signature_input = self._wait(8).until(
                 EC.presence_of_element_located((By.XPATH, "//input[@type='text' and (contains(@id, 'signature') or contains(@name, 'signature'))]"))
             )
             # 2. Enter/copy the client's full name
-            signature_input.clear()
-            signature_input.send_keys(client.full_name)
+            self.driver.execute_script(SIGNATURE_JS, signature_input, client.full_name)
 
             # 3. (Optional) Click Continue or Next to move on
-            continue_btn = WebDriverWait(self.driver, 5).until(
+            continue_btn = self._wait(5).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(.,'Continue')]"))
             )
             continue_btn.click()
             self.logger.info("[+] Clicked Continue after entering signature.")
         except Exception as e:
-            self.logger.error(f"[X] Error in signature section: {e}")
+            self.logger.error("[X] Error in signature section: %s", e)
         
     def filter_by_approved_carriers(self) -> None:
         """Check carrier filter checkboxes with multiple detection strategies."""
         try:
-            logging.info(f"Ã°Å¸â€Â Filtering by approved carriers: {', '.join(self.approved_carriers)}")
+            logging.info("Ã°Å¸â€Â Filtering by approved carriers: %s", ', '.join(self.approved_carriers))
             
             # Wait for filters to load
             time.sleep(1.05)
@@ -3981,85 +3941,78 @@ class HealthInsuranceRenewalBot:
                             )
                         
                         if not checkboxes:
-                            logging.debug(f"   Ã¢ÂÂ­Ã¯Â¸Â {carrier_name} not found with any strategy")
+                            logging.debug("   Ã¢ÂÂ­Ã¯Â¸Â %s not found with any strategy", carrier_name)
                             continue
                         
                         checkbox = checkboxes[0]
                         
                         # Check if already selected
                         if checkbox.is_selected():
-                            logging.debug(f"   Ã¢Å“â€¦ {carrier_name} already checked")
+                            logging.debug("   Ã¢Å“â€¦ %s already checked", carrier_name)
                             checked_count += 1
                             break
                         
-                        # Scroll into view
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                            checkbox
-                        )
-                        time.sleep(0.4)
-                        
-                        # Try to click
+                        # Scroll (only if off-screen) and click
                         try:
-                            checkbox.click()
+                            self._click_smart(checkbox)
                         except Exception:
-                            try:
-                                self.driver.execute_script("arguments[0].click();", checkbox)
-                            except Exception:
-                                # Try clicking parent label
-                                parent_label = checkbox.find_element(By.XPATH, "./ancestor::label[1]")
-                                parent_label.click()
+                            # Try clicking parent label
+                            parent_label = checkbox.find_element(By.XPATH, "./ancestor::label[1]")
+                            parent_label.click()
                         
                         # Verify it was checked
                         time.sleep(0.3)
                         if checkbox.is_selected():
-                            logging.info(f"Ã¢Å“â€¦ Checked carrier filter: {carrier_name}")
+                            logging.info("Ã¢Å“â€¦ Checked carrier filter: %s", carrier_name)
                             checked_count += 1
                             time.sleep(4)
                             break
                         else:
-                            logging.warning(f"Ã¢Å¡Â Ã¯Â¸Â Failed to check {carrier_name} (click didn't register)")
+                            logging.warning("Ã¢Å¡Â Ã¯Â¸Â Failed to check %s (click didn't register)", carrier_name)
                         
                     except Exception as e:
-                        logging.debug(f"   Error checking {carrier_name}: {str(e)[:60]}")
+                        logging.debug("   Error checking %s: %s", carrier_name, str(e)[:60])
                         continue
             
             if checked_count == 0:
                 logging.error("Ã¢ÂÅ’ NO approved carriers available in this ZIP code!")
-                logging.info("Ã°Å¸â€Â Attempting to find ANY available carriers...")
                 
-                # Fallback: List all available carriers for debugging
-                try:
-                    all_checkboxes = self.driver.find_elements(
-                        By.XPATH,
-                        "//input[@type='checkbox' and contains(@name, 'issuer')]"
-                    )
-                    logging.info(f"   Found {len(all_checkboxes)} total carrier checkboxes")
-                    
-                    # Try to find carrier names
-                    for i, cb in enumerate(all_checkboxes[:10], 1):
-                        try:
-                            label = cb.find_element(By.XPATH, "./ancestor::label[1]")
-                            carrier_text = label.text.strip()
-                            logging.info(f"   Available carrier {i}: {carrier_text}")
-                        except:
-                            pass
-                except Exception as debug_err:
-                    logging.debug(f"   Debug failed: {str(debug_err)[:60]}")
+                # Fallback: List all available carriers for debugging (skipped when nobody reads it)
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info("Ã°Å¸â€Â Attempting to find ANY available carriers...")
+                    try:
+                        total, names = self.driver.execute_script(AVAILABLE_CARRIERS_JS)
+                        logging.info("   Found %s total carrier checkboxes", total)
+                        if logging.getLogger().isEnabledFor(logging.DEBUG):
+                            for i, carrier_text in enumerate(names, 1):
+                                logging.debug("   Available carrier %d: %s", i, carrier_text)
+                    except Exception as debug_err:
+                        logging.debug("   Debug failed: %s", str(debug_err)[:60])
             else:
-                logging.info(f"Ã¢Å“â€¦ Checked {checked_count} carriers")
+                logging.info("Ã¢Å“â€¦ Checked %s carriers", checked_count)
             
             time.sleep(0.75)
             
         except Exception as e:
-            logging.error(f"Ã¢ÂÅ’ Error filtering carriers: {str(e)}")
+            logging.error("Ã¢ÂÅ’ Error filtering carriers: %s", str(e))
         
+    def _card_is_zero(self, button: WebElement) -> bool:
+        """True if the plan card holding this button shows a $0 premium (ignores struck-out prices)."""
+        try:
+            card = button.find_element(By.XPATH, "./ancestor::*[.//var[@data-var='dollars']][1]")
+            dollars = card.find_elements(By.CSS_SELECTOR, "var[data-var='dollars']:not(s *, del *)")
+            return len(dollars) > 0 and dollars[0].text.strip().lstrip("$") in ("0", "0.00")
+        except WebDriverException:
+            return False
+
     def select_top_zero_premium_plan(self) -> bool:
         """Select first $0.00 plan from filtered results."""
         try:
             logging.info("Ã°Å¸â€Â Looking for top $0.00 premium plan...")
             
-            time.sleep(0.75)  # +0.2s buffer
+            # Wait for either cart button to render instead of a fixed buffer
+            if self._detect_cart_mode() is None:
+                logging.debug("No cart button rendered within %ss", FAST_TIMEOUT)
             
             button_selectors = [
                 (By.XPATH, "//button[contains(text(), 'Add to cart')]", "Add to cart"),
@@ -4070,7 +4023,11 @@ class HealthInsuranceRenewalBot:
                 try:
                     buttons = self.driver.find_elements(by, selector)
                     if buttons:
-                        first_button = buttons[0]
+                        # Stop at the first card confirmed $0; fall back to the top card
+                        first_button = next(
+                            (btn for btn in buttons[:10] if self._card_is_zero(btn)),
+                            buttons[0]
+                        )
                         self.driver.execute_script(
                             "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
                             first_button
@@ -4078,9 +4035,9 @@ class HealthInsuranceRenewalBot:
                         time.sleep(4)  # +0.2s buffer
                         try:
                             first_button.click()
-                        except Exception:
+                        except CLICK_FALLBACK_ERRORS:
                             self.driver.execute_script("arguments[0].click();", first_button)
-                        logging.info(f"Ã¢Å“â€¦ Clicked '{button_text}' on top plan")
+                        logging.info("Ã¢Å“â€¦ Clicked '%s' on top plan", button_text)
                         time.sleep(0.75)  # +0.2s buffer
                         return True
                 except Exception:
@@ -4090,7 +4047,7 @@ class HealthInsuranceRenewalBot:
             return False
             
         except Exception as e:
-            logging.error(f"Ã¢ÂÅ’ Error selecting plan: {str(e)}")
+            logging.error("Ã¢ÂÅ’ Error selecting plan: %s", str(e))
             return False
 
     def handle_view_cart_flow(self) -> bool:
@@ -4105,26 +4062,18 @@ class HealthInsuranceRenewalBot:
             
             # Continue with existing code...
             keep_selectors = [
-                (By.XPATH, "//button[normalize-space()='Keep these plans']"),
+                (By.XPATH, "//button[normalize-space()='Keep these plans']", "xpath text"),
                 (By.XPATH, "//button[contains(., 'Keep these plans')]", "xpath contains"),
                 (By.CSS_SELECTOR, "button.MuiButton-contained.MuiButton-containedPrimary", "css MUI"),
             ]
-            
+
             for by, selector, label in keep_selectors:
                 try:
-                    keep_btn = WebDriverWait(self.driver, 4).until(
+                    keep_btn = self._wait(4).until(
                         EC.element_to_be_clickable((by, selector))
                     )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-                        keep_btn
-                    )
-                    time.sleep(0.5)  # +0.2s buffer
-                    try:
-                        keep_btn.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", keep_btn)
-                    logging.info(f"Ã¢Å“â€¦ Clicked 'Keep these plans' ({label})")
+                    self._click_smart(keep_btn)
+                    logging.info("Ã¢Å“â€¦ Clicked 'Keep these plans' (%s)", label)
                     time.sleep(0.75)  # +0.2s buffer
                     break
                 except TimeoutException:
@@ -4134,7 +4083,7 @@ class HealthInsuranceRenewalBot:
             return self.click_enroll_in_this_plan()
             
         except Exception as e:
-            logging.error(f"Ã¢ÂÅ’ Error in View cart flow: {str(e)}")
+            logging.error("Ã¢ÂÅ’ Error in View cart flow: %s", str(e))
             return False
 
     def handle_add_to_cart_flow(self) -> bool:
@@ -4159,28 +4108,12 @@ class HealthInsuranceRenewalBot:
             logging.info("ðŸ” Looking for enrollment button...")
             time.sleep(0.75)
             
-            enroll_selectors = [
-                (By.XPATH, "//button[normalize-space()='Enroll in this plan']"),
-                (By.XPATH, "//button[contains(text(), 'Enroll in this plan')]"),
-                (By.ID, "page-nav-on-next-btn"),
-                (By.XPATH, "//button[@id='page-nav-on-next-btn']"),
-            ]
-            
-            for by, selector in enroll_selectors:
+            # Enroll button first; the wizard's Continue is the fallback on this page
+            for locator in ((By.XPATH, self.ENROLL_PLAN_XPATH), NEXT_BUTTON_LOCATOR):
                 try:
-                    enroll_btn = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                        enroll_btn
-                    )
-                    time.sleep(0.5)
-                    try:
-                        enroll_btn.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", enroll_btn)
-                    
+                    enroll_btn = self._wait(5).until(EC.element_to_be_clickable(locator))
+                    self._click_smart(enroll_btn)
+
                     logging.info("âœ… Clicked 'Enroll in this plan'")
                     time.sleep(0.75)
                     return True
@@ -4191,66 +4124,146 @@ class HealthInsuranceRenewalBot:
             return False
             
         except Exception as e:
-            logging.error(f"âŒ Error in Add to cart flow: {str(e)}")
+            logging.error("âŒ Error in Add to cart flow: %s", str(e))
             return False
 
 
+    def _record_client(self, client: ClientData):
+        """Append a finished client to the in-memory results and audit log."""
+        entry = client.to_dict()
+        with self._results_lock:
+            self.clients.append(client)
+            self.audit_log.append(entry)
+            self._status_counts[client.status] += 1
+            self._audit_fp.write(json_line(entry))
+            self._audit_pending += 1
+            if self._audit_pending >= AUDIT_FLUSH_EVERY:
+                self._audit_fp.flush()
+                self._audit_pending = 0
+
     def _generate_report(self):
         """Generate final statistics."""
-        completed = sum(1 for c in self.clients if c.status == ClientStatus.COMPLETED)
-        skipped_followups = sum(1 for c in self.clients if c.status == ClientStatus.SKIPPED_FOLLOWUPS)
-        skipped_by_user = sum(1 for c in self.clients if c.status == ClientStatus.SKIPPED_BY_USER)  # NEW
-        errors = sum(1 for c in self.clients if c.status == ClientStatus.ERROR)
+        with self._results_lock:
+            counts = self._status_counts.copy()
+            total_clients = len(self.clients)
+        completed = counts[ClientStatus.COMPLETED]
+        skipped_followups = counts[ClientStatus.SKIPPED_FOLLOWUPS]
+        skipped_by_user = counts[ClientStatus.SKIPPED_BY_USER]  # NEW
+        errors = counts[ClientStatus.ERROR]
         
-        total_time = time.time() - self.state.start_time
+        total_time = time.monotonic() - self.state.start_time
         avg_time_per_client = total_time / max(self.state.clients_processed, 1)
-        success_rate = (completed / len(self.clients) * 100) if self.clients else 0
+        success_rate = (completed / total_clients * 100) if total_clients else 0
         
         logging.info("\n" + "=" * 60)
         logging.info("Ã°Å¸â€œÅ  FINAL REPORT")
         logging.info("=" * 60)
-        logging.info(f"Ã¢Å“â€¦ Completed: {completed}")
-        logging.info(f"Ã¢Å¡Â Ã¯Â¸Â Skipped (Followups): {skipped_followups}")
-        logging.info(f"Ã¢ÂÂ­Ã¯Â¸Â Skipped (User): {skipped_by_user}")  # NEW
-        logging.info(f"Ã¢ÂÅ’ Errors: {errors}")
-        logging.info(f"Ã¢ÂÂ±Ã¯Â¸Â Total time: {total_time:.1f}s")
-        logging.info(f"Ã°Å¸â€œË† Success rate: {success_rate:.1f}%")
-        logging.info(f"Ã¢Å¡Â¡ Avg per client: {avg_time_per_client:.1f}s")
+        logging.info("Ã¢Å“â€¦ Completed: %s", completed)
+        logging.info("Ã¢Å¡Â Ã¯Â¸Â Skipped (Followups): %s", skipped_followups)
+        logging.info("Ã¢ÂÂ­Ã¯Â¸Â Skipped (User): %s", skipped_by_user)  # NEW
+        logging.info("Ã¢ÂÅ’ Errors: %s", errors)
+        logging.info("Ã¢ÂÂ±Ã¯Â¸Â Total time: %.1fs", total_time)
+        logging.info("Ã°Å¸â€œË† Success rate: %.1f%%", success_rate)
+        logging.info("Ã¢Å¡Â¡ Avg per client: %.1fs", avg_time_per_client)
         logging.info("=" * 60)
         
         if avg_time_per_client > 120:
-            logging.warning(f"Ã¢Å¡Â Ã¯Â¸Â SLOW: {avg_time_per_client:.1f}s/client exceeds 120s threshold")
+            logging.warning("Ã¢Å¡Â Ã¯Â¸Â SLOW: %.1fs/client exceeds 120s threshold", avg_time_per_client)
         if success_rate < 50:
-            logging.error(f"Ã¢ÂÅ’ LOW SUCCESS: {success_rate:.1f}% below 50% threshold")
+            logging.error("Ã¢ÂÅ’ LOW SUCCESS: %.1f%% below 50%% threshold", success_rate)
             
     def _save_logs(self):
-        """Persist audit log to JSON file."""
+        """Persist audit log to JSON file and sync the JSONL trail to disk."""
         try:
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                json.dump(self.audit_log, f, indent=2, ensure_ascii=False)
-            logging.info(f"Ã°Å¸â€™Â¾ Logs saved to {self.log_file}")
+            with self._results_lock:
+                entries = list(self.audit_log)
+                if not self._audit_fp.closed:
+                    self._audit_fp.flush()
+                    os.fsync(self._audit_fp.fileno())
+                    if self._owns_audit_fp:
+                        self._audit_fp.close()
+            self.log_file.write_bytes(json_pretty(entries))
+            logging.info("Ã°Å¸â€™Â¾ Logs saved to %s", self.log_file)
         except Exception as e:
-            logging.error(f"Failed to save logs: {e}")
+            logging.error("Failed to save logs: %s", e)
 
 
 # ========================================
 # MODULE-LEVEL FUNCTIONS
 # ========================================
 
+def _read_control_key(stop_event: Event, selector: Optional[selectors.BaseSelector]) -> Optional[str]:
+    """Wait up to 50ms for a console command; returns it lower-cased, or None."""
+    if selector is None:  # Windows console
+        if msvcrt.kbhit():
+            return msvcrt.getwch().lower()
+        stop_event.wait(0.05)
+        return None
+    # POSIX: the terminal is line-buffered, so a command arrives once Enter is pressed
+    if not selector.select(timeout=0.05):
+        return None
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip().lower()
+
+
+def _gzip_file(source: str, dest: str):
+    """Compress `source` into `dest` (fast level) and remove `source`."""
+    with open(source, "rb") as src, gzip.open(dest, "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+    os.remove(source)
+
+
+def _archive_audit_snapshot(path: Path) -> Path:
+    """Gzip this run's audit JSON to a timestamped .json.gz so runs don't overwrite each other.
+
+    Returns where the audit now lives: the archive, or `path` itself if it wasn't archived.
+    """
+    if not path.exists():
+        return path
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    archive = path.with_name(f"{path.stem}_{ts}{path.suffix}.gz")
+    try:
+        _gzip_file(str(path), str(archive))
+        print(f"🗜️ Audit archived: {archive}")
+    except OSError as e:
+        print(f"⚠️ Could not archive audit log: {e}")
+        return path
+    return archive
+
+
+def _stop_on_sigint(state: AutomationState):
+    """First Ctrl-C requests a cooperative stop (current step finishes); a second one interrupts."""
+    def handler(signum, frame):
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        state.stop()
+
+    signal.signal(signal.SIGINT, handler)
+
+
 def control_interface(bot: HealthInsuranceRenewalBot):
     """Background thread for keyboard control (P/R/S/N commands)."""
-    logging.info("\n" + "=" * 60)
-    logging.info("Ã°Å¸Å½Â® CONTROLS")
-    logging.info("=" * 60)
-    logging.info("  [P] Pause")
-    logging.info("  [R] Resume")
-    logging.info("  [S] Emergency Stop")
-    logging.info("  [N] Skip to Next Client")
-    logging.info("=" * 60 + "\n")
-    
-    while not bot.state.check_stopped():
+    logging.info(CONTROLS_HELP)
+
+    selector = None
+    if msvcrt is None:
+        selector = selectors.DefaultSelector()
         try:
-            cmd = input().strip().lower()
+            selector.register(sys.stdin, selectors.EVENT_READ)
+        except (OSError, ValueError) as e:  # stdin redirected from a file / closed
+            logging.warning("Keyboard controls unavailable: %s", e)
+            selector.close()
+            return
+
+    # Each read waits at most 50ms, so a stop from anywhere ends the thread promptly
+    try:
+        while not bot.state.check_stopped():
+            try:
+                cmd = _read_control_key(bot.state.stop_event, selector)
+            except (EOFError, KeyboardInterrupt):
+                bot.state.stop()
+                break
             if cmd == "p":
                 bot.state.pause()
             elif cmd == "r":
@@ -4260,17 +4273,15 @@ def control_interface(bot: HealthInsuranceRenewalBot):
                 break
             elif cmd == "n":
                 bot.state.skip_current()
-        except (EOFError, KeyboardInterrupt):
-            bot.state.stop()
-            break
+    finally:
+        if selector is not None:
+            selector.close()
 
 
 def main():
     """Entry point with profile + carrier + file selection."""
     
-    print("\n" + "=" * 60)
-    print("🚀 HEALTH INSURANCE RENEWAL BOT v4.0 PROFILE EDITION")
-    print("=" * 60 + "\n")
+    print(STARTUP_BANNER)
     
     # PHASE 1: Profile + Carrier Selection
     profile_manager = ProfileManager()
@@ -4297,26 +4308,25 @@ def main():
         print(f"❌ File not found: {lists_compiled_path}")
         sys.exit(1)
     
+    # One long-lived buffered handle for the per-client JSONL audit trail
+    audit_fp = open(Path(AUDIT_LOG_FILE).with_suffix(".jsonl"), "ab", buffering=1 << 16)
     try:
         bot = HealthInsuranceRenewalBot(
             lists_compiled_path=lists_compiled_path,
             log_file=AUDIT_LOG_FILE,
-            approved_carriers=selected_carriers
+            approved_carriers=selected_carriers,
+            audit_fp=audit_fp,
         )
     except FileNotFoundError as e:
+        audit_fp.close()
         print(f"❌ {e}")
         sys.exit(1)
 
+    _stop_on_sigint(bot.state)
     ctrl = Thread(target=control_interface, args=(bot,), daemon=True)
     ctrl.start()
 
-    print("\n" + "=" * 60)
-    print(f"🎯 RUNNING AS: {profile_name}")
-    print("=" * 60)
-    print(f"📋 Client list: {bot.lists_compiled_path}")
-    print(f"📝 Log: {LOG_FILE}")
-    print(f"🔌 Chrome: {CHROME_DEBUGGER_ADDRESS}")
-    print("=" * 60 + "\n")
+    print(RUNNING_BANNER.format(profile=profile_name, lists_path=bot.lists_compiled_path))
 
     try:
         bot.run()
@@ -4324,15 +4334,12 @@ def main():
         logging.info("Interrupted by user")
         bot.state.stop()
     except Exception as e:
-        logging.critical(f"Fatal error: {e}", exc_info=True)
+        logging.critical("Fatal error: %s", e, exc_info=True)
     finally:
-        print("\n" + "=" * 60)
-        print("✅ BOT SHUTDOWN COMPLETE")
-        print("=" * 60)
-        print(f"Logs: {LOG_FILE}")
-        print(f"Audit: {AUDIT_LOG_FILE}")
-        print(f"Config: {PROFILE_CONFIG_FILE}")
-        print("=" * 60 + "\n")
+        audit_fp.close()  # run() has already flushed and fsynced it
+        bot.log_listener.stop()  # drains queued records before exit
+        audit_path = _archive_audit_snapshot(bot.log_file)
+        print(SHUTDOWN_BANNER.format(audit_path=audit_path))
 
 
 if __name__ == "__main__":